@@ -0,0 +1,113 @@
+"""
+Size and throughput of the bit-packed round history format.
+
+Stores the same seeded rounds as a naive JSON-lines dump (one object per
+round) and as a PackedHistoryWriter file, then reports bytes per round and
+encode/decode throughput for each.
+
+Run from the repository root:
+    python -m benchmarks.bench_history_storage [rounds]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.recording.packed_history import PackedHistoryReader, PackedHistoryWriter
+
+DEFAULT_ROUNDS = 1_000_000
+
+# Fraction of rounds in which the second player times out
+TIMEOUT_RATE = 0.01
+
+
+def generate_rounds(rounds: int, seed: int = 0) -> list:
+    """Return seeded random (move 1, move 2, result) rounds with occasional timeouts."""
+    rng = random.Random(seed)
+    rules = RPSRules()
+    moves = RPSMove.get_all_moves()
+    history = []
+    for _ in range(rounds):
+        move_1 = rng.choice(moves)
+        if rng.random() < TIMEOUT_RATE:
+            history.append((move_1, None, 1))
+        else:
+            move_2 = rng.choice(moves)
+            history.append((move_1, move_2, rules.determine_result(move_1, move_2)))
+    return history
+
+
+def _write_json_lines(path: str, history: list) -> None:
+    with open(path, "w") as history_file:
+        for move_1, move_2, result in history:
+            history_file.write(json.dumps({
+                "move_1": move_1.get_name() if move_1 else None,
+                "move_2": move_2.get_name() if move_2 else None,
+                "result": result
+            }) + "\n")
+
+
+def _read_json_lines(path: str) -> list:
+    with open(path) as history_file:
+        return [(RPSMove.get_move_by_name(record["move_1"]) if record["move_1"] else None,
+                 RPSMove.get_move_by_name(record["move_2"]) if record["move_2"] else None,
+                 record["result"])
+                for record in map(json.loads, history_file)]
+
+
+def _write_packed(path: str, history: list) -> None:
+    with PackedHistoryWriter(path) as writer:
+        writer.extend(history)
+
+
+def _read_packed(path: str) -> list:
+    with PackedHistoryReader(path) as reader:
+        return reader.read()
+
+
+FORMATS = {
+    "JSON lines": (_write_json_lines, _read_json_lines),
+    "Bit-packed blocks": (_write_packed, _read_packed),
+}
+
+
+def run(rounds: int = DEFAULT_ROUNDS) -> dict[str, dict[str, float]]:
+    """Return bytes per round and encode/decode rounds per second for each format."""
+    history = generate_rounds(rounds)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (write, read) in FORMATS.items():
+            path = os.path.join(directory, name.replace(" ", "_"))
+            start = time.perf_counter()
+            write(path, history)
+            encode_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            decoded = read(path)
+            decode_seconds = time.perf_counter() - start
+            if decoded != history:
+                raise AssertionError(f"{name} did not round-trip")
+
+            results[name] = {
+                "bytes_per_round": os.path.getsize(path) / rounds,
+                "encode_rounds_per_second": rounds / encode_seconds,
+                "decode_rounds_per_second": rounds / decode_seconds,
+            }
+    return results
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS
+    results = run(rounds)
+    baseline = results["JSON lines"]["bytes_per_round"]
+    print(f"{'Format':<20}{'B/round':>10}{'Ratio':>8}{'Encode r/s':>14}{'Decode r/s':>14}")
+    for name, result in results.items():
+        print(f"{name:<20}{result['bytes_per_round']:>10.3f}"
+              f"{baseline / result['bytes_per_round']:>8.1f}"
+              f"{result['encode_rounds_per_second']:>14,.0f}"
+              f"{result['decode_rounds_per_second']:>14,.0f}")
@@ -0,0 +1,41 @@
+"""
+Per-move cost of random move generation for computer players.
+
+Compares the original RPSMove.get_random_move (random.choice over a new
+list on every call) with block-generated RandomMoveSource streams.
+
+Run from the repository root:
+    python -m benchmarks.bench_move_source [moves]
+"""
+
+import importlib.util
+import sys
+import timeit
+
+from src.games.rps.rps_move import RPSMove
+from src.players.random_move_source import RandomMoveSource
+
+DEFAULT_MOVES = 1_000_000
+
+
+def run(moves: int = DEFAULT_MOVES) -> dict[str, float]:
+    """Return the nanoseconds per move for each move generation path."""
+    sources = {
+        "RPSMove.get_random_move": RPSMove.get_random_move,
+        "RandomMoveSource (random.Random)": RandomMoveSource(RPSMove.get_all_moves(), seed=0).next_move,
+    }
+    if importlib.util.find_spec("numpy") is not None:
+        sources["RandomMoveSource (numpy)"] = RandomMoveSource(
+            RPSMove.get_all_moves(), seed=0, use_numpy=True
+        ).next_move
+    return {name: timeit.timeit(next_move, number=moves) / moves * 1e9
+            for name, next_move in sources.items()}
+
+
+if __name__ == "__main__":
+    moves = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MOVES
+    results = run(moves)
+    baseline = results["RPSMove.get_random_move"]
+    print(f"{'Move source':<36}{'ns/move':>10}{'Speed-up':>10}")
+    for name, nanoseconds in results.items():
+        print(f"{name:<36}{nanoseconds:>10.1f}{baseline / nanoseconds:>10.2f}")
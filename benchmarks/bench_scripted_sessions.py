@@ -0,0 +1,76 @@
+"""
+Load test of the full interactive game loop with scripted input.
+
+Plays complete RPSGame games - mode and name prompts, several replayed
+sessions, moves - through InputProviderScripted, so every answer goes
+through the real validation paths. The scripts include invalid answers and
+timed-out moves at fixed rates; output is buffered and discarded.
+
+Run from the repository root:
+    python -m benchmarks.bench_scripted_sessions [games]
+"""
+
+import io
+import random
+import sys
+import time
+from typing import Iterator
+
+from src.games.rps.rps_game import RPSGame
+from src.io_utils.input_provider_scripted import InputProviderScripted
+from src.io_utils.output_provider_buffered import FlushPolicy, OutputProviderBuffered
+from src.constants import GameConstants, ScriptedInputConstants
+
+DEFAULT_GAMES = 1_000
+SESSIONS_PER_GAME = 3
+MAX_ROUNDS_PER_SESSION = 5
+INVALID_MOVE_RATE = 0.1
+TIMEOUT_RATE = 0.05
+
+
+class _DiscardingStream(io.TextIOBase):
+    """Text stream that drops everything written."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def game_script(rng: random.Random, game_number: int) -> Iterator[str]:
+    """Yield the answers for one game of SESSIONS_PER_GAME sessions, including invalid ones."""
+    yield "0"                                  # invalid game mode
+    yield "1"
+    yield ""                                   # invalid name
+    yield f"Load {game_number}"
+    for session in range(SESSIONS_PER_GAME):
+        yield str(GameConstants.MIN_ROUNDS - 1)  # invalid number of rounds
+        rounds = rng.randint(GameConstants.MIN_ROUNDS, MAX_ROUNDS_PER_SESSION)
+        yield str(rounds)
+        for _ in range(rounds):
+            if rng.random() < INVALID_MOVE_RATE:
+                yield "9"
+            if rng.random() < TIMEOUT_RATE:
+                yield ScriptedInputConstants.TIMEOUT_TOKEN
+            else:
+                yield str(rng.randint(1, 3))
+        yield "y" if session < SESSIONS_PER_GAME - 1 else "n"
+
+
+def run(games: int = DEFAULT_GAMES) -> dict[str, float]:
+    """Play the games and return sessions and prompts answered per second."""
+    rng = random.Random(0)
+    random.seed(0)
+    output_provider = OutputProviderBuffered(FlushPolicy.ON_INPUT, stream=_DiscardingStream())
+    answers = 0
+    start = time.perf_counter()
+    for game_number in range(games):
+        input_provider = InputProviderScripted(game_script(rng, game_number))
+        RPSGame(input_provider, output_provider).start_game()
+        answers += input_provider.answers_used
+    elapsed = time.perf_counter() - start
+    return {"sessions/sec": games * SESSIONS_PER_GAME / elapsed, "answers/sec": answers / elapsed}
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_GAMES
+    for name, value in run(games).items():
+        print(f"{name:<14}{value:>14,.0f}")
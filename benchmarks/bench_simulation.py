@@ -0,0 +1,32 @@
+"""
+Throughput benchmark for the headless simulator.
+
+Run from the repository root:
+    python -m benchmarks.bench_simulation [rounds]
+"""
+
+import random
+import sys
+import time
+from unittest.mock import Mock
+
+from src.core.headless_simulator import HeadlessSimulator
+from src.games.rps.rps_rules import RPSRules
+from src.players.computer_player import ComputerPlayer
+
+DEFAULT_ROUNDS = 1_000_000
+
+
+def run(rounds: int = DEFAULT_ROUNDS) -> float:
+    """Simulate the given number of rounds and return the rounds per second achieved."""
+    game = Mock()
+    simulator = HeadlessSimulator(RPSRules())
+    random.seed(0)
+    start = time.perf_counter()
+    simulator.simulate_rounds(rounds, ComputerPlayer(game, 1), ComputerPlayer(game, 2))
+    return rounds / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS
+    print(f"{run(rounds):,.0f} rounds/sec")
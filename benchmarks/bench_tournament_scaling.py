@@ -0,0 +1,45 @@
+"""
+Throughput scaling of the round-robin tournament runner.
+
+Runs the same tournament with 1, 2, 4, ... worker processes (up to the
+core count) and reports rounds per second and speed-up over one worker.
+
+Run from the repository root:
+    python -m benchmarks.bench_tournament_scaling [rounds_per_match]
+"""
+
+import os
+import sys
+
+from src.core.tournament_runner import TournamentRunner
+from src.players.computer_player import ComputerPlayer
+
+STRATEGY_COUNT = 8
+DEFAULT_ROUNDS_PER_MATCH = 20_000
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def run(rounds_per_match: int = DEFAULT_ROUNDS_PER_MATCH) -> list[tuple[int, float]]:
+    """Return (workers, rounds per second) for each worker count."""
+    strategies = {f"random_{index}": ComputerPlayer for index in range(STRATEGY_COUNT)}
+    runner = TournamentRunner(strategies, rounds_per_match=rounds_per_match)
+    return [(workers, runner.run(workers).rounds_per_second)
+            for workers in worker_counts(os.cpu_count() or 1)]
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS_PER_MATCH
+    results = run(rounds)
+    baseline = results[0][1]
+    print(f"{'Workers':<10}{'Rounds/sec':>15}{'Speed-up':>10}")
+    for workers, rate in results:
+        print(f"{workers:<10}{rate:>15,.0f}{rate / baseline:>10.2f}")
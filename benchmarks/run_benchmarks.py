@@ -0,0 +1,262 @@
+"""
+Regression benchmark suite for the core game engine.
+
+Times the hot paths of a round - rule evaluation, move lookups, score
+updates, RoundExecutor and whole GameFlowManager sessions (with output kept
+in memory) - as nanoseconds per operation. Results can be saved as a JSON
+baseline; later runs compare against it and exit with status 1 if any
+benchmark is slower than the baseline by more than the threshold.
+
+Run from the repository root:
+    python -m benchmarks.run_benchmarks --save          # record a baseline
+    python -m benchmarks.run_benchmarks                 # compare against it
+    python -m benchmarks.run_benchmarks --threshold 0.1 --filter score
+
+A reference baseline is committed in benchmarks/baselines/engine.json.
+Baselines are machine specific, so record a new one with --save on the
+machine that runs the comparison.
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Tuple
+
+from src.core.game_flow_manager import GameFlowManager
+from src.core.round_executor import RoundExecutor
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+from src.io_utils.output_provider_buffered import FlushPolicy, OutputProviderBuffered
+from src.players.computer_player import ComputerPlayer
+from src.constants import GameConstants
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "engine.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+
+# Operations per timed batch for the micro benchmarks, rounds per batch for
+# RoundExecutor, and sessions (of SESSION_ROUNDS rounds) per batch for GameFlowManager
+OPERATIONS = 100_000
+EXECUTOR_ROUNDS = 10_000
+SESSION_ROUNDS = GameConstants.MAX_ROUNDS
+SESSIONS = 100
+
+
+class _DiscardingStream(io.TextIOBase):
+    """Text stream that drops everything written, so output stays in memory."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def _in_memory_game():
+    """Return a stand-in game whose output is buffered and then discarded."""
+    return SimpleNamespace(output_provider=OutputProviderBuffered(
+        FlushPolicy.EVERY_N_ROUNDS, flush_every=100, stream=_DiscardingStream()
+    ))
+
+
+def _move_pairs(count: int) -> list:
+    """Return count ordered pairs of moves, cycling through every combination."""
+    moves = RPSMove.get_all_moves()
+    return list(itertools.islice(itertools.cycle(itertools.product(moves, moves)), count))
+
+
+def _bench_determine_result():
+    determine_result, pairs = RPSRules().determine_result, _move_pairs(OPERATIONS)
+
+    def batch():
+        for move_1, move_2 in pairs:
+            determine_result(move_1, move_2)
+    return batch
+
+
+def _bench_interaction_description():
+    describe, pairs = RPSRules().get_interaction_description, _move_pairs(OPERATIONS)
+
+    def batch():
+        for move_1, move_2 in pairs:
+            describe(move_1, move_2)
+    return batch
+
+
+def _bench_move_by_value():
+    values = [move_1.get_value() for move_1, _ in _move_pairs(OPERATIONS)]
+
+    def batch():
+        for value in values:
+            RPSMove.get_move_by_value(value)
+    return batch
+
+
+def _bench_move_by_name():
+    names = [move_1.get_name() for move_1, _ in _move_pairs(OPERATIONS)]
+
+    def batch():
+        for name in names:
+            RPSMove.get_move_by_name(name)
+    return batch
+
+
+def _bench_score_update(manager_type: str):
+    results = list(itertools.islice(itertools.cycle((1, 1, 0, -1, 1, -1, -1, 0)), OPERATIONS))
+
+    def setup():
+        def batch():
+            score_manager = ScoreManagerFactory.create_score_manager(
+                manager_type, None, "Player 1", "Player 2"
+            )
+            update_scores = score_manager.update_scores_for_round
+            for result in results:
+                update_scores(result)
+        return batch
+    return setup
+
+
+def _bench_execute_round():
+    game = _in_memory_game()
+    executor = RoundExecutor(RPSRules(), game.output_provider)
+    player_1, player_2 = ComputerPlayer(game, 1, seed=1), ComputerPlayer(game, 2, seed=2)
+    score_manager = ScoreManagerFactory.create_score_manager(
+        GameConstants.SCORE_MANAGER_STANDARD, game, player_1.get_name(), player_2.get_name()
+    )
+
+    def batch():
+        for _ in range(EXECUTOR_ROUNDS):
+            executor.execute_round(player_1, player_2, score_manager, 1, 1)
+    return batch
+
+
+def _bench_flow_session():
+    game = _in_memory_game()
+    flow = GameFlowManager(RPSRules(), game.output_provider)
+    player_1, player_2 = ComputerPlayer(game, 1, seed=1), ComputerPlayer(game, 2, seed=2)
+
+    def batch():
+        for _ in range(SESSIONS):
+            score_manager = ScoreManagerFactory.create_score_manager(
+                GameConstants.SCORE_MANAGER_STANDARD, game, player_1.get_name(), player_2.get_name()
+            )
+            flow.play_standard_rounds(SESSION_ROUNDS, player_1, player_2, score_manager)
+    return batch
+
+
+# Benchmark name -> (setup returning a function that runs one timed batch, operations per batch)
+BENCHMARKS: Dict[str, Tuple[Callable[[], Callable[[], None]], int]] = {
+    "rules.determine_result": (_bench_determine_result, OPERATIONS),
+    "rules.get_interaction_description": (_bench_interaction_description, OPERATIONS),
+    "move.get_move_by_value": (_bench_move_by_value, OPERATIONS),
+    "move.get_move_by_name": (_bench_move_by_name, OPERATIONS),
+    "score.standard.update": (_bench_score_update(GameConstants.SCORE_MANAGER_STANDARD), OPERATIONS),
+    "score.streak.update": (_bench_score_update(GameConstants.SCORE_MANAGER_STREAK), OPERATIONS),
+    "score.compact_standard.update": (_bench_score_update(GameConstants.SCORE_MANAGER_COMPACT_STANDARD),
+                                      OPERATIONS),
+    "score.compact_streak.update": (_bench_score_update(GameConstants.SCORE_MANAGER_COMPACT_STREAK),
+                                    OPERATIONS),
+    "round_executor.execute_round": (_bench_execute_round, EXECUTOR_ROUNDS),
+    "game_flow.standard_session_round": (_bench_flow_session, SESSIONS * SESSION_ROUNDS),
+}
+
+
+def run(name_filter: str = "", repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    """
+    Run the benchmarks.
+
+    Args:
+        name_filter: Only run benchmarks whose name contains this text
+        repeat: Timed repeats per benchmark; the fastest is reported
+
+    Returns:
+        Mapping of benchmark name to nanoseconds per operation (per round for the
+        RoundExecutor and GameFlowManager benchmarks)
+    """
+    results = {}
+    for name, (setup, operations) in BENCHMARKS.items():
+        if name_filter not in name:
+            continue
+        best = min(timeit.repeat(setup(), number=1, repeat=repeat))
+        results[name] = best / operations * 1e9
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float]) -> Dict[str, Optional[float]]:
+    """
+    Compare results with a baseline.
+
+    Returns:
+        Mapping of benchmark name to its relative change (0.1 = 10% slower),
+        or None where the baseline has no entry
+    """
+    return {name: (value / baseline[name] - 1) if baseline.get(name) else None
+            for name, value in results.items()}
+
+
+def regressions(changes: Dict[str, Optional[float]], threshold: float) -> list:
+    """Return the names of benchmarks slower than the baseline by more than the threshold."""
+    return [name for name, change in changes.items() if change is not None and change > threshold]
+
+
+def load_baseline(path: str) -> Optional[Dict[str, float]]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, float]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as baseline_file:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "unit": "ns",
+            "results": results,
+        }, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Core engine benchmark suite")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before failing, as a fraction (default %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repeats per benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.repeat)
+    baseline = load_baseline(args.baseline)
+    changes = compare(results, baseline or {})
+
+    print(f"{'Benchmark':<36}{'ns/op':>10}{'Baseline':>10}{'Change':>9}")
+    for name, value in results.items():
+        change = changes[name]
+        baseline_text = f"{baseline[name]:>10.1f}" if change is not None else f"{'-':>10}"
+        change_text = f"{change:>+9.1%}" if change is not None else f"{'-':>9}"
+        print(f"{name:<36}{value:>10.1f}{baseline_text}{change_text}")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save to record one")
+        return 0
+
+    failed = regressions(changes, args.threshold)
+    if failed:
+        print(f"\nRegressed by more than {args.threshold:.0%}: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
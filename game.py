@@ -5,6 +5,16 @@ from src.io_utils.input_provider import InputProvider
 from src.io_utils.output_provider import OutputProvider
 
 
+class GameExit(Exception):
+    """
+    Raised by Game.exit_game to unwind out of a running game.
+
+    start_game catches it and returns normally, so ending a game never
+    terminates the hosting process.
+    """
+    pass
+
+
 class Game(ABC):
     """
     Abstract base class for games in the arcade system.
@@ -14,6 +24,8 @@ class Game(ABC):
     """
 
     EXIT_COMMAND = GameConstants.EXIT_COMMAND
+    # Optional GameMetrics; games that support metrics set it in their constructor
+    metrics = None
 
     def __init__(self, input_prov: InputProvider, output_prov: OutputProvider):
         super().__init__()
@@ -3,33 +3,42 @@ Refactored Rock-Paper-Scissors main game entry point.
 
 This file maintains the original interface while using the new
 refactored game implementation.
+
+Run with --profile-startup [PATH] to save a per-module import time report of
+the startup path instead of playing (see src/core/startup_profile.py).
 """
 
-from src.games.rps.rps_game import RPSGame
+import sys
+
+from src.constants import StartupConstants
 from src.games.rps.rps_constants import RPSConstants
 from src.io_utils.input_provider_console import InputProviderConsole
 from src.io_utils.output_provider_console import OutputProviderConsole
 from src.game_factory import GameFactory
 
 
-def main():
-    """Main entry point for the Rock-Paper-Scissors game."""
-    # Register the game with the factory
-    GameFactory.register_game(RPSConstants.GAME_TYPE, RPSGame)
-
+def create_game():
+    """Create the console game: everything the entry point does before the first prompt."""
     # Create input/output providers
-    input_provider = InputProviderConsole()
     output_provider = OutputProviderConsole()
+    input_provider = InputProviderConsole(output_provider)
 
-    # Create the game using the factory
-    rps_game = GameFactory.create_game(
+    # Create the game using the factory (which imports the game's modules on demand)
+    return GameFactory.create_game(
         RPSConstants.GAME_TYPE,
         input_provider,
         output_provider
     )
 
+
+def main():
+    """Main entry point for the Rock-Paper-Scissors game."""
+    if StartupConstants.PROFILE_FLAG in sys.argv[1:]:
+        from src.core.startup_profile import main as profile_startup
+        sys.exit(profile_startup(sys.argv[sys.argv.index(StartupConstants.PROFILE_FLAG) + 1:]))
+
     # Start the game
-    rps_game.start_game()
+    create_game().start_game()
 
 
 if __name__ == "__main__":
@@ -24,6 +24,8 @@ class GameConstants:
     # Score manager types
     SCORE_MANAGER_STANDARD: Final[str] = "standard"
     SCORE_MANAGER_STREAK: Final[str] = "streak"
+    SCORE_MANAGER_COMPACT_STANDARD: Final[str] = "compact_standard"
+    SCORE_MANAGER_COMPACT_STREAK: Final[str] = "compact_streak"
 
     # Game mode options
     BEST_OF_5_COMMAND: Final[str] = "bo5"
@@ -32,6 +34,32 @@ class GameConstants:
     EXIT_COMMAND: Final[str] = "e"
 
 
+class ServerConstants:
+    """Constants for the network game server."""
+
+    # Loopback by default; set the environment variable (e.g. to 0.0.0.0) to accept other hosts or containers
+    DEFAULT_HOST: Final[str] = "127.0.0.1"
+    HOST_ENV_VAR: Final[str] = "RPS_SERVER_HOST"
+    DEFAULT_PORT: Final[int] = 5050
+    STREAM_ENCODING: Final[str] = "utf-8"
+
+
+class PluginConstants:
+    """Constants for plugin discovery."""
+
+    # Entry point groups that packages use to provide games, rules and score managers
+    GAMES_GROUP: Final[str] = "rps_arcade.games"
+    RULES_GROUP: Final[str] = "rps_arcade.rules"
+    SCORE_MANAGERS_GROUP: Final[str] = "rps_arcade.score_managers"
+    GROUP_PREFIX: Final[str] = "rps_arcade."
+
+    # Cached manifest of discovered entry points; the environment variable overrides its location
+    MANIFEST_ENV_VAR: Final[str] = "RPS_ARCADE_PLUGIN_MANIFEST"
+    MANIFEST_DIR: Final[str] = "rps_arcade"
+    MANIFEST_FILE: Final[str] = "plugin_manifest.json"
+    MANIFEST_VERSION: Final[int] = 1
+
+
 class PlayerConstants:
     """Constants related to player configuration."""
 
@@ -45,6 +73,12 @@ class PlayerConstants:
     # Computer player name prefix
     COMPUTER_NAME_PREFIX: Final[str] = "Computer"
 
+    # Number of random moves a computer player generates at a time
+    RANDOM_MOVE_BLOCK_SIZE: Final[int] = 4096
+
+    # Number of previous opponent moves the predictive computer player conditions on
+    PREDICTOR_DEFAULT_ORDER: Final[int] = 2
+
 
 class ScoringConstants:
     """Constants related to scoring systems."""
@@ -66,6 +100,109 @@ class ScoringConstants:
     DRAW: Final[int] = 0
 
 
+class TournamentConstants:
+    """Constants for round-robin bot tournaments."""
+
+    DEFAULT_ROUNDS_PER_MATCH: Final[int] = 1000
+    DEFAULT_SEEDS_PER_PAIRING: Final[int] = 1
+
+    # Standings points per match result
+    MATCH_WIN_POINTS: Final[float] = 1.0
+    MATCH_DRAW_POINTS: Final[float] = 0.5
+
+
+class RecordingConstants:
+    """Constants for recorded match history files."""
+
+    # File header: magic bytes, then format version and record size (uint16 each)
+    MATCH_LOG_MAGIC: Final[bytes] = b"RPSL"
+    MATCH_LOG_VERSION: Final[int] = 1
+
+    # Move code recorded for a player who made no move (timed out)
+    NO_MOVE_CODE: Final[int] = 0xFF
+
+    # Records examined per slice when scanning a log
+    SCAN_CHUNK_RECORDS: Final[int] = 1 << 20
+
+    # Bit-packed round history: file magic, format version, rounds per compressed block
+    HISTORY_MAGIC: Final[bytes] = b"RPSH"
+    HISTORY_VERSION: Final[int] = 1
+    HISTORY_BLOCK_ROUNDS: Final[int] = 65536
+    HISTORY_COMPRESSION_LEVEL: Final[int] = 6
+
+    # Seekable index sidecar: file magic, format version, rounds between score snapshots, file suffix
+    INDEX_MAGIC: Final[bytes] = b"RPSI"
+    INDEX_VERSION: Final[int] = 1
+    INDEX_SNAPSHOT_INTERVAL: Final[int] = 1024
+    INDEX_FILE_SUFFIX: Final[str] = ".idx"
+
+
+class InstrumentationConstants:
+    """Constants for per-phase round timing."""
+
+    # Latency histograms: 2 ** SUB_BUCKET_BITS linear sub-buckets per power of two
+    # (about 3% relative precision), covering values up to 2 ** MAX_VALUE_BITS ns
+    HISTOGRAM_SUB_BUCKET_BITS: Final[int] = 6
+    HISTOGRAM_MAX_VALUE_BITS: Final[int] = 40
+
+    REPORT_PERCENTILES: Final[tuple] = (50.0, 95.0, 99.0)
+    REPORT_ROW_FORMAT: Final[str] = "{phase:<10}{count:>10}{p50:>12}{p95:>12}{p99:>12}{max:>12}"
+
+
+class MetricsConstants:
+    """Constants for the Prometheus metrics exporter."""
+
+    NAME_PREFIX: Final[str] = "rps_"
+    # Round result -> value of the "result" label
+    RESULT_LABELS: Final[dict] = {
+        ScoringConstants.PLAYER_1_WIN: "player_1",
+        ScoringConstants.PLAYER_2_WIN: "player_2",
+        ScoringConstants.DRAW: "draw",
+    }
+    # Histogram bucket upper bounds, in seconds (from computer-only rounds to players thinking)
+    DURATION_BUCKETS: Final[tuple] = (0.0001, 0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    # HTTP endpoint; loopback unless the environment variable names another interface
+    DEFAULT_HOST: Final[str] = "127.0.0.1"
+    HOST_ENV_VAR: Final[str] = "RPS_METRICS_HOST"
+    DEFAULT_PORT: Final[int] = 9464
+    PATH: Final[str] = "/metrics"
+    CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class EventConstants:
+    """Constants for the round event bus."""
+
+    # Events a subscriber can fall behind by before further events are dropped for it
+    DEFAULT_QUEUE_SIZE: Final[int] = 1024
+    # Seconds to wait for a subscriber to deliver its queued events when closing
+    CLOSE_TIMEOUT: Final[float] = 5.0
+
+
+class ScriptedInputConstants:
+    """Constants for scripted (unattended) input."""
+
+    # Answers buffered from the script at a time
+    READ_AHEAD: Final[int] = 256
+    # Scripted move answer that stands for letting the time limit run out
+    TIMEOUT_TOKEN: Final[str] = "<timeout>"
+
+
+class StartupConstants:
+    """Constants for startup import profiling."""
+
+    PROFILE_FLAG: Final[str] = "--profile-startup"
+    DEFAULT_REPORT_PATH: Final[str] = "startup_profile.json"
+    # Fresh interpreters profiled; each module's fastest import is kept to smooth out noise
+    DEFAULT_RUNS: Final[int] = 3
+    REPORT_TOP_MODULES: Final[int] = 15
+
+    # Self time allowed for the application's own modules on the way to the first prompt
+    APPLICATION_IMPORT_BUDGET_US: Final[int] = 40_000
+    # Set to run the wall-clock budget checks with the unit tests, on a machine quiet enough to time
+    PERF_TESTS_ENV_VAR: Final[str] = "RPS_PERF_TESTS"
+
+
 class DisplayConstants:
     """Constants related to display formatting."""
 
@@ -78,6 +215,7 @@ class DisplayConstants:
     # Column headers
     PLAYER_COLUMN_HEADER: Final[str] = "Player"
     SCORE_COLUMN_HEADER: Final[str] = "Score"
+    STANDINGS_ROW_FORMAT: Final[str] = "{rank:<6}{name:<20}{points:<10}{won:<6}{drawn:<6}{lost:<6}{round_wins:<12}"
 
     # Separator characters
     TABLE_SEPARATOR_CHAR: Final[str] = "-"
@@ -135,7 +273,23 @@ class GameMessages:
     NO_DESCRIPTION: Final[str] = "No description available for {move1} vs {move2}"
 
     # Error messages
+    MUST_BE_POSITIVE: Final[str] = "{name} must be at least 1"
+    EMPTY_SUBSCRIBER_QUEUE: Final[str] = "A subscription's queue must hold at least one event"
+    TOO_FEW_STRATEGIES: Final[str] = "A tournament needs at least two strategies, got {count}"
     UNSUPPORTED_GAME_TYPE: Final[str] = "Unsupported game type: {game_type}"
+    UNKNOWN_PLUGIN: Final[str] = "No plugin named {name} in {group}"
     UNSUPPORTED_SCORE_TYPE: Final[str] = "Unsupported score manager type: {manager_type}"
+    DUPLICATE_PLAYER_NAMES: Final[str] = "Player names must be unique, got {names}"
+    SNAPSHOTS_UNSUPPORTED: Final[str] = "{manager} does not support score state snapshots"
+    INVALID_SCORE_STATE: Final[str] = "Score state has {length} values, which does not fit {player_count} players"
     INVALID_GAME_MODE: Final[str] = "Invalid Game Mode created, all modes must be set-up for exactly {count} players"
-    NO_RULE_DEFINED: Final[str] = "No rule defined between {move1} and {move2}"
\ No newline at end of file
+    NO_RULE_DEFINED: Final[str] = "No rule defined between {move1} and {move2}"
+    INVALID_MOVE_ORDINAL: Final[str] = "Move ordinal {ordinal} is not between 0 and {max}"
+    CONFLICTING_RULE: Final[str] = "Conflicting rules: {move1} and {move2} are both defined to beat each other"
+    INVALID_HISTORY_FILE: Final[str] = "{path} is not a round history file (version {version})"
+    INVALID_HISTORY_ROUND: Final[str] = "Cannot pack round {round}: moves must be RPS moves or None and result -1, 0 or 1"
+    INVALID_MATCH_INDEX: Final[str] = "{path} is not a match log index (version {version})"
+    ROUND_NOT_RECORDED: Final[str] = "Round {round_number} of session {session_id} is not in the match log"
+    INVALID_SESSION_STATE: Final[str] = "Game session must be {expected} for this, but is {state}"
+    STARTUP_PROFILE_FAILED: Final[str] = "Startup profiling failed:\n{error}"
+    INVALID_MATCH_LOG: Final[str] = "{path} is not a match log (version {version}) or uses a different record format"
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Deadline tracking for player moves.
+
+Unlike signal.alarm, which allows a single pending whole-second alarm per
+process and only works on the main thread, this scheduler keeps any number
+of independent deadlines on a min-heap using the monotonic clock. It never
+interrupts anything: callers check or collect expired deadlines, which makes
+it safe to share between threads and coroutines.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+# Rebuild the heap once cancelled entries outnumber live ones by this margin
+_COMPACTION_SLACK = 64
+
+
+class DeadlineScheduler:
+    """
+    Tracks per-key deadlines (e.g. one per player) with nanosecond clock resolution.
+
+    Setting a deadline for a key replaces any previous deadline for that key.
+    Cancelled and replaced entries are removed from the heap lazily.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.monotonic_ns):
+        """
+        Args:
+            clock: Monotonic clock returning nanoseconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        # key -> (deadline_ns, sequence number of its live heap entry, callback)
+        self._deadlines: Dict[Hashable, Tuple[int, int, Optional[Callable[[Hashable], Any]]]] = {}
+        self._sequence = itertools.count()
+
+    def set_deadline(self, key: Hashable, seconds: float,
+                     on_expire: Optional[Callable[[Hashable], Any]] = None) -> int:
+        """
+        Set (or replace) the deadline for a key.
+
+        Args:
+            key: Identifies the deadline, e.g. a player
+            seconds: Time from now until the deadline, fractions allowed
+            on_expire: Optional callback run by pop_expired once the deadline passes
+
+        Returns:
+            The deadline on the scheduler's clock, in nanoseconds
+        """
+        deadline = self._clock() + int(seconds * NANOSECONDS_PER_SECOND)
+        with self._lock:
+            sequence = next(self._sequence)
+            self._deadlines[key] = (deadline, sequence, on_expire)
+            heapq.heappush(self._heap, (deadline, sequence, key))
+            self._compact_if_needed()
+        return deadline
+
+    def cancel(self, key: Hashable) -> None:
+        """Remove the deadline for a key, if any."""
+        with self._lock:
+            if self._deadlines.pop(key, None) is not None:
+                self._compact_if_needed()
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        """Return the seconds left before the key's deadline (negative once passed), or None if unset."""
+        entry = self._deadlines.get(key)
+        if entry is None:
+            return None
+        return (entry[0] - self._clock()) / NANOSECONDS_PER_SECOND
+
+    def is_expired(self, key: Hashable) -> bool:
+        """Return True if the key has a deadline and it has passed."""
+        entry = self._deadlines.get(key)
+        return entry is not None and self._clock() >= entry[0]
+
+    def next_expiry_in(self) -> Optional[float]:
+        """Return the seconds until the earliest live deadline, or None if there are none."""
+        with self._lock:
+            self._discard_stale_head()
+            if not self._heap:
+                return None
+            return (self._heap[0][0] - self._clock()) / NANOSECONDS_PER_SECOND
+
+    def pop_expired(self) -> List[Hashable]:
+        """
+        Remove all deadlines that have passed and run their callbacks.
+
+        Returns:
+            The expired keys, earliest deadline first
+        """
+        now = self._clock()
+        expired = []
+        with self._lock:
+            self._discard_stale_head()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, key = heapq.heappop(self._heap)
+                expired.append((key, self._deadlines.pop(key)[2]))
+                self._discard_stale_head()
+
+        # Callbacks run outside the lock so they may schedule new deadlines
+        for key, on_expire in expired:
+            if on_expire is not None:
+                on_expire(key)
+        return [key for key, _ in expired]
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def _is_live(self, entry: Tuple[int, int, Hashable]) -> bool:
+        live = self._deadlines.get(entry[2])
+        return live is not None and live[1] == entry[1]
+
+    def _discard_stale_head(self) -> None:
+        """Pop cancelled or replaced entries off the top of the heap (lock held)."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact_if_needed(self) -> None:
+        """Rebuild the heap when stale entries dominate it (lock held)."""
+        if len(self._heap) > 2 * len(self._deadlines) + _COMPACTION_SLACK:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
@@ -0,0 +1,308 @@
+"""
+In-process event bus for round events.
+
+The engine publishes events (src/core/events.py) as a game is played;
+subscribers such as loggers, recorders, dashboards and spectators consume
+them. Every subscriber has its own bounded queue, drained on its own thread
+(subscribe) or event loop task (subscribe_async), so publishing is just a
+non-blocking put per subscriber: a slow subscriber never delays the round
+loop or the other subscribers. A subscriber that falls a whole queue behind
+has further events dropped (and counted in its dropped attribute) until it
+catches up.
+
+Like metrics and instrumentation the bus is opt-in: components hold None
+when no bus is configured.
+"""
+
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from src.constants import EventConstants, GameMessages
+
+# Queued after a subscriber's last event to stop its consumer
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription(ABC):
+    """A subscriber's handler and its queue of undelivered events."""
+
+    def __init__(self, handler: Callable, event_types: Optional[Iterable[type]], maxsize: int):
+        """
+        Args:
+            handler: Called with each event
+            event_types: Event classes to receive, None for every event
+            maxsize: Undelivered events held before further events are dropped
+        """
+        if maxsize < 1:
+            raise ValueError(GameMessages.EMPTY_SUBSCRIBER_QUEUE)
+        self.handler = handler
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self.maxsize = maxsize
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def accepts(self, event_type: type) -> bool:
+        return self.event_types is None or event_type in self.event_types
+
+    @abstractmethod
+    def offer(self, event) -> None:
+        """Queue an event without waiting, dropping it if the queue is full."""
+        pass
+
+    @abstractmethod
+    def close(self, timeout: Optional[float] = EventConstants.CLOSE_TIMEOUT) -> None:
+        """Stop the subscriber once the events already queued have been delivered."""
+        pass
+
+    def _handler_failed(self, event) -> None:
+        # A failing subscriber must not stop its consumer, or it would miss every later event
+        self.failed += 1
+        logger.exception("Event subscriber %r failed on %s", self.handler, type(event).__name__)
+
+
+class ThreadSubscription(Subscription):
+    """Delivers events to a handler on a dedicated daemon thread."""
+
+    def __init__(self, handler: Callable, event_types: Optional[Iterable[type]], maxsize: int):
+        super().__init__(handler, event_types, maxsize)
+        # One spare slot, so the stop marker can always be queued behind a full queue
+        self._queue = queue.Queue(maxsize + 1)
+        self._thread = threading.Thread(target=self._consume, name=f"event-subscriber-{id(self):x}",
+                                        daemon=True)
+        self._thread.start()
+
+    def offer(self, event) -> None:
+        if self._queue.qsize() >= self.maxsize:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _consume(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is _STOP:
+                    return
+                try:
+                    self.handler(event)
+                    self.delivered += 1
+                except Exception:
+                    self._handler_failed(event)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been delivered.
+
+        Returns:
+            True if the queue was drained, False if the timeout passed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = EventConstants.CLOSE_TIMEOUT) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+
+class AsyncSubscription(Subscription):
+    """
+    Delivers events to a handler in a task on an event loop.
+
+    The handler may be a plain function or a coroutine function. Events
+    published from other threads are handed to the loop thread-safely.
+    """
+
+    def __init__(self, handler: Callable, event_types: Optional[Iterable[type]], maxsize: int):
+        super().__init__(handler, event_types, maxsize)
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        # One spare slot for the stop marker, as for thread subscriptions
+        self._queue = asyncio.Queue(maxsize + 1)
+        self._task = self._loop.create_task(self._consume())
+
+    def offer(self, event) -> None:
+        if threading.get_ident() == self._loop_thread:
+            self._put(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event) -> None:
+        if event is not _STOP and self._queue.qsize() >= self.maxsize:
+            self.dropped += 1
+            return
+        self._queue.put_nowait(event)
+
+    async def _consume(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                if event is _STOP:
+                    return
+                try:
+                    result = self.handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                    self.delivered += 1
+                except Exception:
+                    self._handler_failed(event)
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._queue.join()
+
+    def close(self, timeout: Optional[float] = EventConstants.CLOSE_TIMEOUT) -> None:
+        """Ask the task to stop after the queued events; await wait_closed() to wait for it."""
+        if not self._task.done():
+            self.offer(_STOP)
+
+    async def wait_closed(self) -> None:
+        await self._task
+
+
+class EventBus:
+    """
+    Publishes events to subscribers, each consuming from its own bounded queue.
+
+    Subscribing and unsubscribing replace the routing table as a whole, so
+    publish reads it without taking a lock.
+    """
+
+    def __init__(self):
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._routes: Dict[type, Tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler: Callable, event_types: Optional[Iterable[type]] = None,
+                  maxsize: int = EventConstants.DEFAULT_QUEUE_SIZE) -> ThreadSubscription:
+        """
+        Deliver events to a handler on its own thread.
+
+        Args:
+            handler: Called with each event
+            event_types: Event classes to receive, None for every event
+            maxsize: Events the handler may fall behind by before further events are dropped
+
+        Returns:
+            The subscription, to unsubscribe with or to inspect
+        """
+        return self._add(ThreadSubscription(handler, event_types, maxsize))
+
+    def subscribe_async(self, handler: Callable, event_types: Optional[Iterable[type]] = None,
+                        maxsize: int = EventConstants.DEFAULT_QUEUE_SIZE) -> AsyncSubscription:
+        """
+        Deliver events to a handler in a task on the running event loop.
+
+        Must be called from within the event loop. The handler may be a
+        coroutine function; events are still delivered one at a time.
+
+        Args:
+            handler: Called (and awaited, if it returns an awaitable) with each event
+            event_types: Event classes to receive, None for every event
+            maxsize: Events the handler may fall behind by before further events are dropped
+
+        Returns:
+            The subscription, to unsubscribe with or to inspect
+        """
+        return self._add(AsyncSubscription(handler, event_types, maxsize))
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._set_subscriptions(self._subscriptions + (subscription,))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop publishing to a subscription and close it once its queued events are delivered."""
+        with self._lock:
+            self._set_subscriptions(tuple(s for s in self._subscriptions if s is not subscription))
+        subscription.close()
+
+    def _set_subscriptions(self, subscriptions: Tuple[Subscription, ...]) -> None:
+        event_types = {event_type for s in subscriptions if s.event_types is not None
+                       for event_type in s.event_types}
+        routes = {event_type: tuple(s for s in subscriptions if s.accepts(event_type))
+                  for event_type in event_types}
+        # Events of any other type go to the subscribers of every event
+        routes[None] = tuple(s for s in subscriptions if s.event_types is None)
+        self._subscriptions = subscriptions
+        self._routes = routes
+
+    @property
+    def subscriptions(self) -> Tuple[Subscription, ...]:
+        return self._subscriptions
+
+    def publish(self, event) -> None:
+        """Queue an event for every subscriber to it, without waiting for any of them."""
+        routes = self._routes
+        subscribers = routes.get(type(event))
+        if subscribers is None:
+            subscribers = routes.get(None, ())
+        for subscription in subscribers:
+            subscription.offer(event)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the thread subscribers have handled every published event.
+
+        Returns:
+            True if they all caught up, False if the timeout passed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in self._subscriptions:
+            if isinstance(subscription, ThreadSubscription):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not subscription.drain(remaining):
+                    return False
+        return True
+
+    def close(self, timeout: Optional[float] = EventConstants.CLOSE_TIMEOUT) -> None:
+        """Remove every subscriber, stopping each once its queued events are delivered."""
+        with self._lock:
+            subscriptions = self._subscriptions
+            self._set_subscriptions(())
+        for subscription in subscriptions:
+            subscription.close(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class EventLogger:
+    """Subscriber that writes each event to a logger."""
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        """
+        Args:
+            log: Logger to write to, defaults to this module's logger
+            level: Level the events are logged at
+        """
+        self.log = log if log is not None else logger
+        self.level = level
+
+    def __call__(self, event) -> None:
+        self.log.log(self.level, "%s %s", type(event).__name__, event._asdict())
@@ -0,0 +1,60 @@
+"""
+Events published by the game engine.
+
+Each event is an immutable NamedTuple holding plain values (names, moves,
+scores) rather than live game objects, so subscribers can process it on
+another thread after the round has moved on. Events are delivered through an
+EventBus (src/core/event_bus.py); this module has no dependencies so the
+engine can create events without loading the bus.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+from src.core.game_move import GameMove
+
+
+class RoundStarted(NamedTuple):
+    """A round is about to ask the players for their moves."""
+    round_number: Optional[int]
+    total_rounds: Optional[int]
+
+
+class MovesMade(NamedTuple):
+    """Both players have moved; a move is None if its player timed out."""
+    round_number: Optional[int]
+    player_1: str
+    player_2: str
+    move_1: Optional[GameMove]
+    move_2: Optional[GameMove]
+
+
+class TimeoutOccurred(NamedTuple):
+    """A round was decided by a timeout (timeout is a TimeoutResult value, e.g. "player_1_timeout")."""
+    round_number: Optional[int]
+    timeout: str
+    result: int
+
+
+class RoundResolved(NamedTuple):
+    """A round's result is known and the scores updated (result: 1, -1 or 0)."""
+    round_number: Optional[int]
+    result: int
+    scores: Tuple[float, float]
+
+
+class SeriesDecided(NamedTuple):
+    """A best-of series has ended; winner is None for a drawn series."""
+    winner: Optional[str]
+    scores: Tuple[float, float]
+
+
+class SessionEnded(NamedTuple):
+    """A game session has ended, normally or by cancellation or the exit command."""
+    player_1: str
+    player_2: str
+    scores: Tuple[float, float]
+    rounds_played: int
+    cancelled: bool
+
+
+EVENT_TYPES = (RoundStarted, MovesMade, TimeoutOccurred, RoundResolved, SeriesDecided, SessionEnded)
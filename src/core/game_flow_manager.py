@@ -5,11 +5,12 @@ This module centralizes the logic for managing game flow, including
 standard rounds and best-of-X series.
 """
 
-from typing import List
+from typing import Optional
+from src.core.events import SeriesDecided, SessionEnded
+from src.core.game_session import CancellationToken, GameSession
 from src.core.round_executor import RoundExecutor
 from src.players.player import Player
 from src.game_utils.game_rules import GameRules
-from src.constants import GameConstants, GameMessages
 
 
 class GameFlowManager:
@@ -20,10 +21,24 @@ class GameFlowManager:
     and delegates individual round execution to the RoundExecutor.
     """
 
-    def __init__(self, rules: GameRules, output_provider):
+    def __init__(self, rules: GameRules, output_provider, match_recorder=None,
+                 instrumentation=None, move_collector=None, metrics=None, event_bus=None):
+        """
+        Args:
+            rules: The rules used to decide each round
+            output_provider: Provider for displaying the game
+            match_recorder: Optional MatchRecorder; each game played is recorded as a session
+            instrumentation: Optional RoundInstrumentation to time each phase of every round
+            move_collector: Optional MoveCollector used to ask the players for their moves
+            metrics: Optional GameMetrics updated as rounds are played
+            event_bus: Optional EventBus that round, series and session events are published to
+        """
         self.rules = rules
         self.output_provider = output_provider
-        self.round_executor = RoundExecutor(rules, output_provider)
+        self.match_recorder = match_recorder
+        self.event_bus = event_bus
+        self.round_executor = RoundExecutor(rules, output_provider, match_recorder, instrumentation,
+                                            move_collector, metrics, event_bus)
 
     def play_standard_rounds(self, rounds_to_play: int, player_1: Player,
                              player_2: Player, score_manager) -> None:
@@ -36,10 +51,7 @@ class GameFlowManager:
             player_2: The second player
             score_manager: The score manager to track scores
         """
-        for round_number in range(1, rounds_to_play + 1):
-            self.round_executor.execute_round(
-                player_1, player_2, score_manager, round_number, rounds_to_play
-            )
+        self.create_session(player_1, player_2, score_manager, rounds_to_play).run()
 
     def play_best_of_series(self, player_1: Player, player_2: Player,
                             score_manager, max_rounds: int = None,
@@ -54,33 +66,60 @@ class GameFlowManager:
             max_rounds: Maximum number of rounds in series
             win_threshold: Points needed to win series
         """
-        if max_rounds is None:
-            max_rounds = GameConstants.BEST_OF_SERIES_ROUNDS
-        if win_threshold is None:
-            win_threshold = GameConstants.BEST_OF_SERIES_WIN_THRESHOLD
-
-        round_number = 1
-
-        while (round_number <= max_rounds and
-               score_manager.get_player_score(player_1.get_name()) < win_threshold and
-               score_manager.get_player_score(player_2.get_name()) < win_threshold):
-            self.round_executor.execute_round(
-                player_1, player_2, score_manager, round_number, max_rounds
-            )
-            round_number += 1
-
-        # Provide feedback about series result
-        self._announce_series_result(player_1, player_2, score_manager)
-
-    def _announce_series_result(self, player_1: Player, player_2: Player,
-                                score_manager) -> None:
+        self.create_session(player_1, player_2, score_manager, max_rounds=max_rounds,
+                            win_threshold=win_threshold).run()
+
+    def create_session(self, player_1: Player, player_2: Player, score_manager,
+                       rounds_to_play: Optional[int] = None, max_rounds: int = None,
+                       win_threshold: int = None,
+                       cancellation: Optional[CancellationToken] = None) -> GameSession:
+        """
+        Create a session to be played a round at a time.
+
+        Args:
+            player_1: The first player
+            player_2: The second player
+            score_manager: The score manager to track scores
+            rounds_to_play: Number of rounds for a standard game, None for a best-of series
+            max_rounds: Maximum number of rounds in a series
+            win_threshold: Points needed to win a series
+            cancellation: Optional token that stops the session before its next round
+
+        Returns:
+            The session, not yet started
+        """
+        return GameSession(self, player_1, player_2, score_manager, rounds_to_play,
+                           max_rounds, win_threshold, cancellation)
+
+    def start_recorded_session(self) -> None:
+        """Begin a new session in the match log, if recording."""
+        if self.match_recorder is not None:
+            self.match_recorder.start_session()
+
+    def announce_series_result(self, player_1: Player, player_2: Player,
+                               score_manager) -> None:
         """Announce the result of a best-of series."""
         p1_score = score_manager.get_player_score(player_1.get_name())
         p2_score = score_manager.get_player_score(player_2.get_name())
 
         if p1_score > p2_score:
-            print(GameMessages.BEST_OF_5_WINNER.format(winner=player_1.get_name()))
+            winner = player_1.get_name()
+            self.output_provider.output_series_winner(winner)
         elif p2_score > p1_score:
-            print(GameMessages.BEST_OF_5_WINNER.format(winner=player_2.get_name()))
+            winner = player_2.get_name()
+            self.output_provider.output_series_winner(winner)
         else:
-            print(GameMessages.BEST_OF_5_DRAW)
\ No newline at end of file
+            winner = None
+            self.output_provider.output_series_draw()
+        if self.event_bus is not None:
+            self.event_bus.publish(SeriesDecided(winner, (p1_score, p2_score)))
+
+    def publish_session_ended(self, player_1: Player, player_2: Player, score_manager,
+                              rounds_played: int, cancelled: bool) -> None:
+        """Publish the end of a session, if an event bus is configured."""
+        if self.event_bus is None:
+            return
+        player_1_name = player_1.get_name()
+        player_2_name = player_2.get_name()
+        scores = (score_manager.get_player_score(player_1_name), score_manager.get_player_score(player_2_name))
+        self.event_bus.publish(SessionEnded(player_1_name, player_2_name, scores, rounds_played, cancelled))
\ No newline at end of file
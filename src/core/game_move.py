@@ -15,6 +15,11 @@ class GameMove(ABC):
 
     This interface allows the game framework to work with any type of move
     (gestures, cards, etc.) without knowing the specific implementation.
+
+    Moves are singletons: each distinct move is one object, so equality and
+    hashing are by identity. Implementations should build their value and
+    name lookup tables and formatted choices once, so that lookups, parsing
+    and validation take constant time however many moves a game has.
     """
 
     @abstractmethod
@@ -32,15 +37,9 @@ class GameMove(ABC):
         """Return string representation of this move."""
         pass
 
-    @abstractmethod
-    def __eq__(self, other) -> bool:
-        """Check equality with another move."""
-        pass
-
-    @abstractmethod
-    def __hash__(self) -> int:
-        """Return hash for use in dictionaries."""
-        pass
+    # Identity equality and hashing, using the C-level object implementations
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
     @classmethod
     @abstractmethod
@@ -57,17 +56,23 @@ class GameMove(ABC):
     @classmethod
     @abstractmethod
     def get_move_by_value(cls, value: Any) -> 'GameMove':
-        """Get a move by its value."""
+        """Get a move by its value, using a precomputed value -> move table."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def get_move_by_name(cls, name: str) -> 'GameMove':
+        """Get a move by its (case-insensitive) name, using a precomputed name -> move table."""
         pass
 
     @classmethod
     @abstractmethod
     def validate_value(cls, value: Any) -> bool:
-        """Validate if a value corresponds to a valid move."""
+        """Validate if a value corresponds to a valid move, in constant time."""
         pass
 
     @classmethod
     @abstractmethod
     def get_formatted_choices(cls) -> List[str]:
-        """Return formatted choices for user display."""
+        """Return formatted choices for user display, computed once and cached."""
         pass
\ No newline at end of file
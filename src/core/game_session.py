@@ -0,0 +1,188 @@
+"""
+Step-by-step game sessions.
+
+A GameSession is one game between two players - a fixed number of rounds or
+a best-of series - that a host advances explicitly: start(), then step()
+once per round until is_complete(), then finish(). A host that must wait
+for moves itself (e.g. awaiting remote players) calls begin_round() first,
+so the round is announced and cancellation checked before it waits. Ending a game early never
+exits the process: a player's exit command or a cancelled CancellationToken
+raises GameExit out of step(), leaving the session CANCELLED, so the same
+process (and the same game objects) can go straight on to the next session.
+"""
+
+from enum import Enum
+from typing import Optional
+
+from game import GameExit
+from src.players.player import Player
+from src.constants import GameConstants, GameMessages
+
+
+class SessionState(Enum):
+    """Where a session is in its lifecycle."""
+    CREATED = "created"
+    RUNNING = "running"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+
+
+class SessionCancelled(GameExit):
+    """Raised by GameSession.step when the session's cancellation token has been cancelled."""
+    pass
+
+
+class CancellationToken:
+    """
+    Signal asking running sessions to stop.
+
+    Sessions check the token before each round, so cancelling from another
+    thread (e.g. a worker pool shutting down) stops a session at its next
+    round boundary; input that is already being waited for is not interrupted.
+    """
+
+    def __init__(self):
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def reset(self) -> None:
+        """Clear the signal so the token can be reused for the next game."""
+        self._cancelled = False
+
+
+class GameSession:
+    """
+    One game between two players, played a round at a time.
+
+    With rounds_to_play the session is a standard game of that many rounds;
+    without it, a best-of series that ends when a player reaches the win
+    threshold or the round limit is reached.
+    """
+
+    def __init__(self, game_flow_manager, player_1: Player, player_2: Player, score_manager,
+                 rounds_to_play: Optional[int] = None, max_rounds: Optional[int] = None,
+                 win_threshold: Optional[int] = None, cancellation: Optional[CancellationToken] = None):
+        """
+        Args:
+            game_flow_manager: The GameFlowManager whose round executor plays the rounds
+            player_1: The first player
+            player_2: The second player
+            score_manager: The score manager to track scores
+            rounds_to_play: Number of rounds for a standard game, None for a best-of series
+            max_rounds: Maximum number of rounds in a series
+            win_threshold: Points needed to win a series
+            cancellation: Optional token checked before every round
+        """
+        self.game_flow_manager = game_flow_manager
+        self.player_1 = player_1
+        self.player_2 = player_2
+        self.score_manager = score_manager
+        self.best_of_series = rounds_to_play is None
+        if self.best_of_series:
+            self.total_rounds = max_rounds if max_rounds is not None else GameConstants.BEST_OF_SERIES_ROUNDS
+            self.win_threshold = (win_threshold if win_threshold is not None
+                                  else GameConstants.BEST_OF_SERIES_WIN_THRESHOLD)
+        else:
+            self.total_rounds = rounds_to_play
+            self.win_threshold = None
+        self.cancellation = cancellation
+        self.state = SessionState.CREATED
+        self.round_number = 1
+        self._round_begun = False
+        self._player_1_name = player_1.get_name()
+        self._player_2_name = player_2.get_name()
+
+    def start(self) -> None:
+        """Begin the session (and its match log session, if recording)."""
+        self._require_state(SessionState.CREATED)
+        self.state = SessionState.RUNNING
+        self.game_flow_manager.start_recorded_session()
+        self.player_1.begin_session()
+        self.player_2.begin_session()
+
+    def is_complete(self) -> bool:
+        """Return True once no more rounds are to be played."""
+        if self.round_number > self.total_rounds:
+            return True
+        return self.best_of_series and (
+            self.score_manager.get_player_score(self._player_1_name) >= self.win_threshold or
+            self.score_manager.get_player_score(self._player_2_name) >= self.win_threshold
+        )
+
+    def begin_round(self) -> None:
+        """
+        Announce the next round ahead of step(), for hosts that collect moves before stepping.
+
+        Raises:
+            SessionCancelled: If the cancellation token was cancelled
+        """
+        self._require_state(SessionState.RUNNING)
+        self._check_cancellation()
+        self.game_flow_manager.output_provider.output_round_number(self.round_number, self.total_rounds)
+        self._round_begun = True
+
+    def step(self) -> bool:
+        """
+        Play the next round.
+
+        Returns:
+            True if there are more rounds to play
+
+        Raises:
+            SessionCancelled: If the cancellation token was cancelled
+            GameExit: If a player exited the game during the round
+        """
+        self._require_state(SessionState.RUNNING)
+        announce = not self._round_begun
+        if announce:
+            self._check_cancellation()
+        self._round_begun = False
+        try:
+            self.game_flow_manager.round_executor.execute_round(
+                self.player_1, self.player_2, self.score_manager, self.round_number, self.total_rounds, announce
+            )
+        except GameExit:
+            self.abort()
+            raise
+        self.round_number += 1
+        return not self.is_complete()
+
+    def finish(self) -> None:
+        """End the session, announcing the result of a best-of series."""
+        self._require_state(SessionState.RUNNING)
+        self.state = SessionState.FINISHED
+        if self.best_of_series:
+            self.game_flow_manager.announce_series_result(self.player_1, self.player_2, self.score_manager)
+        self.game_flow_manager.publish_session_ended(self.player_1, self.player_2, self.score_manager,
+                                                     self.round_number - 1, cancelled=False)
+
+    def run(self) -> None:
+        """Play the whole session: start, every round, finish."""
+        self.start()
+        while not self.is_complete():
+            self.step()
+        self.finish()
+
+    def abort(self) -> None:
+        """End a running session early, e.g. when a player exits while the host waits for their move."""
+        self._require_state(SessionState.RUNNING)
+        self.state = SessionState.CANCELLED
+        self.game_flow_manager.publish_session_ended(self.player_1, self.player_2, self.score_manager,
+                                                     self.round_number - 1, cancelled=True)
+
+    def _check_cancellation(self) -> None:
+        if self.cancellation is not None and self.cancellation.cancelled:
+            self.abort()
+            raise SessionCancelled()
+
+    def _require_state(self, state: SessionState) -> None:
+        if self.state is not state:
+            raise RuntimeError(GameMessages.INVALID_SESSION_STATE.format(
+                expected=state.value, state=self.state.value
+            ))
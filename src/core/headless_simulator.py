@@ -0,0 +1,194 @@
+"""
+Headless simulation of computer-vs-computer matches.
+
+This module plays large numbers of rounds between two players without any
+console I/O, returning aggregate results instead of rendering each round.
+It follows exactly the same move collection order, timeout forfeits and
+scoring rules as the interactive path in GameFlowManager, so a seeded
+simulation produces the same scores as the equivalent interactive game.
+"""
+
+from typing import NamedTuple, Optional
+
+from src.core.timeout_handler import TimeoutHandler, TIMEOUT_ROUND_RESULTS
+from src.game_utils.game_rules import GameRules
+from src.game_utils.score_manager import ScoreManager
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+from src.players.player import Player
+from src.constants import GameConstants, ScoringConstants
+
+
+class SimulationResult(NamedTuple):
+    """Aggregate results of a block of simulated rounds."""
+    rounds_played: int
+    player_1_wins: int
+    player_2_wins: int
+    draws: int
+    timeouts: int
+    player_1_score: float
+    player_2_score: float
+
+
+class SeriesSimulationResult(NamedTuple):
+    """Aggregate results of a number of simulated best-of series."""
+    series_played: int
+    player_1_series_wins: int
+    player_2_series_wins: int
+    series_draws: int
+    rounds_played: int
+
+
+class HeadlessSimulator:
+    """
+    Plays rounds between two players with no output.
+
+    Where GameFlowManager delegates each round to the RoundExecutor (with its
+    display and leaderboard calls), this class runs the same round logic in a
+    tight loop and only counts the outcomes.
+    """
+
+    def __init__(self, rules: GameRules,
+                 score_manager_type: str = GameConstants.SCORE_MANAGER_STANDARD):
+        self.rules = rules
+        self.score_manager_type = score_manager_type
+
+    def simulate_rounds(self, rounds_to_play: int, player_1: Player, player_2: Player,
+                        score_manager: Optional[ScoreManager] = None) -> SimulationResult:
+        """
+        Simulate a fixed number of rounds, mirroring GameFlowManager.play_standard_rounds.
+
+        Args:
+            rounds_to_play: Number of rounds to play
+            player_1: The first player
+            player_2: The second player
+            score_manager: Score manager to update, a fresh one is created if omitted
+
+        Returns:
+            The aggregate SimulationResult
+        """
+        if score_manager is None:
+            score_manager = self._create_score_manager(player_1, player_2)
+
+        # Indexed by round result: [draws, player 1 wins, player 2 wins]
+        counts = [0, 0, 0]
+        timeouts = 0
+
+        make_move_1 = player_1.make_move
+        make_move_2 = player_2.make_move
+        determine_result = self.rules.determine_result
+        update_scores = score_manager.update_scores_for_round
+        classify = TimeoutHandler.classify
+        observe_1, observe_2 = self._observers(player_1, player_2)
+
+        for _ in range(rounds_to_play):
+            move_1 = make_move_1()
+            move_2 = make_move_2()
+            if move_1 is None or move_2 is None:
+                round_result = TIMEOUT_ROUND_RESULTS[classify(move_1, move_2)]
+                timeouts += 1
+            else:
+                round_result = determine_result(move_1, move_2)
+                if observe_1 is not None:
+                    observe_1(move_1, move_2)
+                if observe_2 is not None:
+                    observe_2(move_2, move_1)
+            counts[round_result] += 1
+            update_scores(round_result)
+
+        return SimulationResult(
+            rounds_played=rounds_to_play,
+            player_1_wins=counts[ScoringConstants.PLAYER_1_WIN],
+            player_2_wins=counts[ScoringConstants.PLAYER_2_WIN],
+            draws=counts[ScoringConstants.DRAW],
+            timeouts=timeouts,
+            player_1_score=score_manager.get_player_score(player_1.get_name()),
+            player_2_score=score_manager.get_player_score(player_2.get_name())
+        )
+
+    def simulate_series(self, series_count: int, player_1: Player, player_2: Player,
+                        max_rounds: int = None,
+                        win_threshold: int = None) -> SeriesSimulationResult:
+        """
+        Simulate repeated best-of series, mirroring GameFlowManager.play_best_of_series.
+
+        Args:
+            series_count: Number of series to play
+            player_1: The first player
+            player_2: The second player
+            max_rounds: Maximum number of rounds in each series
+            win_threshold: Points needed to win a series
+
+        Returns:
+            The aggregate SeriesSimulationResult
+        """
+        if max_rounds is None:
+            max_rounds = GameConstants.BEST_OF_SERIES_ROUNDS
+        if win_threshold is None:
+            win_threshold = GameConstants.BEST_OF_SERIES_WIN_THRESHOLD
+
+        player_1_name = player_1.get_name()
+        player_2_name = player_2.get_name()
+        make_move_1 = player_1.make_move
+        make_move_2 = player_2.make_move
+        determine_result = self.rules.determine_result
+        classify = TimeoutHandler.classify
+        observe_1, observe_2 = self._observers(player_1, player_2)
+
+        # Indexed by series outcome: [draws, player 1 wins, player 2 wins]
+        series_counts = [0, 0, 0]
+        rounds_played = 0
+
+        for _ in range(series_count):
+            score_manager = self._create_score_manager(player_1, player_2)
+            update_scores = score_manager.update_scores_for_round
+            get_score = score_manager.get_player_score
+
+            round_number = 1
+            while (round_number <= max_rounds and
+                   get_score(player_1_name) < win_threshold and
+                   get_score(player_2_name) < win_threshold):
+                move_1 = make_move_1()
+                move_2 = make_move_2()
+                if move_1 is None or move_2 is None:
+                    update_scores(TIMEOUT_ROUND_RESULTS[classify(move_1, move_2)])
+                else:
+                    update_scores(determine_result(move_1, move_2))
+                    if observe_1 is not None:
+                        observe_1(move_1, move_2)
+                    if observe_2 is not None:
+                        observe_2(move_2, move_1)
+                round_number += 1
+
+            rounds_played += round_number - 1
+            p1_score = get_score(player_1_name)
+            p2_score = get_score(player_2_name)
+            if p1_score > p2_score:
+                series_counts[ScoringConstants.PLAYER_1_WIN] += 1
+            elif p2_score > p1_score:
+                series_counts[ScoringConstants.PLAYER_2_WIN] += 1
+            else:
+                series_counts[ScoringConstants.DRAW] += 1
+
+        return SeriesSimulationResult(
+            series_played=series_count,
+            player_1_series_wins=series_counts[ScoringConstants.PLAYER_1_WIN],
+            player_2_series_wins=series_counts[ScoringConstants.PLAYER_2_WIN],
+            series_draws=series_counts[ScoringConstants.DRAW],
+            rounds_played=rounds_played
+        )
+
+    @staticmethod
+    def _observers(player_1: Player, player_2: Player):
+        """Return each player's observe_round, or None where it is the base no-op, to skip the call."""
+        return tuple(None if getattr(type(player), "observe_round", None) is Player.observe_round
+                     else player.observe_round
+                     for player in (player_1, player_2))
+
+    def _create_score_manager(self, player_1: Player, player_2: Player) -> ScoreManager:
+        """Create a score manager with no game attached, since nothing is displayed."""
+        return ScoreManagerFactory.create_score_manager(
+            self.score_manager_type,
+            None,
+            player_1.get_name(),
+            player_2.get_name()
+        )
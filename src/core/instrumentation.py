@@ -0,0 +1,194 @@
+"""
+Per-phase timing of game rounds.
+
+RoundInstrumentation keeps one fixed-size latency histogram per round phase
+(waiting for input, timeout handling, rule evaluation, scoring, output and
+player learning). The histograms use HDR-style log-linear buckets, so memory
+is fixed however many rounds are recorded and percentiles are accurate to a
+few percent across nanoseconds to minutes.
+
+Instrumentation is opt-in: components hold None when it is disabled and
+check it once per phase.
+"""
+
+import time
+from array import array
+from typing import Dict, Optional
+
+from src.constants import InstrumentationConstants
+
+PHASE_INPUT = "input"
+PHASE_TIMEOUT = "timeout"
+PHASE_RULES = "rules"
+PHASE_SCORING = "scoring"
+PHASE_OUTPUT = "output"
+PHASE_LEARNING = "learning"
+
+PHASES = (PHASE_INPUT, PHASE_TIMEOUT, PHASE_RULES, PHASE_SCORING, PHASE_OUTPUT, PHASE_LEARNING)
+
+_SUB_BUCKET_BITS = InstrumentationConstants.HISTOGRAM_SUB_BUCKET_BITS
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT >> 1
+_MAX_VALUE = (1 << InstrumentationConstants.HISTOGRAM_MAX_VALUE_BITS) - 1
+_BUCKET_COUNT = ((InstrumentationConstants.HISTOGRAM_MAX_VALUE_BITS - _SUB_BUCKET_BITS + 1)
+                 * _HALF_SUB_BUCKET_COUNT + _HALF_SUB_BUCKET_COUNT)
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear histogram of non-negative integer values (nanoseconds).
+
+    Values below 2 ** SUB_BUCKET_BITS are counted exactly; above that each
+    power of two is split into equal-width sub-buckets. Larger values than
+    the configured maximum are counted in the top bucket.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self._counts = array("q", [0]) * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        """Return the bucket counting a value."""
+        if value < _SUB_BUCKET_COUNT:
+            return value if value > 0 else 0
+        if value > _MAX_VALUE:
+            value = _MAX_VALUE
+        shift = value.bit_length() - _SUB_BUCKET_BITS
+        return shift * _HALF_SUB_BUCKET_COUNT + (value >> shift)
+
+    @staticmethod
+    def bucket_upper_bound(index: int) -> int:
+        """Return the largest value counted by a bucket."""
+        if index < _SUB_BUCKET_COUNT:
+            return index
+        shift = index // _HALF_SUB_BUCKET_COUNT - 1
+        sub_bucket = index - shift * _HALF_SUB_BUCKET_COUNT
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Count a single value."""
+        self._counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Return the value at a percentile.
+
+        Args:
+            percentile: Between 0 and 100
+
+        Returns:
+            The upper bound of the bucket holding that rank (so never an
+            underestimate), capped at the largest value recorded; 0 if empty
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts to this one."""
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+class RoundInstrumentation:
+    """
+    Collects per-phase timings for rounds.
+
+    Timing is chained: start() takes a timestamp, and each mark() records the
+    time since the previous timestamp against a phase and returns the new
+    timestamp, so consecutive phases cost one clock read each.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        """
+        Args:
+            clock: Integer nanosecond clock
+        """
+        self._clock = clock
+        self.histograms: Dict[str, LatencyHistogram] = {phase: LatencyHistogram() for phase in PHASES}
+
+    def start(self) -> int:
+        """Return a timestamp to start timing from."""
+        return self._clock()
+
+    def mark(self, phase: str, since: int) -> int:
+        """
+        Record the time since a timestamp against a phase.
+
+        Args:
+            phase: The phase that has just finished
+            since: Timestamp from start() or the previous mark()
+
+        Returns:
+            The current timestamp, for timing the next phase
+        """
+        now = self._clock()
+        self.histograms[phase].record(now - since)
+        return now
+
+    def record(self, phase: str, elapsed_ns: int) -> None:
+        """Record a duration measured by the caller."""
+        self.histograms[phase].record(elapsed_ns)
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """
+        Summarise each phase that has been timed.
+
+        Returns:
+            Mapping of phase to its count, p50/p95/p99 and max, in nanoseconds
+        """
+        report = {}
+        for phase, histogram in self.histograms.items():
+            if histogram.count:
+                summary = {"count": histogram.count}
+                for percentile in InstrumentationConstants.REPORT_PERCENTILES:
+                    summary[f"p{percentile:g}"] = histogram.percentile(percentile)
+                summary["max"] = histogram.max
+                report[phase] = summary
+        return report
+
+    def format_report(self) -> str:
+        """Return the report as a table, in microseconds."""
+        row_format = InstrumentationConstants.REPORT_ROW_FORMAT
+        lines = [row_format.format(phase="Phase", count="Rounds", p50="p50 (us)",
+                                   p95="p95 (us)", p99="p99 (us)", max="max (us)")]
+        for phase, summary in self.report().items():
+            lines.append(row_format.format(
+                phase=phase, count=summary["count"],
+                **{key: f"{summary[key] / 1000:.1f}" for key in ("p50", "p95", "p99", "max")}
+            ))
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        for histogram in self.histograms.values():
+            histogram.reset()
@@ -0,0 +1,351 @@
+"""
+Prometheus-style metrics for running games.
+
+A MetricsRegistry holds counters, gauges and histograms and renders them in
+the Prometheus text exposition format. Updates never take a lock: every
+metric keeps one cell per thread, each thread only ever writes its own cell,
+and a scrape adds the cells up. A scrape therefore never makes the game loop
+wait (it may see an update from another thread a moment late, which is fine
+for monitoring).
+
+GameMetrics defines the game's own metrics. Like RoundInstrumentation it is
+opt-in: components hold None when metrics are disabled.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.constants import MetricsConstants
+
+
+class _Cells:
+    """
+    Per-thread cells of numbers whose totals are read by summing the cells.
+
+    The lock is only taken the first time a thread updates the metric, to add its cell.
+    """
+
+    __slots__ = ("_size", "_local", "_cells", "_lock")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[list] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        """Return the calling thread's cell."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0] * self._size
+            with self._lock:
+                self._cells.append(cell)
+            return cell
+
+    def totals(self) -> list:
+        totals = [0] * self._size
+        for cell in tuple(self._cells):
+            for index, value in enumerate(cell):
+                totals[index] += value
+        return totals
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """A metric family: one child per combination of label values."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._children_lock = threading.Lock()
+        if not self.label_names:
+            self._unlabelled = self.labels()
+
+    def labels(self, *values) -> "_Metric":
+        """
+        Return the child for a combination of label values, creating it on first use.
+
+        Children can be kept and reused, which avoids the lookup on every update.
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(f"{self.name} takes labels {self.label_names}, got {key}")
+            with self._children_lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the child holding the values for one combination of label values."""
+        pass
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        for key, child in sorted(tuple(self._children.items())):
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key: Tuple[str, ...], child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_number(child.value())}"]
+
+
+class _CounterChild:
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells = _Cells(1)
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._cells.cell()[0] += amount
+
+    def value(self):
+        return self._cells.totals()[0]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. rounds played."""
+
+    TYPE = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled.inc(amount)
+
+    def value(self):
+        return self._unlabelled.value()
+
+
+class _GaugeChild:
+    __slots__ = ("_cells", "_offset", "_function")
+
+    def __init__(self):
+        self._cells = _Cells(1)
+        self._offset = 0
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1) -> None:
+        self._cells.cell()[0] += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._cells.cell()[0] -= amount
+
+    def set(self, value: float) -> None:
+        """Set the value (if other threads update it at the same moment, the last writer wins)."""
+        self._offset = value - self._cells.totals()[0]
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value with a function at each scrape instead."""
+        self._function = function
+
+    def value(self):
+        if self._function is not None:
+            return self._function()
+        return self._offset + self._cells.totals()[0]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. sessions in progress."""
+
+    TYPE = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled.inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._unlabelled.dec(amount)
+
+    def set(self, value: float) -> None:
+        self._unlabelled.set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._unlabelled.set_function(function)
+
+    def value(self):
+        return self._unlabelled.value()
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # One count per bucket (the last is +Inf), then the sum of the observed values
+        self._cells = _Cells(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """Return the cumulative bucket counts (ending with +Inf) and the sum."""
+        totals = self._cells.totals()
+        cumulative, running = [], 0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-1]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets, e.g. round durations in seconds."""
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = MetricsConstants.DURATION_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, label_names)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled.observe(value)
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        return self._unlabelled.snapshot()
+
+    def _render_child(self, key: Tuple[str, ...], child) -> List[str]:
+        cumulative, total = child.snapshot()
+        lines = []
+        for bound, count in zip(self.buckets + (float("inf"),), cumulative):
+            labels = _format_labels(self.label_names, key, f'le="{_format_number(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {count}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics, rendered together for a scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = MetricsConstants.DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def get(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in tuple(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class GameMetrics:
+    """
+    The metrics recorded by the game engine.
+
+    Labelled children are created up front so each update is a single
+    per-thread addition.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, clock=time.perf_counter):
+        """
+        Args:
+            registry: Registry to add the metrics to, defaults to a new one
+            clock: Clock returning seconds, used to time rounds
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.clock = clock
+        prefix = MetricsConstants.NAME_PREFIX
+
+        rounds = self.registry.counter(f"{prefix}rounds_total", "Rounds played, by result", ("result",))
+        self._round_results = {result: rounds.labels(label)
+                               for result, label in MetricsConstants.RESULT_LABELS.items()}
+        self.round_duration = self.registry.histogram(
+            f"{prefix}round_duration_seconds", "Time to play a round, including waiting for moves"
+        )
+        self._timeouts = self.registry.counter(
+            f"{prefix}timeouts_total", "Rounds decided by a timeout, by which players timed out", ("timeout",)
+        )
+        self.invalid_moves = self.registry.counter(
+            f"{prefix}invalid_moves_total", "Move inputs rejected as invalid"
+        )
+        self.sessions_started = self.registry.counter(f"{prefix}sessions_started_total", "Game sessions started")
+        self.sessions_finished = self.registry.counter(
+            f"{prefix}sessions_finished_total", "Game sessions ended, including cancelled ones"
+        )
+        self.active_sessions = self.registry.gauge(f"{prefix}active_sessions", "Game sessions in progress")
+
+    def record_round(self, result: int, started: float) -> None:
+        """
+        Count a round and its duration.
+
+        Args:
+            result: The round result (1, -1 or 0)
+            started: The clock's value when the round started
+        """
+        self.round_duration.observe(self.clock() - started)
+        self._round_results[result].inc()
+
+    def record_timeout(self, timeout_result) -> None:
+        """Count a round decided by a timeout (a TimeoutResult other than BOTH_VALID)."""
+        self._timeouts.labels(timeout_result.value).inc()
+
+    def record_invalid_move(self) -> None:
+        self.invalid_moves.inc()
+
+    def session_started(self) -> None:
+        self.sessions_started.inc()
+        self.active_sessions.inc()
+
+    def session_finished(self) -> None:
+        self.sessions_finished.inc()
+        self.active_sessions.dec()
@@ -0,0 +1,123 @@
+"""
+Strategies for collecting the players' moves in a round.
+
+By default RoundExecutor asks the players one after the other, so a round
+takes the sum of their think times. ConcurrentMoveCollector asks them all at
+once: every player's deadline starts at the same instant (a shared round
+deadline) and the round takes roughly as long as the slowest player.
+Either way each move is checked against its player's deadline by the
+TimeoutHandler, so timeouts resolve exactly as they do sequentially.
+Players reading the same input (Player.input_source) are still asked one
+after the other, since their prompts and input lines would interleave.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from src.core.game_move import GameMove
+from src.core.timeout_handler import TimeoutHandler
+from src.players.player import Player
+
+
+class MoveCollector(ABC):
+    """Collects one move from each player in a round."""
+
+    @abstractmethod
+    def collect_moves(self, players: Sequence[Player],
+                      timeout_handler: TimeoutHandler) -> List[Optional[GameMove]]:
+        """
+        Ask every player for a move.
+
+        Args:
+            players: The players, in seat order
+            timeout_handler: Starts and checks each player's move deadline
+
+        Returns:
+            The moves in seat order; None for a player who timed out
+        """
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the collector."""
+        pass
+
+
+class SequentialMoveCollector(MoveCollector):
+    """Asks each player in turn, each against their own deadline (RoundExecutor's default behaviour)."""
+
+    def collect_moves(self, players: Sequence[Player],
+                      timeout_handler: TimeoutHandler) -> List[Optional[GameMove]]:
+        return _collect_sequentially(players, timeout_handler)
+
+
+def _collect_sequentially(players: Sequence[Player], timeout_handler: TimeoutHandler) -> List[Optional[GameMove]]:
+    moves = []
+    for player in players:
+        timeout_handler.start_move_deadline(player)
+        moves.append(timeout_handler.check_move_deadline(player, player.make_move()))
+    return moves
+
+
+def _share_input(players: Sequence[Player]) -> bool:
+    """Return True if two of the players read from the same input source."""
+    sources = [source for source in (player.input_source() for player in players) if source is not None]
+    return len({id(source) for source in sources}) < len(sources)
+
+
+class ConcurrentMoveCollector(MoveCollector):
+    """
+    Asks all players at once, on a thread pool.
+
+    The first player moves on the calling thread, which saves a hand-off to
+    the pool every round; the other players move on worker threads. The
+    collector waits for every player to return before checking the
+    deadlines, exactly as the sequential collector does, so a late move is
+    still a forfeit. A round in which players share an input source is
+    collected sequentially instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Worker threads, defaults to the thread pool's default
+        """
+        self.max_workers = max_workers
+        self._executor = None
+
+    def collect_moves(self, players: Sequence[Player],
+                      timeout_handler: TimeoutHandler) -> List[Optional[GameMove]]:
+        if _share_input(players):
+            return _collect_sequentially(players, timeout_handler)
+
+        # Start every deadline before anyone is asked, so they share the round's start
+        for player in players:
+            timeout_handler.start_move_deadline(player)
+
+        futures = [self._get_executor().submit(player.make_move) for player in players[1:]]
+        try:
+            made = [players[0].make_move()]
+            made.extend(future.result() for future in futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return [timeout_handler.check_move_deadline(player, move) for player, move in zip(players, made)]
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Imported on first use so that games which never collect concurrently do not load threading
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="move-collector")
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker threads, waiting for any move in progress."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,244 @@
+"""
+Lazy registry of pluggable classes (games, rules, score managers).
+
+A PluginRegistry maps names to import paths such as
+"src.games.rps.rps_rules:RPSRules" and only imports a class the first time it
+is requested, so the cost of a plugin is paid by the games that use it rather
+than by every startup.
+
+Other packages can add plugins through entry points in the registry's group
+(e.g. "rps_arcade.games"). Scanning installed distributions for entry points
+is comparatively slow, so the result can be cached in an on-disk manifest
+which is reused until the set of installed packages changes. Entry points are
+only consulted when a name is not already registered, so built-in plugins
+never trigger discovery. Looking a name up only ever reads the manifest; it is
+written by an explicit refresh (refresh_manifest() or PluginRegistry.refresh()).
+"""
+
+import importlib
+import os
+import sys
+from typing import Dict, List, Optional, Union
+
+from src.constants import GameMessages, PluginConstants
+
+# Entry points found in this process, by group (loaded from the manifest at most once)
+_discovered_groups: Optional[Dict[str, Dict[str, str]]] = None
+
+
+def load_object(path: str):
+    """
+    Import the object named by an import path.
+
+    Args:
+        path: "package.module:Attribute" (the entry point format) or "package.module.Attribute"
+
+    Returns:
+        The object
+    """
+    module_name, separator, attribute = path.partition(":")
+    if not separator:
+        module_name, _, attribute = path.rpartition(".")
+    target = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def default_manifest_path() -> str:
+    """Return where the entry point manifest is cached."""
+    override = os.environ.get(PluginConstants.MANIFEST_ENV_VAR)
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, PluginConstants.MANIFEST_DIR, PluginConstants.MANIFEST_FILE)
+
+
+def _environment_fingerprint() -> List:
+    """
+    Describe the installed packages cheaply: the interpreter and each import path's modification time.
+
+    Installing or removing a distribution adds or removes its metadata directory,
+    which changes the modification time of the path entry that holds it.
+    """
+    fingerprint: List = [sys.version]
+    for entry in sys.path:
+        try:
+            fingerprint.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _scan_entry_points() -> Dict[str, Dict[str, str]]:
+    """Read this application's entry points from the installed distributions."""
+    from importlib import metadata
+
+    groups: Dict[str, Dict[str, str]] = {}
+    for distribution in metadata.distributions():
+        for entry_point in distribution.entry_points:
+            if entry_point.group.startswith(PluginConstants.GROUP_PREFIX):
+                groups.setdefault(entry_point.group, {}).setdefault(entry_point.name, entry_point.value)
+    return groups
+
+
+def discover_entry_points(group: str, manifest_path: Optional[str] = None,
+                          refresh: bool = False) -> Dict[str, str]:
+    """
+    Return the entry points in a group, using the cached manifest when it is current.
+
+    Without a current manifest the installed distributions are scanned, but
+    the manifest is only rewritten when refresh is requested.
+
+    Args:
+        group: Entry point group
+        manifest_path: Manifest location, defaults to default_manifest_path()
+        refresh: Rescan the installed distributions and rewrite the manifest
+
+    Returns:
+        Mapping of plugin name to import path
+    """
+    global _discovered_groups
+    if refresh:
+        refresh_manifest(manifest_path)
+    elif _discovered_groups is None:
+        groups = _read_manifest(manifest_path or default_manifest_path(), _environment_fingerprint())
+        _discovered_groups = groups if groups is not None else _scan_entry_points()
+    return dict(_discovered_groups.get(group, {}))
+
+
+def refresh_manifest(manifest_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Rescan the installed distributions and save the result as the manifest.
+
+    Args:
+        manifest_path: Manifest location, defaults to default_manifest_path()
+
+    Returns:
+        Mapping of group to that group's entry points
+    """
+    global _discovered_groups
+    fingerprint = _environment_fingerprint()
+    _discovered_groups = _scan_entry_points()
+    _write_manifest(manifest_path or default_manifest_path(), fingerprint, _discovered_groups)
+    return _discovered_groups
+
+
+def _read_manifest(path: str, fingerprint: List) -> Optional[Dict[str, Dict[str, str]]]:
+    import json
+
+    try:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(manifest, dict) or manifest.get("version") != PluginConstants.MANIFEST_VERSION
+            or manifest.get("fingerprint") != fingerprint):
+        return None
+    return manifest.get("groups")
+
+
+def _write_manifest(path: str, fingerprint: List, groups: Dict[str, Dict[str, str]]) -> None:
+    """Save the manifest; failure (e.g. a read-only home directory) only costs a rescan next time."""
+    import json
+
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as manifest_file:
+            json.dump({"version": PluginConstants.MANIFEST_VERSION,
+                       "fingerprint": fingerprint, "groups": groups}, manifest_file)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
+class PluginRegistry:
+    """
+    Name -> class registry that imports each class on first use.
+
+    Names registered in code (built-ins and register()) take precedence over
+    entry points with the same name.
+    """
+
+    def __init__(self, group: str, builtins: Optional[Dict[str, str]] = None,
+                 manifest_path: Optional[str] = None):
+        """
+        Args:
+            group: Entry point group searched for names that are not registered
+            builtins: Mapping of name to import path for the plugins shipped with the game
+            manifest_path: Entry point manifest location, defaults to default_manifest_path()
+        """
+        self.group = group
+        self._paths: Dict[str, str] = dict(builtins or {})
+        self._loaded: Dict[str, type] = {}
+        self._manifest_path = manifest_path
+        self._entry_points_loaded = False
+
+    def register(self, name: str, target: Union[type, str]) -> None:
+        """
+        Register a class, or an import path to load it from when first needed.
+
+        Args:
+            name: The name the plugin is requested by
+            target: The class itself, or its import path
+        """
+        self._loaded.pop(name, None)
+        self._paths.pop(name, None)
+        if isinstance(target, str):
+            self._paths[name] = target
+        else:
+            self._loaded[name] = target
+
+    def get(self, name: str) -> type:
+        """
+        Return the class registered under a name, importing it if necessary.
+
+        Raises:
+            KeyError: If no plugin has that name
+        """
+        plugin = self._loaded.get(name)
+        if plugin is None:
+            path = self._paths.get(name)
+            if path is None and self._load_entry_points():
+                path = self._paths.get(name)
+            if path is None:
+                raise KeyError(GameMessages.UNKNOWN_PLUGIN.format(name=name, group=self.group))
+            plugin = self._loaded[name] = load_object(path)
+        return plugin
+
+    def __contains__(self, name: str) -> bool:
+        if name in self._loaded or name in self._paths:
+            return True
+        return self._load_entry_points() and name in self._paths
+
+    def names(self) -> List[str]:
+        """Return every available name, including those provided by entry points."""
+        self._load_entry_points()
+        return sorted(set(self._loaded) | set(self._paths))
+
+    def refresh(self) -> None:
+        """Rescan the installed distributions for entry points and rewrite the manifest."""
+        discovered = discover_entry_points(self.group, self._manifest_path, refresh=True)
+        self._entry_points_loaded = True
+        self._add_entry_points(discovered)
+
+    def is_loaded(self, name: str) -> bool:
+        """Return True if the plugin's class has already been imported."""
+        return name in self._loaded
+
+    def _load_entry_points(self) -> bool:
+        """Add the group's entry points (once); returns True if this call added any."""
+        if self._entry_points_loaded:
+            return False
+        self._entry_points_loaded = True
+        return self._add_entry_points(discover_entry_points(self.group, self._manifest_path))
+
+    def _add_entry_points(self, entry_points: Dict[str, str]) -> bool:
+        """Add entry points whose names are not already taken; returns True if any were added."""
+        added = False
+        for name, path in entry_points.items():
+            if name not in self._paths and name not in self._loaded:
+                self._paths[name] = path
+                added = True
+        return added
@@ -7,7 +7,11 @@ collection, timeout handling, and result determination.
 
 from typing import Optional, Tuple
 
+from src.core.events import MovesMade, RoundResolved, RoundStarted, TimeoutOccurred
 from src.core.game_move import GameMove
+from src.core.instrumentation import (RoundInstrumentation, PHASE_INPUT, PHASE_LEARNING,
+                                      PHASE_OUTPUT, PHASE_RULES, PHASE_SCORING)
+from src.core.move_collector import MoveCollector
 from src.core.timeout_handler import TimeoutHandler, TimeoutResult
 from src.players.player import Player
 from src.game_utils.game_rules import GameRules
@@ -22,14 +26,32 @@ class RoundExecutor:
     including move collection, timeout handling, and result determination.
     """
 
-    def __init__(self, rules: GameRules, output_provider):
+    def __init__(self, rules: GameRules, output_provider, match_recorder=None,
+                 instrumentation: Optional[RoundInstrumentation] = None,
+                 move_collector: Optional[MoveCollector] = None, metrics=None, event_bus=None):
+        """
+        Args:
+            rules: The rules used to decide each round
+            output_provider: Provider for displaying the round
+            match_recorder: Optional MatchRecorder that every round is appended to
+            instrumentation: Optional RoundInstrumentation to time each phase of a round
+            move_collector: Optional MoveCollector, e.g. to collect both moves concurrently;
+                by default the players are asked one after the other
+            metrics: Optional GameMetrics counting rounds, results, durations and timeouts
+            event_bus: Optional EventBus that the round's events are published to
+        """
         self.rules = rules
         self.output_provider = output_provider
-        self.timeout_handler = TimeoutHandler(output_provider)
+        self.timeout_handler = TimeoutHandler(output_provider, instrumentation=instrumentation, metrics=metrics)
+        self.match_recorder = match_recorder
+        self.instrumentation = instrumentation
+        self.move_collector = move_collector
+        self.metrics = metrics
+        self.event_bus = event_bus
 
     def execute_round(self, player_1: Player, player_2: Player,
                       score_manager, round_number: int = None,
-                      total_rounds: int = None) -> bool:
+                      total_rounds: int = None, announce: bool = True) -> bool:
         """
         Execute a single round of the game.
 
@@ -39,41 +61,112 @@ class RoundExecutor:
             score_manager: The score manager to update
             round_number: Current round number (for display)
             total_rounds: Total number of rounds (for display)
+            announce: Whether to display the round header; False if the caller already has
 
         Returns:
             True if round completed normally, False if timeout occurred
         """
+        # When instrumented, each phase records the time since the previous mark
+        instrumentation = self.instrumentation
+        mark = instrumentation.start() if instrumentation is not None else 0
+        started = self.metrics.clock() if self.metrics is not None else 0
+        event_bus = self.event_bus
+        if event_bus is not None:
+            event_bus.publish(RoundStarted(round_number, total_rounds))
+
         # Display round header if numbers provided
-        if round_number is not None and total_rounds is not None:
+        if announce and round_number is not None and total_rounds is not None:
             self.output_provider.output_round_number(round_number, total_rounds)
-
-        # Get moves from both players
-        move_1 = player_1.make_move()
-        move_2 = player_2.make_move()
-
-        # Handle timeout cases
+            if instrumentation is not None:
+                mark = instrumentation.mark(PHASE_OUTPUT, mark)
+
+        # Get moves from both players, each within their own deadline
+        if self.move_collector is not None:
+            move_1, move_2 = self.move_collector.collect_moves((player_1, player_2), self.timeout_handler)
+        else:
+            move_1 = self._collect_move(player_1)
+            move_2 = self._collect_move(player_2)
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_INPUT, mark)
+        if event_bus is not None:
+            event_bus.publish(MovesMade(round_number, player_1.get_name(), player_2.get_name(), move_1, move_2))
+
+        # Handle timeout cases (timed by the timeout handler itself)
         timeout_result, score_update = self.timeout_handler.handle_timeout(
             player_1, player_2, move_1, move_2, score_manager
         )
 
         if timeout_result != TimeoutResult.BOTH_VALID:
+            if self.match_recorder is not None:
+                self.match_recorder.record_round(move_1, move_2, score_update)
+            if self.metrics is not None:
+                self.metrics.record_round(score_update, started)
+            if event_bus is not None:
+                event_bus.publish(TimeoutOccurred(round_number, timeout_result.value, score_update))
+                self._publish_round_resolved(player_1, player_2, score_manager, round_number, score_update)
             return False  # Timeout occurred
 
         # Normal case - both players made valid moves
-        self._process_valid_moves(player_1, player_2, move_1, move_2, score_manager)
+        round_result = self._process_valid_moves(player_1, player_2, move_1, move_2, score_manager,
+                                                 instrumentation.start() if instrumentation is not None else 0)
+        if self.match_recorder is not None:
+            self.match_recorder.record_round(move_1, move_2, round_result)
+        if self.metrics is not None:
+            self.metrics.record_round(round_result, started)
+        if event_bus is not None:
+            self._publish_round_resolved(player_1, player_2, score_manager, round_number, round_result)
         return True
 
+    def _publish_round_resolved(self, player_1: Player, player_2: Player, score_manager,
+                                round_number: Optional[int], result: int) -> None:
+        scores = (score_manager.get_player_score(player_1.get_name()),
+                  score_manager.get_player_score(player_2.get_name()))
+        self.event_bus.publish(RoundResolved(round_number, result, scores))
+
+    def _collect_move(self, player: Player) -> Optional[GameMove]:
+        """Ask a player for their move; a move made after their deadline counts as a timeout."""
+        self.timeout_handler.start_move_deadline(player)
+        return self.timeout_handler.check_move_deadline(player, player.make_move())
+
     def _process_valid_moves(self, player_1: Player, player_2: Player,
-                             move_1: GameMove, move_2: GameMove, score_manager):
-        """Process a round where both players made valid moves."""
+                             move_1: GameMove, move_2: GameMove, score_manager, mark: int = 0) -> int:
+        """
+        Process a round where both players made valid moves.
+
+        Args:
+            mark: Instrumentation timestamp to time the first phase from
+
+        Returns:
+            The round result
+        """
+        instrumentation = self.instrumentation
+
         # Display the moves
         self.output_provider.output_round_moves(player_1, player_2, move_1, move_2)
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_OUTPUT, mark)
 
-        # Get interaction description
+        # Evaluate the rules: the interaction description and the result
         interaction_description = self.rules.get_interaction_description(move_1, move_2)
+        round_result = self.rules.determine_result(move_1, move_2)
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_RULES, mark)
+
         self.output_provider.output_round_description(interaction_description)
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_OUTPUT, mark)
 
-        # Determine result and update scores
-        round_result = self.rules.determine_result(move_1, move_2)
+        # Update scores and display the leaderboard
         score_manager.update_scores_for_round(round_result)
-        score_manager.return_leaderboard()
\ No newline at end of file
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_SCORING, mark)
+        score_manager.return_leaderboard()
+        if instrumentation is not None:
+            mark = instrumentation.mark(PHASE_OUTPUT, mark)
+
+        # Let adaptive players learn from the round
+        player_1.observe_round(move_1, move_2)
+        player_2.observe_round(move_2, move_1)
+        if instrumentation is not None:
+            instrumentation.mark(PHASE_LEARNING, mark)
+        return round_result
\ No newline at end of file
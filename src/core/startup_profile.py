@@ -0,0 +1,174 @@
+"""
+Startup import profiling.
+
+Runs the entry point's startup path - every import and the game construction
+that happen before the first prompt - in fresh interpreters with
+``-X importtime``, then aggregates the per-module timings into a report:
+the slowest modules, the time per top-level package and the time spent in
+the application's own modules, which is what the import budget applies to.
+
+Run from the repository root:
+    python game_paper_scissors_rock.py --profile-startup [PATH]
+    python -m src.core.startup_profile --runs 5 --output startup_profile.json
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from src.constants import GameMessages, StartupConstants
+
+# What the entry point does before its first prompt
+STARTUP_CODE = "import game_paper_scissors_rock as entry; entry.create_game()"
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_IMPORT_TIME_PREFIX = "import time:"
+
+
+class ModuleImport(NamedTuple):
+    """One line of ``-X importtime`` output; times are in microseconds."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(text: str) -> List[ModuleImport]:
+    """
+    Parse ``-X importtime`` output, skipping its header and any other stderr lines.
+
+    Args:
+        text: The interpreter's stderr
+
+    Returns:
+        The imports in the order they finished
+    """
+    imports = []
+    for line in text.splitlines():
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(_IMPORT_TIME_PREFIX):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        package = fields[2].rstrip()
+        name = package.lstrip()
+        # The name is indented by two spaces per level of nesting, after one separating space
+        depth = (len(package) - len(name) - 1) // 2
+        imports.append(ModuleImport(name, int(fields[0]), int(fields[1]), depth))
+    return imports
+
+
+def is_application_module(name: str) -> bool:
+    """Return True for the game's own modules (the src package and the top-level game modules)."""
+    return name == "src" or name.startswith("src.") or name == "game" or name.startswith("game_")
+
+
+def summarise(runs: Iterable[List[ModuleImport]], top: int = StartupConstants.REPORT_TOP_MODULES) -> Dict:
+    """
+    Aggregate the imports of one or more runs.
+
+    Each module keeps its fastest time across the runs, so one slow run
+    (a cold disk cache, a busy machine) does not skew the report.
+
+    Args:
+        runs: Parsed imports of each run
+        top: Number of modules to list, slowest (by self time) first
+
+    Returns:
+        JSON-serialisable report
+    """
+    fastest: Dict[str, ModuleImport] = {}
+    for imports in runs:
+        for module in imports:
+            known = fastest.get(module.name)
+            if known is None or module.self_us < known.self_us:
+                fastest[module.name] = module
+
+    packages: Dict[str, int] = {}
+    for module in fastest.values():
+        package = module.name.partition(".")[0]
+        packages[package] = packages.get(package, 0) + module.self_us
+
+    modules = sorted(fastest.values(), key=lambda module: module.self_us, reverse=True)
+    return {
+        "total_us": sum(module.self_us for module in modules),
+        "application_us": sum(module.self_us for module in modules if is_application_module(module.name)),
+        "module_count": len(modules),
+        "modules": [{"name": module.name, "self_us": module.self_us, "cumulative_us": module.cumulative_us}
+                    for module in modules[:top]],
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        "imported": sorted(fastest),
+    }
+
+
+def profile_startup(runs: int = StartupConstants.DEFAULT_RUNS, code: str = STARTUP_CODE,
+                    python: Optional[str] = None, top: int = StartupConstants.REPORT_TOP_MODULES) -> Dict:
+    """
+    Profile the startup path in fresh interpreters.
+
+    Args:
+        runs: Number of interpreters to profile
+        code: The startup code to run
+        python: Interpreter to profile, defaults to the current one
+        top: Number of modules to list in the report
+
+    Returns:
+        The report from summarise()
+
+    Raises:
+        RuntimeError: If the startup code fails
+    """
+    parsed_runs = []
+    for _ in range(runs):
+        completed = subprocess.run([python or sys.executable, "-X", "importtime", "-c", code],
+                                   cwd=PROJECT_ROOT, stdin=subprocess.DEVNULL,
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(GameMessages.STARTUP_PROFILE_FAILED.format(error=completed.stderr.strip()))
+        parsed_runs.append(parse_import_times(completed.stderr))
+    return summarise(parsed_runs, top)
+
+
+def format_report(report: Dict) -> str:
+    """Return the report as a table of the slowest modules followed by the totals."""
+    lines = [f"{'Module':<48}{'self us':>10}{'cumul. us':>12}"]
+    for module in report["modules"]:
+        lines.append(f"{module['name']:<48}{module['self_us']:>10}{module['cumulative_us']:>12}")
+    lines.append("")
+    lines.append(f"{report['module_count']} modules imported in {report['total_us'] / 1000:.1f} ms, "
+                 f"{report['application_us'] / 1000:.1f} ms in the application "
+                 f"(budget {StartupConstants.APPLICATION_IMPORT_BUDGET_US / 1000:.1f} ms)")
+    return "\n".join(lines)
+
+
+def save_report(report: Dict, path: str) -> None:
+    import json
+
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+        report_file.write("\n")
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Profile the imports made before the game's first prompt")
+    parser.add_argument("output", nargs="?", default=StartupConstants.DEFAULT_REPORT_PATH,
+                        help="Report JSON file (default %(default)s)")
+    parser.add_argument("--runs", type=int, default=StartupConstants.DEFAULT_RUNS,
+                        help="Fresh interpreters to profile (default %(default)s)")
+    parser.add_argument("--top", type=int, default=StartupConstants.REPORT_TOP_MODULES,
+                        help="Modules to list (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    report = profile_startup(args.runs, top=args.top)
+    print(format_report(report))
+    save_report(report, args.output)
+    print(f"\nReport saved to {args.output}")
+    return 0 if report["application_us"] <= StartupConstants.APPLICATION_IMPORT_BUDGET_US else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
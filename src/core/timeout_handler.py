@@ -5,12 +5,16 @@ This module provides a clean way to handle player timeouts in a consistent
 manner across all game types.
 """
 
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 from enum import Enum
 
 from src.core.game_move import GameMove
+from src.core.instrumentation import RoundInstrumentation, PHASE_TIMEOUT
 from src.players.player import Player
-from src.constants import GameMessages, ScoringConstants
+from src.constants import ScoringConstants
+
+if TYPE_CHECKING:
+    from src.core.deadline_scheduler import DeadlineScheduler
 
 
 class TimeoutResult(Enum):
@@ -21,6 +25,14 @@ class TimeoutResult(Enum):
     PLAYER_2_TIMEOUT = "player_2_timeout"
 
 
+# Round result awarded for each timeout outcome (a timed-out player forfeits the round)
+TIMEOUT_ROUND_RESULTS = {
+    TimeoutResult.BOTH_TIMEOUT: ScoringConstants.DRAW,
+    TimeoutResult.PLAYER_1_TIMEOUT: ScoringConstants.PLAYER_2_WIN,
+    TimeoutResult.PLAYER_2_TIMEOUT: ScoringConstants.PLAYER_1_WIN,
+}
+
+
 class TimeoutHandler:
     """
     Handles timeout logic for game rounds.
@@ -29,8 +41,48 @@ class TimeoutHandler:
     duplicated across different game methods.
     """
 
-    def __init__(self, output_provider):
+    def __init__(self, output_provider, deadline_scheduler: Optional["DeadlineScheduler"] = None,
+                 instrumentation: Optional[RoundInstrumentation] = None, metrics=None):
         self.output_provider = output_provider
+        # Created when the first timed move starts, so untimed games never load the scheduler
+        self.deadline_scheduler = deadline_scheduler
+        self.instrumentation = instrumentation
+        self.metrics = metrics
+
+    def start_move_deadline(self, player: Player) -> None:
+        """
+        Start the player's move deadline, if the player has a time limit.
+
+        Args:
+            player: The player about to be asked for a move
+        """
+        time_limit = getattr(player, "time_limit", None)
+        if isinstance(time_limit, (int, float)) and time_limit > 0:
+            if self.deadline_scheduler is None:
+                from src.core.deadline_scheduler import DeadlineScheduler
+                self.deadline_scheduler = DeadlineScheduler()
+            scheduler = self.deadline_scheduler
+            scheduler.set_deadline(player, time_limit)
+            # Each prompt gets the full time limit, so a re-prompt after invalid input restarts it
+            player.attach_move_deadline(lambda: scheduler.set_deadline(player, time_limit))
+
+    def check_move_deadline(self, player: Player, move: Optional[GameMove]) -> Optional[GameMove]:
+        """
+        Clear the player's move deadline and apply it to the move they made.
+
+        Args:
+            player: The player who made the move
+            move: The move made (None if the input provider already timed out)
+
+        Returns:
+            The move, or None if it was made after the deadline (a forfeit)
+        """
+        if self.deadline_scheduler is None:
+            return move
+        player.attach_move_deadline(None)
+        expired = self.deadline_scheduler.is_expired(player)
+        self.deadline_scheduler.cancel(player)
+        return None if expired else move
 
     def handle_timeout(self, player_1: Player, player_2: Player,
                        move_1: Optional[GameMove], move_2: Optional[GameMove],
@@ -49,6 +101,22 @@ class TimeoutHandler:
             Tuple of (TimeoutResult, score_update)
             score_update is None if no timeout occurred
         """
+        if self.instrumentation is None:
+            outcome = self._handle_timeout(player_1, player_2, move_1, move_2, score_manager)
+        else:
+            mark = self.instrumentation.start()
+            try:
+                outcome = self._handle_timeout(player_1, player_2, move_1, move_2, score_manager)
+            finally:
+                self.instrumentation.mark(PHASE_TIMEOUT, mark)
+        if self.metrics is not None and outcome[0] is not TimeoutResult.BOTH_VALID:
+            self.metrics.record_timeout(outcome[0])
+        return outcome
+
+    def _handle_timeout(self, player_1: Player, player_2: Player,
+                        move_1: Optional[GameMove], move_2: Optional[GameMove],
+                        score_manager) -> Tuple[TimeoutResult, Optional[int]]:
+        """Dispatch to the handler for the timeout case, if any."""
         if move_1 is None and move_2 is None:
             return self._handle_both_timeout(score_manager)
         elif move_1 is None:
@@ -58,9 +126,29 @@ class TimeoutHandler:
         else:
             return TimeoutResult.BOTH_VALID, None
 
+    @staticmethod
+    def classify(move_1: Optional[GameMove], move_2: Optional[GameMove]) -> TimeoutResult:
+        """
+        Classify a pair of moves without producing any output or score updates.
+
+        Args:
+            move_1: The first player's move (None if timed out)
+            move_2: The second player's move (None if timed out)
+
+        Returns:
+            The TimeoutResult describing which players (if any) timed out
+        """
+        if move_1 is None and move_2 is None:
+            return TimeoutResult.BOTH_TIMEOUT
+        elif move_1 is None:
+            return TimeoutResult.PLAYER_1_TIMEOUT
+        elif move_2 is None:
+            return TimeoutResult.PLAYER_2_TIMEOUT
+        return TimeoutResult.BOTH_VALID
+
     def _handle_both_timeout(self, score_manager) -> Tuple[TimeoutResult, int]:
         """Handle case where both players timed out."""
-        print(GameMessages.BOTH_TIMEOUT)
+        self.output_provider.output_both_timeout()
         score_manager.update_scores_for_round(ScoringConstants.DRAW)
         score_manager.return_leaderboard()
         return TimeoutResult.BOTH_TIMEOUT, ScoringConstants.DRAW
@@ -68,10 +156,7 @@ class TimeoutHandler:
     def _handle_player_1_timeout(self, player_1: Player, player_2: Player,
                                  score_manager) -> Tuple[TimeoutResult, int]:
         """Handle case where player 1 timed out."""
-        print(GameMessages.PLAYER_TIMEOUT.format(
-            loser=player_1.get_name(),
-            winner=player_2.get_name()
-        ))
+        self.output_provider.output_player_timeout(player_1.get_name(), player_2.get_name())
         score_manager.update_scores_for_round(ScoringConstants.PLAYER_2_WIN)
         score_manager.return_leaderboard()
         return TimeoutResult.PLAYER_1_TIMEOUT, ScoringConstants.PLAYER_2_WIN
@@ -79,10 +164,7 @@ class TimeoutHandler:
     def _handle_player_2_timeout(self, player_1: Player, player_2: Player,
                                  score_manager) -> Tuple[TimeoutResult, int]:
         """Handle case where player 2 timed out."""
-        print(GameMessages.PLAYER_TIMEOUT.format(
-            loser=player_2.get_name(),
-            winner=player_1.get_name()
-        ))
+        self.output_provider.output_player_timeout(player_2.get_name(), player_1.get_name())
         score_manager.update_scores_for_round(ScoringConstants.PLAYER_1_WIN)
         score_manager.return_leaderboard()
         return TimeoutResult.PLAYER_2_TIMEOUT, ScoringConstants.PLAYER_1_WIN
\ No newline at end of file
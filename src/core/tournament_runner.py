@@ -0,0 +1,188 @@
+"""
+Parallel round-robin tournaments between bot strategies.
+
+Every pairing of registered Player strategy classes is played for a number
+of seeds, each match being an independent headless simulation. Matches are
+spread across a ProcessPoolExecutor and the per-match results are merged
+into a ranked standings table.
+"""
+
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Type
+
+from src.core.headless_simulator import HeadlessSimulator
+from src.games.rps.rps_rules import RPSRules
+from src.players.player import Player
+from src.constants import DisplayConstants, GameMessages, TournamentConstants
+
+
+class MatchJob(NamedTuple):
+    """A single match to be played by a worker process."""
+    strategy_1: str
+    player_class_1: Type[Player]
+    strategy_2: str
+    player_class_2: Type[Player]
+    seed: int
+    rounds: int
+
+
+class MatchResult(NamedTuple):
+    """The outcome of a single match."""
+    strategy_1: str
+    strategy_2: str
+    seed: int
+    player_1_round_wins: int
+    player_2_round_wins: int
+    draws: int
+    player_1_score: float
+    player_2_score: float
+
+
+class StandingsEntry(NamedTuple):
+    """A strategy's aggregate record across the tournament."""
+    strategy: str
+    points: float
+    matches_won: int
+    matches_drawn: int
+    matches_lost: int
+    round_wins: int
+    round_losses: int
+
+
+class TournamentResult(NamedTuple):
+    """Ranked standings plus throughput figures for a tournament run."""
+    standings: List[StandingsEntry]
+    matches: List[MatchResult]
+    workers: int
+    rounds_played: int
+    elapsed_seconds: float
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds_played / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def play_match(job: MatchJob) -> MatchResult:
+    """
+    Play one seeded match headlessly. Runs inside a worker process.
+
+    Strategy classes are constructed like ComputerPlayer, as (game, player_id);
+    there is no game in a headless match, so None is passed.
+    """
+    random.seed(job.seed)
+    player_1 = job.player_class_1(None, 1)
+    player_2 = job.player_class_2(None, 2)
+    result = HeadlessSimulator(RPSRules()).simulate_rounds(job.rounds, player_1, player_2)
+    return MatchResult(
+        strategy_1=job.strategy_1,
+        strategy_2=job.strategy_2,
+        seed=job.seed,
+        player_1_round_wins=result.player_1_wins,
+        player_2_round_wins=result.player_2_wins,
+        draws=result.draws,
+        player_1_score=result.player_1_score,
+        player_2_score=result.player_2_score
+    )
+
+
+class TournamentRunner:
+    """
+    Schedules a round-robin tournament across a pool of worker processes.
+    """
+
+    def __init__(self, strategies: Dict[str, Type[Player]],
+                 rounds_per_match: int = TournamentConstants.DEFAULT_ROUNDS_PER_MATCH,
+                 seeds_per_pairing: int = TournamentConstants.DEFAULT_SEEDS_PER_PAIRING,
+                 base_seed: int = 0):
+        """
+        Args:
+            strategies: Registry of strategy name to Player class
+            rounds_per_match: Rounds played in every match
+            seeds_per_pairing: Number of differently seeded matches per pairing
+            base_seed: First seed; match seeds are consecutive from here
+        """
+        if len(strategies) < 2:
+            raise ValueError(GameMessages.TOO_FEW_STRATEGIES.format(count=len(strategies)))
+        self.strategies = dict(strategies)
+        self.rounds_per_match = rounds_per_match
+        self.seeds_per_pairing = seeds_per_pairing
+        self.base_seed = base_seed
+
+    def schedule(self) -> List[MatchJob]:
+        """Return every match of the round robin, for every seed."""
+        seeds = itertools.count(self.base_seed)
+        return [MatchJob(name_1, self.strategies[name_1], name_2, self.strategies[name_2],
+                         next(seeds), self.rounds_per_match)
+                for name_1, name_2 in itertools.combinations(self.strategies, 2)
+                for _ in range(self.seeds_per_pairing)]
+
+    def run(self, workers: int = None) -> TournamentResult:
+        """
+        Play the tournament.
+
+        Args:
+            workers: Number of worker processes, defaults to the machine's core count
+
+        Returns:
+            The ranked TournamentResult
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        jobs = self.schedule()
+        chunk_size = max(1, len(jobs) // (workers * 4))
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            matches = list(executor.map(play_match, jobs, chunksize=chunk_size))
+        elapsed = time.perf_counter() - start
+
+        return TournamentResult(
+            standings=self.rank(matches),
+            matches=matches,
+            workers=workers,
+            rounds_played=len(jobs) * self.rounds_per_match,
+            elapsed_seconds=elapsed
+        )
+
+    def rank(self, matches: List[MatchResult]) -> List[StandingsEntry]:
+        """Merge match results into standings, ranked by points then round difference."""
+        records = {name: [0.0, 0, 0, 0, 0, 0] for name in self.strategies}
+
+        for match in matches:
+            for name, own_score, other_score, own_wins, other_wins in (
+                    (match.strategy_1, match.player_1_score, match.player_2_score,
+                     match.player_1_round_wins, match.player_2_round_wins),
+                    (match.strategy_2, match.player_2_score, match.player_1_score,
+                     match.player_2_round_wins, match.player_1_round_wins)):
+                record = records[name]
+                if own_score > other_score:
+                    record[0] += TournamentConstants.MATCH_WIN_POINTS
+                    record[1] += 1
+                elif own_score < other_score:
+                    record[3] += 1
+                else:
+                    record[0] += TournamentConstants.MATCH_DRAW_POINTS
+                    record[2] += 1
+                record[4] += own_wins
+                record[5] += other_wins
+
+        standings = [StandingsEntry(name, *record) for name, record in records.items()]
+        standings.sort(key=lambda entry: (entry.points, entry.round_wins - entry.round_losses), reverse=True)
+        return standings
+
+    @staticmethod
+    def format_standings(standings: List[StandingsEntry]) -> str:
+        """Render the standings as a text table."""
+        row = DisplayConstants.STANDINGS_ROW_FORMAT
+        lines = [row.format(rank="#", name=DisplayConstants.PLAYER_COLUMN_HEADER, points="Points",
+                            won="W", drawn="D", lost="L", round_wins="Rounds W-L")]
+        for rank, entry in enumerate(standings, start=1):
+            lines.append(row.format(rank=rank, name=entry.strategy, points=entry.points,
+                                    won=entry.matches_won, drawn=entry.matches_drawn,
+                                    lost=entry.matches_lost,
+                                    round_wins=f"{entry.round_wins}-{entry.round_losses}"))
+        return "\n".join(lines)
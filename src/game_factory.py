@@ -1,9 +1,11 @@
-from typing import Type, Dict
+from typing import Type, Union
 
 from game import Game
+from src.core.plugin_registry import PluginRegistry
+from src.games.rps.rps_constants import RPSConstants
 from src.io_utils.input_provider import InputProvider
 from src.io_utils.output_provider import OutputProvider
-from src.constants import GameMessages
+from src.constants import GameMessages, PluginConstants
 
 
 class GameFactory:
@@ -12,9 +14,13 @@ class GameFactory:
 
     This factory manages the creation of different game types and ensures
     that appropriate input/output providers are used for each game.
+    Game classes are imported the first time they are created, and games
+    from other packages are found through the "rps_arcade.games" entry points.
     """
 
-    _games_registry: Dict[str, Type[Game]] = {}
+    _games_registry = PluginRegistry(PluginConstants.GAMES_GROUP, {
+        RPSConstants.GAME_TYPE: "src.games.rps.rps_game:RPSGame"
+    })
 
     @classmethod
     def create_game(cls, game_type: str, input_provider: InputProvider, output_provider: OutputProvider) -> Game:
@@ -35,16 +41,16 @@ class GameFactory:
         if game_type not in cls._games_registry:
             raise ValueError(GameMessages.UNSUPPORTED_GAME_TYPE.format(game_type=game_type))
 
-        game_class = cls._games_registry[game_type]
+        game_class = cls._games_registry.get(game_type)
         return game_class(input_provider, output_provider)
 
     @classmethod
-    def register_game(cls, game_type: str, game_class: Type[Game]):
+    def register_game(cls, game_type: str, game_class: Union[Type[Game], str]):
         """
         Register a new game type with the factory.
 
         Args:
             game_type: The key for this game type
-            game_class: The Game subclass to register
+            game_class: The Game subclass to register, or its import path to load it lazily
         """
-        cls._games_registry[game_type] = game_class
\ No newline at end of file
+        cls._games_registry.register(game_type, game_class)
\ No newline at end of file
@@ -1,8 +1,6 @@
 from enum import Enum
 
 from game import Game
-from src.players.computer_player import ComputerPlayer
-from src.players.human_player import HumanPlayer
 from src.players.player import Player
 from src.constants import GameConstants, GameMessages
 
@@ -24,6 +22,10 @@ class GameMode(Enum):
             ))
 
     def initialise_players_in_game(self, game: Game) -> [Player, Player]:
+        # Imported here so that showing the mode prompt does not load the player implementations
+        from src.players.computer_player import ComputerPlayer
+        from src.players.human_player import HumanPlayer
+
         players = []
         for i in range(self.humans):
             players.append(HumanPlayer(game, i + 1))
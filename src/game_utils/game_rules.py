@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from array import array
 from typing import Any, Dict, List, TypeVar, Generic
 
+from src.game_utils.outcome_table import check_move_ordinals
+
 T = TypeVar('T')  # Generic type for gestures
 
 
@@ -44,4 +47,43 @@ class GameRules(Generic[T], ABC):
     @abstractmethod
     def get_valid_moves(self) -> list[T]:
         """Return the list of valid moves for the game."""
-        pass
\ No newline at end of file
+        pass
+
+    def determine_results_batch(self, moves_1, moves_2):
+        """
+        Determine the results of many move pairs at once.
+
+        Moves are given as integer ordinals, i.e. positions in get_valid_moves().
+        This default builds the result matrix from determine_result on every call;
+        implementations backed by a compiled table should override it. numpy is
+        used when installed; otherwise each pair is decided with determine_result.
+
+        Args:
+            moves_1: Integer array-like of the first players' move ordinals
+            moves_2: Integer array-like of the second players' move ordinals
+
+        Returns:
+            A numpy int8 array with 1 where moves_1 wins, -1 where moves_2 wins, 0 for draws
+            (an array('b') without numpy)
+
+        Raises:
+            IndexError: If an ordinal is not the position of a move
+        """
+        moves = self.get_valid_moves()
+        try:
+            import numpy as np
+        except ImportError:
+            ordinals_1, ordinals_2 = list(moves_1), list(moves_2)
+            check_move_ordinals(ordinals_1, len(moves))
+            check_move_ordinals(ordinals_2, len(moves))
+            return array("b", [self.determine_result(moves[move_1], moves[move_2])
+                               for move_1, move_2 in zip(ordinals_1, ordinals_2)])
+
+        ordinals_1, ordinals_2 = np.asarray(moves_1, dtype=np.intp), np.asarray(moves_2, dtype=np.intp)
+        check_move_ordinals(ordinals_1, len(moves))
+        check_move_ordinals(ordinals_2, len(moves))
+        result_matrix = np.array(
+            [[self.determine_result(move_1, move_2) for move_2 in moves] for move_1 in moves],
+            dtype=np.int8
+        )
+        return result_matrix[ordinals_1, ordinals_2]
\ No newline at end of file
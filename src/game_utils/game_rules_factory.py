@@ -1,9 +1,9 @@
-from typing import Type, Dict
+from typing import Type, Union
 
+from src.core.plugin_registry import PluginRegistry
 from src.game_utils.game_rules import GameRules
-from src.games.rps.rps_rules import RPSRules
 from src.games.rps.rps_constants import RPSConstants
-from src.constants import GameMessages
+from src.constants import GameMessages, PluginConstants
 
 
 class GameRulesFactory:
@@ -11,11 +11,12 @@ class GameRulesFactory:
     Factory class for creating game rules instances.
 
     This factory supports creating different rule sets for various games.
+    Rules classes are imported the first time they are requested.
     """
 
-    _rules_registry: Dict[str, Type[GameRules]] = {
-        RPSConstants.GAME_TYPE: RPSRules
-    }
+    _rules_registry = PluginRegistry(PluginConstants.RULES_GROUP, {
+        RPSConstants.GAME_TYPE: "src.games.rps.rps_rules:RPSRules"
+    })
 
     @classmethod
     def create_rules(cls, game_type: str) -> GameRules:
@@ -34,16 +35,16 @@ class GameRulesFactory:
         if game_type not in cls._rules_registry:
             raise ValueError(GameMessages.UNSUPPORTED_GAME_TYPE.format(game_type=game_type))
 
-        rules_class = cls._rules_registry[game_type]
+        rules_class = cls._rules_registry.get(game_type)
         return rules_class()
 
     @classmethod
-    def register_rules(cls, game_type: str, rules_class: Type[GameRules]):
+    def register_rules(cls, game_type: str, rules_class: Union[Type[GameRules], str]):
         """
         Register a new game rules type with the factory.
 
         Args:
             game_type: The key for this rules type
-            rules_class: The GameRules subclass to register
+            rules_class: The GameRules subclass to register, or its import path to load it lazily
         """
-        cls._rules_registry[game_type] = rules_class
\ No newline at end of file
+        cls._rules_registry.register(game_type, rules_class)
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Compiled outcome tables for move-based games.
+
+Rules are declared as a mapping of each move to the moves it beats (and the
+verb used to describe the win). This module compiles that declaration once
+into dense tables indexed by move ordinal, so that both the round result
+and its description are a single list lookup regardless of how many moves
+the game has (e.g. Rock-Paper-Scissors-Lizard-Spock or RPS-101).
+"""
+
+from array import array
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar
+
+from src.constants import GameMessages, ScoringConstants
+
+T = TypeVar('T')  # Generic type for moves
+
+
+def check_move_ordinals(ordinals, move_count: int) -> None:
+    """
+    Check that every ordinal is the position of one of move_count moves.
+
+    Negative ordinals are rejected rather than counted from the end, as list
+    and numpy indexing would.
+
+    Args:
+        ordinals: List or numpy array of move ordinals
+        move_count: Number of moves in the game
+
+    Raises:
+        IndexError: If an ordinal is out of range
+    """
+    if len(ordinals) == 0:
+        return
+    if hasattr(ordinals, "min"):
+        lowest, highest = int(ordinals.min()), int(ordinals.max())
+    else:
+        lowest, highest = min(ordinals), max(ordinals)
+    if lowest < 0 or highest >= move_count:
+        raise IndexError(GameMessages.INVALID_MOVE_ORDINAL.format(
+            ordinal=lowest if lowest < 0 else highest, max=move_count - 1
+        ))
+
+
+class OutcomeTable(Generic[T]):
+    """
+    Dense N x N payoff and description tables for a set of moves.
+
+    Each move is assigned an ordinal (its position in the move sequence), and
+    the result of move_1 against move_2 is stored at
+    ``ordinal(move_1) * move_count + ordinal(move_2)``.
+    """
+
+    def __init__(self, moves: Sequence[T], victory_rules: Dict[T, Dict[T, str]]):
+        """
+        Compile the outcome tables.
+
+        Args:
+            moves: All valid moves, in ordinal order
+            victory_rules: Maps each move to the moves it beats and the action verb used
+
+        Raises:
+            ValueError: If two moves are both declared to beat each other
+        """
+        self.moves: List[T] = list(moves)
+        self.move_count = len(self.moves)
+        self.ordinals: Dict[T, int] = {move: index for index, move in enumerate(self.moves)}
+
+        # None marks a pair with no rule defined
+        self.results: List[Optional[int]] = [None] * (self.move_count * self.move_count)
+        self.descriptions: List[str] = [""] * (self.move_count * self.move_count)
+
+        for move_1 in self.moves:
+            for move_2 in self.moves:
+                index = self.ordinals[move_1] * self.move_count + self.ordinals[move_2]
+                self.results[index], self.descriptions[index] = self._compile_pair(
+                    move_1, move_2, victory_rules
+                )
+
+    @staticmethod
+    def _compile_pair(move_1: T, move_2: T, victory_rules: Dict[T, Dict[T, str]]):
+        """Return the (result, description) pair for move_1 against move_2."""
+        if move_1 == move_2:
+            return ScoringConstants.DRAW, GameMessages.DRAW_DESCRIPTION.format(
+                move1=move_1, move2=move_2
+            )
+
+        move_1_action = victory_rules.get(move_1, {}).get(move_2)
+        move_2_action = victory_rules.get(move_2, {}).get(move_1)
+
+        if move_1_action is not None and move_2_action is not None:
+            raise ValueError(GameMessages.CONFLICTING_RULE.format(move1=move_1, move2=move_2))
+        if move_1_action is not None:
+            return ScoringConstants.PLAYER_1_WIN, GameMessages.WIN_DESCRIPTION.format(
+                winner=move_1, action=move_1_action, loser=move_2
+            )
+        if move_2_action is not None:
+            return ScoringConstants.PLAYER_2_WIN, GameMessages.WIN_DESCRIPTION.format(
+                winner=move_2, action=move_2_action, loser=move_1
+            )
+        return None, GameMessages.NO_DESCRIPTION.format(move1=move_1, move2=move_2)
+
+    def result_matrix(self):
+        """
+        Return the results as an N x N numpy int8 array, or as a list of row lists without numpy.
+
+        Raises:
+            ValueError: If any pair of moves has no rule defined
+        """
+        if None in self.results:
+            index = self.results.index(None)
+            raise ValueError(GameMessages.NO_RULE_DEFINED.format(
+                move1=self.moves[index // self.move_count],
+                move2=self.moves[index % self.move_count]
+            ))
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.results[row:row + self.move_count]
+                    for row in range(0, len(self.results), self.move_count)]
+        return np.array(self.results, dtype=np.int8).reshape(self.move_count, self.move_count)
+
+    def results_batch(self, ordinals_1, ordinals_2) -> array:
+        """
+        Look up the results of many pairs of move ordinals without numpy.
+
+        Returns:
+            An array('b') with 1 where the first move wins, -1 where the second wins, 0 for draws
+
+        Raises:
+            IndexError: If an ordinal is not the position of a move
+            ValueError: If no rule is defined between a pair of moves
+        """
+        results, move_count = self.results, self.move_count
+        ordinals_1, ordinals_2 = list(ordinals_1), list(ordinals_2)
+        check_move_ordinals(ordinals_1, move_count)
+        check_move_ordinals(ordinals_2, move_count)
+        pairs = list(zip(ordinals_1, ordinals_2))
+        batch = [results[ordinal_1 * move_count + ordinal_2] for ordinal_1, ordinal_2 in pairs]
+        if None in batch:
+            ordinal_1, ordinal_2 = pairs[batch.index(None)]
+            raise ValueError(GameMessages.NO_RULE_DEFINED.format(
+                move1=self.moves[ordinal_1], move2=self.moves[ordinal_2]
+            ))
+        return array("b", batch)
+
+    def result(self, move_1: T, move_2: T) -> int:
+        """
+        Look up the result of move_1 against move_2.
+
+        Returns:
+            1 if move_1 wins, -1 if move_2 wins, 0 if draw
+
+        Raises:
+            ValueError: If no rule is defined between the two moves
+        """
+        round_result = self.results[self.ordinals[move_1] * self.move_count + self.ordinals[move_2]]
+        if round_result is None:
+            raise ValueError(GameMessages.NO_RULE_DEFINED.format(move1=move_1, move2=move_2))
+        return round_result
+
+    def description(self, move_1: T, move_2: T) -> str:
+        """Look up the pre-rendered description of move_1 against move_2."""
+        return self.descriptions[self.ordinals[move_1] * self.move_count + self.ordinals[move_2]]
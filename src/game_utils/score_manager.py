@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from array import array
 from game import Game
-from src.constants import ScoringConstants, DisplayConstants
+from typing import Optional
+from src.constants import ScoringConstants, DisplayConstants, GameMessages
 
 
 class ScoreManager(ABC):
@@ -12,6 +14,8 @@ class ScoreManager(ABC):
     strategies to be implemented without modifying the game logic.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def return_leaderboard(self) -> None:
         """Display the current leaderboard."""
@@ -27,6 +31,19 @@ class ScoreManager(ABC):
         """
         pass
 
+    def update_scores_for_rounds(self, round_results) -> None:
+        """
+        Update scores for a sequence of round results, in order.
+
+        Implementations may override this with a vectorized form; the result
+        must be identical to calling update_scores_for_round for each entry.
+
+        Args:
+            round_results: Iterable of round results (1, -1 or 0)
+        """
+        for round_result in round_results:
+            self.update_scores_for_round(round_result)
+
     @abstractmethod
     def return_game_result(self) -> None:
         """Display the final game result."""
@@ -45,6 +62,38 @@ class ScoreManager(ABC):
         """
         pass
 
+    def export_state(self) -> tuple:
+        """
+        Return the scoring state as a flat tuple of numbers.
+
+        Together with restore_state this lets a manager be checkpointed, e.g.
+        by a match log index, and later rebuilt without replaying every round.
+        The layout is specific to each implementation. Snapshots are optional:
+        managers that do not support them need not override either method.
+
+        Raises:
+            NotImplementedError: If the manager does not support snapshots
+        """
+        raise NotImplementedError(GameMessages.SNAPSHOTS_UNSUPPORTED.format(manager=type(self).__name__))
+
+    def restore_state(self, state: tuple) -> None:
+        """
+        Replace the scoring state with one returned by export_state.
+
+        Args:
+            state: A tuple from export_state on a manager of the same type
+
+        Raises:
+            NotImplementedError: If the manager does not support snapshots
+        """
+        raise NotImplementedError(GameMessages.SNAPSHOTS_UNSUPPORTED.format(manager=type(self).__name__))
+
+    @classmethod
+    def supports_snapshots(cls) -> bool:
+        """Return True if the manager overrides both export_state and restore_state."""
+        return (cls.export_state is not ScoreManager.export_state
+                and cls.restore_state is not ScoreManager.restore_state)
+
 
 class StandardScoreManager(ScoreManager):
     """
@@ -71,6 +120,33 @@ class StandardScoreManager(ScoreManager):
             self._scores[self._player_1_name] += ScoringConstants.STANDARD_DRAW_POINTS
             self._scores[self._player_2_name] += ScoringConstants.STANDARD_DRAW_POINTS
 
+    def update_scores_for_rounds(self, round_results) -> None:
+        """Update scores for an array of round results by counting each outcome (with numpy if installed)."""
+        try:
+            import numpy as np
+        except ImportError:
+            round_results = list(round_results)
+            player_1_wins = round_results.count(ScoringConstants.PLAYER_1_WIN)
+            player_2_wins = round_results.count(ScoringConstants.PLAYER_2_WIN)
+            round_count = len(round_results)
+        else:
+            round_results = np.asarray(round_results)
+            player_1_wins = int(np.count_nonzero(round_results == ScoringConstants.PLAYER_1_WIN))
+            player_2_wins = int(np.count_nonzero(round_results == ScoringConstants.PLAYER_2_WIN))
+            round_count = round_results.size
+        draws = round_count - player_1_wins - player_2_wins
+
+        self._scores[self._player_1_name] += (player_1_wins * ScoringConstants.STANDARD_WIN_POINTS +
+                                              draws * ScoringConstants.STANDARD_DRAW_POINTS)
+        self._scores[self._player_2_name] += (player_2_wins * ScoringConstants.STANDARD_WIN_POINTS +
+                                              draws * ScoringConstants.STANDARD_DRAW_POINTS)
+
+    def export_state(self) -> tuple:
+        return self._scores[self._player_1_name], self._scores[self._player_2_name]
+
+    def restore_state(self, state: tuple) -> None:
+        self._scores[self._player_1_name], self._scores[self._player_2_name] = state
+
     def return_game_result(self) -> None:
         winner = max(self._scores, key=self._scores.get)
         winner_score = self._scores[winner]
@@ -148,6 +224,72 @@ class StreakScoreManager(ScoreManager):
             self._player_2_streak = 0
             # No points awarded for draws
 
+    def update_scores_for_rounds(self, round_results) -> None:
+        """
+        Update scores and streaks for an array of round results without a per-round loop.
+
+        Without numpy this falls back to updating round by round.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            super().update_scores_for_rounds(round_results)
+            return
+
+        round_results = np.asarray(round_results)
+        points, self._player_1_streak = self._streak_points(
+            round_results == ScoringConstants.PLAYER_1_WIN, self._player_1_streak
+        )
+        self._scores[self._player_1_name] += points
+        points, self._player_2_streak = self._streak_points(
+            round_results == ScoringConstants.PLAYER_2_WIN, self._player_2_streak
+        )
+        self._scores[self._player_2_name] += points
+
+    @staticmethod
+    def _streak_points(wins, initial_streak: int):
+        """
+        Score a boolean win mask using run lengths of consecutive wins.
+
+        Args:
+            wins: numpy boolean array, True where the player won the round
+            initial_streak: The player's streak before the first round in the mask
+
+        Returns:
+            Tuple of (points awarded, streak after the last round)
+        """
+        import numpy as np
+
+        if wins.size == 0:
+            return 0, initial_streak
+
+        positions = np.arange(1, wins.size + 1)
+        # Position of the most recent non-win at or before each round (0 if none yet)
+        last_break = np.maximum.accumulate(np.where(wins, 0, positions))
+        streaks = positions - last_break
+        # Wins before the first non-win extend the streak carried in
+        streaks[last_break == 0] += initial_streak
+
+        points_by_streak = np.array([
+            ScoringConstants.STREAK_DRAW_POINTS,
+            ScoringConstants.STREAK_FIRST_WIN_POINTS,
+            ScoringConstants.STREAK_SECOND_WIN_POINTS,
+            ScoringConstants.STREAK_THIRD_PLUS_WIN_POINTS
+        ])
+        points = points_by_streak[np.minimum(streaks, 3)]
+        return int(points.sum()), int(streaks[-1])
+
+    def export_state(self) -> tuple:
+        return (self._scores[self._player_1_name], self._scores[self._player_2_name],
+                self._player_1_streak, self._player_2_streak)
+
+    def restore_state(self, state: tuple) -> None:
+        player_1_score, player_2_score, player_1_streak, player_2_streak = state
+        self._scores[self._player_1_name] = player_1_score
+        self._scores[self._player_2_name] = player_2_score
+        self._player_1_streak = int(player_1_streak)
+        self._player_2_streak = int(player_2_streak)
+
     def return_game_result(self) -> None:
         winner = max(self._scores, key=self._scores.get)
         winner_score = self._scores[winner]
@@ -160,4 +302,213 @@ class StreakScoreManager(ScoreManager):
 
     def get_player_score(self, player_name: str) -> float:
         """Get the current score for a specific player."""
-        return self._scores.get(player_name, 0)
\ No newline at end of file
+        return self._scores.get(player_name, 0)
+
+
+class CompactScoreManager(ScoreManager):
+    """
+    Base class for score managers that support any number of players.
+
+    Each player is assigned a slot (their position in the constructor
+    arguments). Each player's values - their score, followed for streak
+    scoring by their streak - are kept together in one typed array at
+    slot * VALUES_PER_PLAYER, rather than in per-player dicts. With
+    __slots__ throughout, an instance carries no per-instance dict. Small
+    games look names up by scanning the name tuple; only leagues larger than
+    INDEXED_PLAYER_COUNT players also keep a name -> slot dict. A two-player
+    instance takes about a quarter less memory than the dict-backed manager
+    it replaces, and each further player adds 8 bytes per value.
+
+    update_scores_for_round scores the first two players against each other,
+    so these managers are drop-in replacements in two-player games;
+    update_scores_for_pairing scores any two slots. Reading and writing an
+    array element boxes the value, so a per-round update is slower than in
+    the dict-backed managers (see benchmarks/run_benchmarks.py); choose these
+    managers for memory and for more than two players, not for speed.
+    """
+
+    __slots__ = ("_game", "_player_names", "_player_slots", "_values")
+
+    # array typecode used for scores (and streaks)
+    SCORE_TYPECODE = "d"
+    # Values kept per player: the score, then any per-player state such as a streak
+    VALUES_PER_PLAYER = 1
+    # Games with more players than this index names in a dict rather than scanning for them
+    INDEXED_PLAYER_COUNT = 8
+
+    def __init__(self, game: Game, player_1_name: str, player_2_name: str, *other_player_names: str):
+        self._game = game
+        self._player_names = (player_1_name, player_2_name) + other_player_names
+        if len(set(self._player_names)) != len(self._player_names):
+            raise ValueError(GameMessages.DUPLICATE_PLAYER_NAMES.format(names=self._player_names))
+        self._player_slots = ({name: slot for slot, name in enumerate(self._player_names)}
+                              if len(self._player_names) > self.INDEXED_PLAYER_COUNT else None)
+        self._values = array(self.SCORE_TYPECODE, [0]) * (len(self._player_names) * self.VALUES_PER_PLAYER)
+
+    @abstractmethod
+    def update_scores_for_pairing(self, slot_1: int, slot_2: int, round_result: int) -> None:
+        """
+        Update scores for a round between the players in two slots.
+
+        Args:
+            slot_1: Slot of the first player
+            slot_2: Slot of the second player
+            round_result: 1 if the first player wins, -1 if the second player wins, 0 if draw
+        """
+        pass
+
+    @abstractmethod
+    def update_scores_for_round(self, round_result: int) -> None:
+        """Update the scores of the players in slots 0 and 1, as update_scores_for_pairing(0, 1, ...) would."""
+        pass
+
+    def get_player_slot(self, player_name: str) -> int:
+        """
+        Return the slot of a player, for use with the slot-based methods.
+
+        Raises:
+            KeyError: If no player has that name
+        """
+        slot = self._find_slot(player_name)
+        if slot is None:
+            raise KeyError(player_name)
+        return slot
+
+    def get_slot_score(self, slot: int) -> float:
+        """Get the current score of the player in a slot."""
+        return self._values[slot * self.VALUES_PER_PLAYER]
+
+    def get_player_score(self, player_name: str) -> float:
+        """Get the current score for a specific player."""
+        slot = self._find_slot(player_name)
+        return 0 if slot is None else self._values[slot * self.VALUES_PER_PLAYER]
+
+    def get_player_count(self) -> int:
+        return len(self._player_names)
+
+    def export_state(self) -> tuple:
+        return tuple(self._values)
+
+    def restore_state(self, state: tuple) -> None:
+        if len(state) != len(self._values):
+            raise ValueError(GameMessages.INVALID_SCORE_STATE.format(
+                length=len(state), player_count=len(self._player_names)
+            ))
+        # Snapshots may hold whole-number values as floats; integer arrays need ints
+        self._values = array(self.SCORE_TYPECODE, state if self.SCORE_TYPECODE == "d" else map(int, state))
+
+    def _find_slot(self, player_name: str) -> Optional[int]:
+        if self._player_slots is not None:
+            return self._player_slots.get(player_name)
+        return self._player_names.index(player_name) if player_name in self._player_names else None
+
+    def _display_scores(self) -> list:
+        # A float array holds 0 as 0.0; players who have not scored show 0, as in the dict-backed managers
+        return [score or 0 for score in self._values[::self.VALUES_PER_PLAYER]]
+
+    def return_leaderboard(self) -> None:
+        self._game.output_provider.output_scores_table(
+            {name: score for name, score in zip(self._player_names, self._display_scores())}
+        )
+
+    def return_game_result(self) -> None:
+        scores = self._display_scores()
+        winner_slot = max(range(len(scores)), key=scores.__getitem__)
+        loser_slot = min(range(len(scores)), key=scores.__getitem__)
+        if scores[winner_slot] == scores[loser_slot]:
+            self._game.output_provider.output_drawn_game()
+        else:
+            self._game.output_provider.output_game_winner(
+                self._player_names[winner_slot], scores[winner_slot], scores[loser_slot]
+            )
+
+
+class CompactStandardScoreManager(CompactScoreManager):
+    """
+    Array-backed, N-player equivalent of StandardScoreManager.
+
+    Awards 1 point for a win, 0.5 to each player for a draw, and 0 for a loss.
+    """
+
+    __slots__ = ()
+
+    def update_scores_for_pairing(self, slot_1: int, slot_2: int, round_result: int) -> None:
+        scores = self._values
+        if round_result == ScoringConstants.PLAYER_1_WIN:
+            scores[slot_1] += ScoringConstants.STANDARD_WIN_POINTS
+        elif round_result == ScoringConstants.PLAYER_2_WIN:
+            scores[slot_2] += ScoringConstants.STANDARD_WIN_POINTS
+        else:
+            scores[slot_1] += ScoringConstants.STANDARD_DRAW_POINTS
+            scores[slot_2] += ScoringConstants.STANDARD_DRAW_POINTS
+
+    def update_scores_for_round(self, round_result: int) -> None:
+        scores = self._values
+        if round_result == ScoringConstants.PLAYER_1_WIN:
+            scores[0] += ScoringConstants.STANDARD_WIN_POINTS
+        elif round_result == ScoringConstants.PLAYER_2_WIN:
+            scores[1] += ScoringConstants.STANDARD_WIN_POINTS
+        else:
+            scores[0] += ScoringConstants.STANDARD_DRAW_POINTS
+            scores[1] += ScoringConstants.STANDARD_DRAW_POINTS
+
+
+class CompactStreakScoreManager(CompactScoreManager):
+    """
+    Array-backed, N-player equivalent of StreakScoreManager.
+
+    Consecutive wins score 1, 2, then 3 points; a draw or loss resets the streak.
+    """
+
+    __slots__ = ()
+
+    SCORE_TYPECODE = "q"
+    VALUES_PER_PLAYER = 2
+
+    # Points indexed by streak length, capped at the third consecutive win
+    _STREAK_POINTS = (
+        ScoringConstants.STREAK_DRAW_POINTS,
+        ScoringConstants.STREAK_FIRST_WIN_POINTS,
+        ScoringConstants.STREAK_SECOND_WIN_POINTS,
+        ScoringConstants.STREAK_THIRD_PLUS_WIN_POINTS
+    )
+
+    def update_scores_for_pairing(self, slot_1: int, slot_2: int, round_result: int) -> None:
+        values = self._values
+        # Each slot's score is at 2 * slot and its streak right after it
+        if round_result == ScoringConstants.PLAYER_1_WIN:
+            winner, loser = 2 * slot_1, 2 * slot_2
+        elif round_result == ScoringConstants.PLAYER_2_WIN:
+            winner, loser = 2 * slot_2, 2 * slot_1
+        else:
+            values[2 * slot_1 + 1] = 0
+            values[2 * slot_2 + 1] = 0
+            return
+
+        streak = values[winner + 1] + 1
+        values[winner + 1] = streak
+        values[loser + 1] = 0
+        values[winner] += self._STREAK_POINTS[min(streak, 3)]
+
+    def update_scores_for_round(self, round_result: int) -> None:
+        # Slot 0's score and streak are at 0 and 1, slot 1's at 2 and 3
+        values = self._values
+        if round_result == ScoringConstants.PLAYER_1_WIN:
+            streak = values[1] + 1
+            values[1] = streak
+            values[3] = 0
+            values[0] += self._STREAK_POINTS[streak if streak < 3 else 3]
+        elif round_result == ScoringConstants.PLAYER_2_WIN:
+            streak = values[3] + 1
+            values[3] = streak
+            values[1] = 0
+            values[2] += self._STREAK_POINTS[streak if streak < 3 else 3]
+        else:
+            values[1] = 0
+            values[3] = 0
+
+    def return_leaderboard(self) -> None:
+        self._game.output_provider.output_scores_table({
+            DisplayConstants.STREAK_FORMAT.format(name=name, streak=streak): score
+            for name, score, streak in zip(self._player_names, self._values[::2], self._values[1::2])
+        })
@@ -1,23 +1,32 @@
-from typing import Type, Dict
+from typing import TYPE_CHECKING, Type, Union
 
-from game import Game
-from src.game_utils.score_manager import ScoreManager, StandardScoreManager, StreakScoreManager
-from src.constants import GameConstants, GameMessages
+from src.core.plugin_registry import PluginRegistry
+from src.constants import GameConstants, GameMessages, PluginConstants
+
+if TYPE_CHECKING:
+    from game import Game
+    from src.game_utils.score_manager import ScoreManager
+
+_SCORE_MANAGER_MODULE = "src.game_utils.score_manager"
 
 
 class ScoreManagerFactory:
     """
     Factory class for creating score manager instances.
+
+    Score manager classes are imported the first time they are requested.
     """
 
-    _managers: Dict[str, Type[ScoreManager]] = {
-        GameConstants.SCORE_MANAGER_STANDARD: StandardScoreManager,
-        GameConstants.SCORE_MANAGER_STREAK: StreakScoreManager
-    }
+    _managers = PluginRegistry(PluginConstants.SCORE_MANAGERS_GROUP, {
+        GameConstants.SCORE_MANAGER_STANDARD: f"{_SCORE_MANAGER_MODULE}:StandardScoreManager",
+        GameConstants.SCORE_MANAGER_STREAK: f"{_SCORE_MANAGER_MODULE}:StreakScoreManager",
+        GameConstants.SCORE_MANAGER_COMPACT_STANDARD: f"{_SCORE_MANAGER_MODULE}:CompactStandardScoreManager",
+        GameConstants.SCORE_MANAGER_COMPACT_STREAK: f"{_SCORE_MANAGER_MODULE}:CompactStreakScoreManager"
+    })
 
     @classmethod
-    def create_score_manager(cls, manager_type: str, game: Game, player_1_name: str,
-                             player_2_name: str) -> ScoreManager:
+    def create_score_manager(cls, manager_type: str, game: "Game", player_1_name: str,
+                             player_2_name: str, *other_player_names: str) -> "ScoreManager":
         """
         Create a score manager of the specified type.
 
@@ -26,6 +35,7 @@ class ScoreManagerFactory:
             game: The game instance
             player_1_name: Name of the first player
             player_2_name: Name of the second player
+            other_player_names: Names of any further players (compact managers only)
 
         Returns:
             An instance of the appropriate ScoreManager subclass
@@ -36,16 +46,16 @@ class ScoreManagerFactory:
         if manager_type not in cls._managers:
             raise ValueError(GameMessages.UNSUPPORTED_SCORE_TYPE.format(manager_type=manager_type))
 
-        manager_class = cls._managers[manager_type]
-        return manager_class(game, player_1_name, player_2_name)
+        manager_class = cls._managers.get(manager_type)
+        return manager_class(game, player_1_name, player_2_name, *other_player_names)
 
     @classmethod
-    def register_manager(cls, manager_type: str, manager_class: Type[ScoreManager]):
+    def register_manager(cls, manager_type: str, manager_class: Union[Type["ScoreManager"], str]):
         """
         Register a new score manager type with the factory.
 
         Args:
             manager_type: The key for this manager type
-            manager_class: The ScoreManager subclass to register
+            manager_class: The ScoreManager subclass to register, or its import path to load it lazily
         """
-        cls._managers[manager_type] = manager_class
\ No newline at end of file
+        cls._managers.register(manager_type, manager_class)
\ No newline at end of file
@@ -5,11 +5,11 @@ This module provides a cleaner, more modular implementation of the RPS game
 that separates concerns and makes it easier to extend to other game types.
 """
 
-import sys
 from typing import List
 
-from game import Game
+from game import Game, GameExit
 from src.core.game_flow_manager import GameFlowManager
+from src.core.game_session import CancellationToken, GameSession, SessionCancelled
 from src.games.rps.rps_constants import RPSConstants, RPSGameConfig
 from src.games.rps.rps_rules import RPSRules
 from src.game_utils.game_mode import GameMode
@@ -33,17 +33,33 @@ class RPSGame(Game):
     MAX_ROUNDS = RPSGameConfig.DEFAULT_MAX_ROUNDS
     SCORE_MANAGER_TYPE = RPSGameConfig.SCORE_MANAGER_TYPE
 
-    def __init__(self, input_prov: InputProvider, output_prov: OutputProvider):
+    def __init__(self, input_prov: InputProvider, output_prov: OutputProvider, match_recorder=None,
+                 instrumentation=None, move_collector=None, metrics=None, event_bus=None):
         super().__init__(input_prov, output_prov)
         self.rules = RPSRules()
-        self.game_flow_manager = GameFlowManager(self.rules, output_prov)
+        self.metrics = metrics
+        self.game_flow_manager = GameFlowManager(self.rules, output_prov, match_recorder, instrumentation,
+                                                 move_collector, metrics, event_bus)
+        self.cancellation = CancellationToken()
 
     def start_game(self):
-        """Start the RPS game."""
+        """
+        Start the RPS game.
+
+        Returns when the game ends, whether by the players declining a replay,
+        the exit command or cancel(), so the game can be started again.
+        """
+        self.cancellation.reset()
         self.output_provider.introduce_game(RPSConstants.GAME_NAME)
-        game_mode = self._select_game_mode()
-        players = game_mode.initialise_players_in_game(self)
-        self._play_game_sessions(players)
+        try:
+            game_mode = self._select_game_mode()
+            players = game_mode.initialise_players_in_game(self)
+            self._play_game_sessions(players)
+        except SessionCancelled:
+            # Cancelled by the host rather than ended by a player
+            self.output_provider.output_end_game()
+        except GameExit:
+            pass
 
     def _play_game_sessions(self, players: List[Player]):
         """
@@ -81,19 +97,22 @@ class RPSGame(Game):
             player_2: The second player
             score_manager: Score manager for this session
         """
-        game_option = self._request_game_option()
-
-        if game_option == GameConstants.BEST_OF_5_COMMAND:
-            # Best of 5 mode
-            self.game_flow_manager.play_best_of_series(
-                player_1, player_2, score_manager
-            )
-        else:
-            # Standard rounds mode
-            rounds_to_play = int(game_option)
-            self.game_flow_manager.play_standard_rounds(
-                rounds_to_play, player_1, player_2, score_manager
-            )
+        session = self._create_session(player_1, player_2, score_manager, self._request_game_option())
+        if self.metrics is None:
+            session.run()
+            return
+        self.metrics.session_started()
+        try:
+            session.run()
+        finally:
+            self.metrics.session_finished()
+
+    def _create_session(self, player_1: Player, player_2: Player, score_manager, game_option: str) -> GameSession:
+        """Create the session for a validated game option: a number of rounds or best of 5."""
+        rounds_to_play = None if game_option == GameConstants.BEST_OF_5_COMMAND else int(game_option)
+        return self.game_flow_manager.create_session(
+            player_1, player_2, score_manager, rounds_to_play, cancellation=self.cancellation
+        )
 
     def _request_game_option(self) -> str:
         """
@@ -102,17 +121,11 @@ class RPSGame(Game):
         Returns:
             Either a number of rounds or "bo5" for best of 5
         """
-        prompt = GameMessages.ROUNDS_PROMPT.format(
-            min=GameConstants.MIN_ROUNDS,
-            max=self.MAX_ROUNDS,
-            bo5=GameConstants.BEST_OF_5_COMMAND
-        )
-
-        game_option = input(prompt).strip().lower()
+        game_option = self.input_provider.game_option_request(self.MAX_ROUNDS).strip().lower()
 
         # Validate input
         while not self._is_valid_game_option(game_option):
-            game_option = input(prompt).strip().lower()
+            game_option = self.input_provider.game_option_request(self.MAX_ROUNDS).strip().lower()
 
         return game_option
 
@@ -157,7 +170,16 @@ class RPSGame(Game):
 
             self.output_provider.output_game_mode_error()
 
+    def cancel(self):
+        """Ask the running game to end before its next round (safe to call from another thread)."""
+        self.cancellation.cancel()
+
     def exit_game(self):
-        """Exit the game."""
+        """
+        Exit the game.
+
+        Raises:
+            GameExit: Always, to unwind back to start_game, which then returns
+        """
         self.output_provider.output_end_game()
-        sys.exit(0)
\ No newline at end of file
+        raise GameExit()
\ No newline at end of file
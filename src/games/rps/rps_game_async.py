@@ -0,0 +1,149 @@
+"""
+Asynchronous Rock-Paper-Scissors game for hosting many sessions in one event loop.
+
+The game flow mirrors RPSGame, but every request for input is awaited
+through an AsyncInputProvider, so a waiting player never blocks other games.
+Round resolution, scoring and output reuse the same components as RPSGame.
+"""
+
+import asyncio
+from typing import List
+
+from game import GameExit
+from src.core.game_session import GameSession, SessionCancelled
+from src.games.rps.rps_constants import RPSConstants
+from src.games.rps.rps_game import RPSGame
+from src.game_utils.game_mode import GameMode
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+from src.io_utils.async_input_provider import AsyncInputProvider
+from src.io_utils.output_provider_stream import OutputProviderStream
+from src.players.computer_player import ComputerPlayer
+from src.players.player import Player
+from src.players.remote_human_player import RemoteHumanPlayer
+from src.constants import GameMessages
+
+
+class AsyncRPSGame(RPSGame):
+    """
+    Rock-Paper-Scissors game driven by asynchronous input.
+    """
+
+    def __init__(self, input_prov: AsyncInputProvider, output_prov: OutputProviderStream,
+                 match_recorder=None, instrumentation=None, move_collector=None, metrics=None,
+                 event_bus=None):
+        super().__init__(input_prov, output_prov, match_recorder, instrumentation, move_collector, metrics,
+                         event_bus)
+
+    def start_game(self):
+        """Start the game, running it to completion on a new event loop."""
+        asyncio.run(self.start_game_async())
+
+    async def start_game_async(self):
+        """Start the RPS game within the running event loop."""
+        self.cancellation.reset()
+        self.output_provider.introduce_game(RPSConstants.GAME_NAME)
+        try:
+            game_mode = await self._select_game_mode_async()
+            players = await self._initialise_players_async(game_mode)
+            await self._play_game_sessions_async(players)
+        except SessionCancelled:
+            # Cancelled by the host rather than ended by a player
+            self.output_provider.output_end_game()
+        except GameExit:
+            pass
+        finally:
+            await self.output_provider.drain()
+
+    async def _select_game_mode_async(self) -> GameMode:
+        while True:
+            game_mode_input = await self.input_provider.game_mode_request()
+
+            if game_mode_input.isdigit():
+                game_mode_number = int(game_mode_input)
+                if 1 <= game_mode_number <= len(GameMode):
+                    return GameMode.get_game_mode_by_number(game_mode_number)
+
+            self.output_provider.output_game_mode_error()
+
+    async def _initialise_players_async(self, game_mode: GameMode) -> List[Player]:
+        players = []
+        for i in range(game_mode.humans):
+            name = ""
+            while Player.name_is_invalid(name):
+                name = await self.input_provider.player_name_request(i + 1)
+                if Player.name_is_invalid(name):
+                    self.output_provider.output_name_error()
+            players.append(RemoteHumanPlayer(self, i + 1, name))
+        for i in range(game_mode.computers):
+            players.append(ComputerPlayer(self, i + game_mode.humans + 1))
+        return players
+
+    async def _play_game_sessions_async(self, players: List[Player]):
+        replay = GameMessages.REPLAY_YES
+
+        while replay.lower() == GameMessages.REPLAY_YES:
+            score_manager = ScoreManagerFactory.create_score_manager(
+                self.SCORE_MANAGER_TYPE,
+                self,
+                players[0].get_name(),
+                players[1].get_name()
+            )
+
+            await self._play_single_session_async(players[0], players[1], score_manager)
+
+            score_manager.return_game_result()
+            replay = await self.input_provider.play_again_request()
+
+        self.exit_game()
+
+    async def _play_single_session_async(self, player_1: Player, player_2: Player, score_manager):
+        game_option = await self._request_game_option_async()
+        session = self._create_session(player_1, player_2, score_manager, game_option)
+        if self.metrics is None:
+            await self._run_session_async(session)
+            return
+        self.metrics.session_started()
+        try:
+            await self._run_session_async(session)
+        finally:
+            self.metrics.session_finished()
+
+    async def _run_session_async(self, session: GameSession):
+        """Play a session, awaiting the remote players' moves before each round is stepped."""
+        session.start()
+        remote_players = [player for player in (session.player_1, session.player_2)
+                          if isinstance(player, RemoteHumanPlayer)]
+        while not session.is_complete():
+            session.begin_round()
+            try:
+                await self._request_moves_async(remote_players)
+            except GameExit:
+                session.abort()
+                raise
+            session.step()
+            await self.output_provider.drain()
+        session.finish()
+
+    @staticmethod
+    async def _request_moves_async(players: List[RemoteHumanPlayer]) -> None:
+        """
+        Ask the remote players for their moves at the same time, so the round waits only for the slower one.
+        If a request fails (e.g. a player exits), the others are cancelled before the error is raised.
+        """
+        requests = [asyncio.create_task(player.request_move()) for player in players]
+        try:
+            await asyncio.gather(*requests)
+        except BaseException:
+            # gather leaves the remaining requests running, still reading their players' input
+            for request in requests:
+                request.cancel()
+            await asyncio.gather(*requests, return_exceptions=True)
+            raise
+
+    async def _request_game_option_async(self) -> str:
+        game_option = (await self.input_provider.game_option_request(self.MAX_ROUNDS)).lower()
+
+        while not self._is_valid_game_option(game_option):
+            game_option = (await self.input_provider.game_option_request(self.MAX_ROUNDS)).lower()
+
+        return game_option
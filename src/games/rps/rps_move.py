@@ -7,7 +7,7 @@ making it easy to extend the game framework to other game types.
 
 import random
 from enum import Enum
-from typing import List, Any
+from typing import Dict, List, Any
 
 from src.games.rps.rps_constants import RPSConstants
 
@@ -21,6 +21,12 @@ class RPSMove(Enum):
         self._move_value = move_value
         self._display_name = display_name
 
+    # Each move is a singleton, so equality is identity. Using the C-level
+    # object implementations keeps dict lookups keyed by moves free of
+    # Python-level __eq__/__hash__ calls.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
     def get_value(self) -> int:
         return self._move_value
 
@@ -30,36 +36,45 @@ class RPSMove(Enum):
     def __str__(self) -> str:
         return self._display_name
 
-    def __eq__(self, other) -> bool:
-        if isinstance(other, RPSMove):
-            return self._move_value == other._move_value
-        return False
-
-    def __hash__(self) -> int:
-        return hash(self._move_value)
-
     @classmethod
     def get_all_moves(cls) -> List['RPSMove']:
-        return list(cls)
+        return list(_ALL_MOVES)
 
     @classmethod
     def get_random_move(cls) -> 'RPSMove':
-        return random.choice(list(cls))
+        return random.choice(_ALL_MOVES)
 
     @classmethod
     def get_move_by_value(cls, value: int) -> 'RPSMove':
-        for move in cls:
-            if move.get_value() == value:
-                return move
-        raise ValueError(f"No RPS move with value {value}")
+        move = _VALUE_INDEX.get(value) if isinstance(value, int) else None
+        if move is None:
+            raise ValueError(f"No RPS move with value {value}")
+        return move
+
+    @classmethod
+    def get_move_by_name(cls, name: str) -> 'RPSMove':
+        move = _NAME_INDEX.get(name.lower()) if isinstance(name, str) else None
+        if move is None:
+            raise ValueError(f"No RPS move with name {name}")
+        return move
 
     @classmethod
     def validate_value(cls, value: Any) -> bool:
-        return isinstance(value, int) and any(move.get_value() == value for move in cls)
+        return isinstance(value, int) and value in _VALUE_INDEX
 
     @classmethod
     def get_formatted_choices(cls) -> List[str]:
-        return [RPSConstants.MOVE_FORMAT.format(
-            value=move.get_value(),
-            name=move.get_name()
-        ) for move in cls]
+        """Return the cached formatted choices (shared, so callers must not modify it)."""
+        return _FORMATTED_CHOICES
+
+
+# Lookup tables, built once after the enum is created. They are module-level
+# rather than class attributes because attribute access on an Enum class is
+# comparatively slow on some Python versions.
+_ALL_MOVES: List[RPSMove] = list(RPSMove)
+_VALUE_INDEX: Dict[int, RPSMove] = {move.get_value(): move for move in RPSMove}
+_NAME_INDEX: Dict[str, RPSMove] = {move.get_name().lower(): move for move in RPSMove}
+_FORMATTED_CHOICES: List[str] = [RPSConstants.MOVE_FORMAT.format(
+    value=move.get_value(),
+    name=move.get_name()
+) for move in RPSMove]
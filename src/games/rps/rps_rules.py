@@ -8,30 +8,35 @@ making it easy to extend to other game types.
 from typing import Dict, List
 
 from src.game_utils.game_rules import GameRules
+from src.game_utils.outcome_table import OutcomeTable, check_move_ordinals
 from src.games.rps.rps_move import RPSMove
 from src.games.rps.rps_constants import RPSConstants
-from src.constants import GameMessages, ScoringConstants
 
 
 class RPSRules(GameRules[RPSMove]):
     """
     Rock-Paper-Scissors rules implementation using the new move system.
-    """
 
-    # Define what each move beats
-    _victory_rules: Dict[RPSMove, List[RPSMove]] = {
-        RPSMove.ROCK: [RPSMove.SCISSORS],
-        RPSMove.PAPER: [RPSMove.ROCK],
-        RPSMove.SCISSORS: [RPSMove.PAPER],
-    }
+    The victory rules are compiled into an OutcomeTable on construction, so
+    determining a result or description is a constant-time table lookup.
+    """
 
-    # Define interaction descriptions
-    _interaction_descriptions: Dict[RPSMove, Dict[RPSMove, str]] = {
+    # Define what each move beats, and the action used to describe it
+    _victory_rules: Dict[RPSMove, Dict[RPSMove, str]] = {
         RPSMove.ROCK: {RPSMove.SCISSORS: RPSConstants.ROCK_ACTION},
         RPSMove.PAPER: {RPSMove.ROCK: RPSConstants.PAPER_ACTION},
         RPSMove.SCISSORS: {RPSMove.PAPER: RPSConstants.SCISSORS_ACTION},
     }
 
+    def __init__(self):
+        self._outcome_table = OutcomeTable(self.get_valid_moves(), self._victory_rules)
+        self._result_matrix = None  # numpy form of the results, built on first batch call
+
+    @property
+    def outcome_table(self) -> OutcomeTable[RPSMove]:
+        """The compiled outcome table for these rules."""
+        return self._outcome_table
+
     def determine_result(self, move_1: RPSMove, move_2: RPSMove) -> int:
         """
         Determine the result of a comparison between two RPS moves.
@@ -43,17 +48,7 @@ class RPSRules(GameRules[RPSMove]):
         Returns:
             1 if move_1 wins, -1 if move_2 wins, 0 if draw
         """
-        if move_1 == move_2:
-            return ScoringConstants.DRAW
-        elif move_2 in self._victory_rules.get(move_1, []):
-            return ScoringConstants.PLAYER_1_WIN
-        elif move_1 in self._victory_rules.get(move_2, []):
-            return ScoringConstants.PLAYER_2_WIN
-        else:
-            raise ValueError(GameMessages.NO_RULE_DEFINED.format(
-                move1=move_1,
-                move2=move_2
-            ))
+        return self._outcome_table.result(move_1, move_2)
 
     def get_interaction_description(self, move_1: RPSMove, move_2: RPSMove) -> str:
         """
@@ -66,28 +61,34 @@ class RPSRules(GameRules[RPSMove]):
         Returns:
             A string describing the interaction
         """
-        if move_1 == move_2:
-            return GameMessages.DRAW_DESCRIPTION.format(move1=move_1, move2=move_2)
-
-        # Check if move_1 beats move_2
-        if move_2 in self._interaction_descriptions.get(move_1, {}):
-            action = self._interaction_descriptions[move_1][move_2]
-            return GameMessages.WIN_DESCRIPTION.format(
-                winner=move_1,
-                action=action,
-                loser=move_2
-            )
-
-        # Check if move_2 beats move_1
-        if move_1 in self._interaction_descriptions.get(move_2, {}):
-            action = self._interaction_descriptions[move_2][move_1]
-            return GameMessages.WIN_DESCRIPTION.format(
-                winner=move_2,
-                action=action,
-                loser=move_1
-            )
-
-        return GameMessages.NO_DESCRIPTION.format(move1=move_1, move2=move_2)
+        return self._outcome_table.description(move_1, move_2)
+
+    def determine_results_batch(self, moves_1, moves_2):
+        """
+        Determine the results of many move pairs with one vectorized table lookup.
+
+        Args:
+            moves_1: Integer array-like of the first players' move ordinals
+            moves_2: Integer array-like of the second players' move ordinals
+
+        Returns:
+            A numpy int8 array with 1 where moves_1 wins, -1 where moves_2 wins, 0 for draws;
+            without numpy, an array('b') from one table lookup per pair
+
+        Raises:
+            IndexError: If an ordinal is not the position of a move
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return self._outcome_table.results_batch(moves_1, moves_2)
+
+        if self._result_matrix is None:
+            self._result_matrix = self._outcome_table.result_matrix()
+        ordinals_1, ordinals_2 = np.asarray(moves_1, dtype=np.intp), np.asarray(moves_2, dtype=np.intp)
+        check_move_ordinals(ordinals_1, self._outcome_table.move_count)
+        check_move_ordinals(ordinals_2, self._outcome_table.move_count)
+        return self._result_matrix[ordinals_1, ordinals_2]
 
     def get_valid_moves(self) -> List[RPSMove]:
         """
@@ -96,4 +97,4 @@ class RPSRules(GameRules[RPSMove]):
         Returns:
             List of all valid RPSMove values
         """
-        return RPSMove.get_all_moves()
\ No newline at end of file
+        return RPSMove.get_all_moves()
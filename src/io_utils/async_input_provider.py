@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncInputProvider(ABC):
+    """
+    Asynchronous counterpart of InputProvider.
+
+    Used where many games share one event loop (e.g. the network server), so
+    waiting for a player's input must not block other games.
+    """
+
+    @abstractmethod
+    async def player_name_request(self, player_id: int) -> str:
+        pass
+
+    @abstractmethod
+    async def play_again_request(self) -> str:
+        pass
+
+    @abstractmethod
+    async def player_rps_request(self, player_id: int, choices: str, time_limit: float = None) -> str:
+        """
+        Request a player's move in the rock-paper-scissors game.
+
+        Args:
+            player_id: The ID of the player making the move
+            choices: The available choices for the player
+            time_limit: Optional time limit in seconds for making the move
+
+        Returns:
+            The player's move as a string, or an empty string if timed out
+        """
+        pass
+
+    @abstractmethod
+    async def game_option_request(self, max_rounds: int) -> str:
+        """
+        Request the number of rounds to play, or the best-of series command.
+
+        Args:
+            max_rounds: The maximum number of rounds allowed
+        """
+        pass
+
+    @abstractmethod
+    async def game_mode_request(self) -> str:
+        pass
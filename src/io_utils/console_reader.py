@@ -0,0 +1,113 @@
+"""
+Line reader for console input with monotonic deadlines.
+
+Waits for input with a selector instead of signal.alarm, so time limits can
+be fractions of a second, no signal handler is installed (nothing else's
+SIGALRM handler is replaced, and it works off the main thread) and a timeout
+simply returns rather than raising out of input(). Input is read from the
+file descriptor into the reader's own buffer, so lines typed ahead are kept
+for the next request.
+"""
+
+import os
+import selectors
+import time
+from typing import Optional, TextIO
+
+# Bytes read from the descriptor at a time
+READ_SIZE = 4096
+
+
+class ConsoleLineReader:
+    """
+    Reads lines from a file descriptor, optionally within a time limit.
+
+    A select()-based selector is used because, unlike epoll, it also accepts
+    regular files (e.g. stdin redirected from a script file).
+    """
+
+    def __init__(self, fd: int, encoding: str = "utf-8"):
+        """
+        Args:
+            fd: File descriptor to read from
+            encoding: Text encoding of the input
+        """
+        self._fd = fd
+        self._encoding = encoding
+        self._pending = bytearray()
+        self._eof = False
+        self._selector = selectors.SelectSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    @classmethod
+    def for_stream(cls, stream: TextIO) -> Optional["ConsoleLineReader"]:
+        """
+        Create a reader for a text stream's file descriptor.
+
+        Returns:
+            The reader, or None if the stream cannot be waited on (it has no
+            file descriptor, or the platform cannot select on console handles)
+        """
+        if os.name == "nt":
+            return None
+        try:
+            fd = stream.fileno()
+            return cls(fd, getattr(stream, "encoding", None) or "utf-8")
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def input_available(self) -> bool:
+        """Return True if a complete line (or the end of input) can be read without waiting."""
+        if b"\n" not in self._pending and not self._eof:
+            self._fill(0)
+        return b"\n" in self._pending or self._eof
+
+    def readline(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Read the next line, without its line ending.
+
+        Args:
+            timeout: Seconds to wait, fractions allowed; None waits indefinitely
+
+        Returns:
+            The line, or None if the time limit passed first
+
+        Raises:
+            EOFError: At the end of input, as input() does
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            newline = self._pending.find(b"\n")
+            if newline >= 0:
+                line = bytes(self._pending[:newline])
+                del self._pending[:newline + 1]
+                return self._decode(line)
+            if self._eof:
+                if not self._pending:
+                    raise EOFError()
+                line = bytes(self._pending)
+                self._pending.clear()
+                return self._decode(line)
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+            self._fill(remaining)
+
+    def _fill(self, timeout: Optional[float]) -> None:
+        """Wait up to timeout for input and buffer whatever is available."""
+        if not self._selector.select(timeout):
+            return
+        chunk = os.read(self._fd, READ_SIZE)
+        if chunk:
+            self._pending += chunk
+        else:
+            self._eof = True
+
+    def _decode(self, line: bytes) -> str:
+        return line.decode(self._encoding, errors="replace").rstrip("\r")
+
+    def close(self) -> None:
+        """Stop waiting on the descriptor (which is left open)."""
+        self._selector.close()
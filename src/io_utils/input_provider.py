@@ -17,7 +17,7 @@ class InputProvider(ABC):
         pass
 
     @abstractmethod
-    def player_rps_request(self, player_id: int, choices: str, time_limit: int = None) -> str:
+    def player_rps_request(self, player_id: int, choices: str, time_limit: float = None) -> str:
         """
         Request a player's move in the rock-paper-scissors game.
 
@@ -35,6 +35,16 @@ class InputProvider(ABC):
     def rounds_of_game_request(self, max_rounds: int) -> str:
         pass
 
+    @abstractmethod
+    def game_option_request(self, max_rounds: int) -> str:
+        """
+        Request the number of rounds to play, or the best-of series command.
+
+        Args:
+            max_rounds: The maximum number of rounds allowed
+        """
+        pass
+
     @abstractmethod
     def game_mode_request(self) -> str:
         pass
\ No newline at end of file
@@ -1,50 +1,95 @@
-import signal
+import sys
+from typing import Optional, TextIO
+
 from src.game_utils.game_mode import GameMode
 from src.io_utils.input_provider import InputProvider
-from src.constants import GameMessages
-
-
-class TimeoutException(Exception):
-    """Exception raised when a timeout occurs during input."""
-    pass
-
-
-def timeout_handler(signum, frame):
-    """Handler for timeout signal."""
-    raise TimeoutException()
+from src.io_utils.output_provider import OutputProvider
+from src.constants import GameConstants, GameMessages
 
 
 class InputProviderConsole(InputProvider):
     """
     An implementation of the InputProvider class that handles user input
     via the console.
+
+    If an output provider is given, it is flushed before every prompt so that
+    buffered output is always visible before the game waits for the user.
+
+    Input is read through a ConsoleLineReader, which enforces move time
+    limits (fractions of a second allowed) with monotonic deadlines rather
+    than signals. Where the input cannot be waited on (no file descriptor,
+    or Windows), input() is used instead and a late move is forfeited by the
+    round's deadline check.
     """
 
+    def __init__(self, output_provider: OutputProvider = None, input_stream: Optional[TextIO] = None):
+        """
+        Args:
+            output_provider: Output provider flushed before every prompt
+            input_stream: Stream to read from, defaults to sys.stdin at the time of each prompt
+        """
+        self._output_provider = output_provider
+        self._input_stream = input_stream
+        self._reader = None
+        self._reader_stream = None
+
+    def _get_reader(self):
+        """Return the line reader for the current input stream, or None if it cannot be waited on."""
+        stream = self._input_stream if self._input_stream is not None else sys.stdin
+        if stream is not self._reader_stream:
+            # Imported on first use: selectors is only needed once the game asks for input
+            from src.io_utils.console_reader import ConsoleLineReader
+
+            if self._reader is not None:
+                self._reader.close()
+            self._reader = ConsoleLineReader.for_stream(stream)
+            self._reader_stream = stream
+        return self._reader
+
+    def _prompt(self, prompt: str, time_limit: Optional[float] = None) -> Optional[str]:
+        """
+        Flush pending output, then read a line of input.
+
+        Returns:
+            The line, or None if the time limit passed first
+        """
+        if self._output_provider is not None:
+            self._output_provider.flush()
+        reader = self._get_reader()
+        if reader is None:
+            return input(prompt)
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        return reader.readline(time_limit)
+
+    def input_available(self) -> bool:
+        """Return True if a line of input can be read without waiting (never waits itself)."""
+        reader = self._get_reader()
+        return reader is not None and reader.input_available()
+
     def game_mode_request(self) -> str:
-        return input(GameMessages.GAME_MODE_PROMPT.format(
+        return self._prompt(GameMessages.GAME_MODE_PROMPT.format(
             modes=', '.join(GameMode.formatted_choices())
         )).strip()
 
     def player_name_request(self, player_id: int) -> str:
-        return input(GameMessages.PLAYER_NAME_PROMPT.format(player_id=player_id)).strip()
+        return self._prompt(GameMessages.PLAYER_NAME_PROMPT.format(player_id=player_id)).strip()
 
     def play_again_request(self) -> str:
-        return input(GameMessages.REPLAY_PROMPT).strip()
+        return self._prompt(GameMessages.REPLAY_PROMPT).strip()
 
-    def player_rps_request(self, player_id, choices, time_limit: int = None) -> str:
+    def player_rps_request(self, player_id, choices, time_limit: float = None) -> str:
         """
         Request a player's move with an optional time limit.
 
         Args:
             player_id: The ID of the player making the move
             choices: The available choices
-            time_limit: Time limit in seconds (None for no limit)
+            time_limit: Time limit in seconds, fractions allowed (None for no limit)
 
         Returns:
             The player's input, or an empty string if timed out
         """
-        from src.constants import GameConstants
-
         prompt = GameMessages.MOVE_PROMPT.format(
             player_id=player_id,
             choices=choices,
@@ -55,28 +100,20 @@ class InputProviderConsole(InputProvider):
             prompt += GameMessages.MOVE_TIME_WARNING.format(time_limit=time_limit)
         prompt += "\n"
 
-        # If no time limit, just use regular input
-        if not time_limit:
-            return input(prompt).strip()
-
-        # Set up the timeout handler
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(time_limit)
-
-        try:
-            user_input = input(prompt).strip()
-            # Cancel the alarm if input received
-            signal.alarm(0)
-            return user_input
-        except TimeoutException:
-            # If timeout occurred, return empty string
+        user_input = self._prompt(prompt, time_limit or None)
+        if user_input is None:
+            # The time limit passed before a line was entered
             print(GameMessages.TIMEOUT_MESSAGE)
-            signal.alarm(0)  # Cancel the alarm
             return ""
-        finally:
-            # Ensure alarm is canceled
-            signal.alarm(0)
+        return user_input.strip()
+
+    def game_option_request(self, max_rounds: int) -> str:
+        return self._prompt(GameMessages.ROUNDS_PROMPT.format(
+            min=GameConstants.MIN_ROUNDS,
+            max=max_rounds,
+            bo5=GameConstants.BEST_OF_5_COMMAND
+        )).strip()
 
     def rounds_of_game_request(self, max_rounds: int) -> str:
         from src.games.rps.rps_constants import RPSGameConfig
-        return input(RPSGameConfig.ROUNDS_PROMPT.format(max=max_rounds)).strip()
+        return self._prompt(RPSGameConfig.ROUNDS_PROMPT.format(max=max_rounds)).strip()
@@ -0,0 +1,119 @@
+"""
+Scripted input provider for unattended games.
+
+Answers every prompt with the next line of a script - a file, a list or any
+(possibly endless) generator - so full RPSGame sessions can be load tested
+through the real validation paths: invalid answers are rejected and
+re-requested exactly as they would be from the console. The script is read
+ahead in chunks rather than one answer per prompt, and a special token
+stands for a player who lets the move time limit run out.
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from src.io_utils.input_provider import InputProvider
+from src.constants import GameMessages, ScriptedInputConstants
+
+
+class InputProviderScripted(InputProvider):
+    """
+    An implementation of the InputProvider class that answers prompts from a script.
+
+    Answers are consumed in prompt order regardless of which prompt asks for
+    them, so a script reads like a transcript of what a player would type:
+    mode, name, rounds, moves, replay answer, and so on. When the script runs
+    out, EOFError is raised, as input() does at the end of stdin.
+    """
+
+    def __init__(self, answers: Iterable[str], read_ahead: int = ScriptedInputConstants.READ_AHEAD,
+                 timeout_token: str = ScriptedInputConstants.TIMEOUT_TOKEN):
+        """
+        Args:
+            answers: The scripted answers, in prompt order
+            read_ahead: Number of answers buffered from the script at a time
+            timeout_token: Answer that makes a move request time out
+        """
+        if read_ahead < 1:
+            raise ValueError(GameMessages.MUST_BE_POSITIVE.format(name="read_ahead"))
+        self._answers: Iterator[str] = iter(answers)
+        self._buffer: deque = deque()
+        self._read_ahead = read_ahead
+        self._timeout_token = timeout_token
+        self.answers_used = 0
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "InputProviderScripted":
+        """
+        Stream answers from a text file, one per line.
+
+        The file is read lazily and closed once the script is exhausted.
+
+        Args:
+            path: Script file
+            **kwargs: Passed to the constructor
+        """
+        return cls(_read_lines(path), **kwargs)
+
+    def _next_answer(self) -> str:
+        """Return the next answer, refilling the read-ahead buffer when it is empty."""
+        if not self._buffer:
+            self._buffer.extend(islice(self._answers, self._read_ahead))
+            if not self._buffer:
+                raise EOFError()
+        self.answers_used += 1
+        return self._buffer.popleft()
+
+    def remaining_buffered(self) -> List[str]:
+        """Return the answers read ahead but not yet used."""
+        return list(self._buffer)
+
+    def game_mode_request(self) -> str:
+        return self._next_answer().strip()
+
+    def player_name_request(self, player_id: int) -> str:
+        return self._next_answer().strip()
+
+    def play_again_request(self) -> str:
+        return self._next_answer().strip()
+
+    def game_option_request(self, max_rounds: int) -> str:
+        return self._next_answer().strip()
+
+    def rounds_of_game_request(self, max_rounds: int) -> str:
+        return self._next_answer().strip()
+
+    def player_rps_request(self, player_id: int, choices: str, time_limit: Optional[int] = None) -> str:
+        """
+        Return the next scripted move.
+
+        Returns:
+            The scripted input, or an empty string (a timeout) for the timeout token
+        """
+        answer = self._next_answer().strip()
+        return "" if answer == self._timeout_token else answer
+
+
+def _read_lines(path: str) -> Iterator[str]:
+    with open(path) as script_file:
+        for line in script_file:
+            yield line.rstrip("\n")
+
+
+def session_script(mode: str, name: str, game_option: str, moves: Iterable[str],
+                   replay: str = "n") -> List[str]:
+    """
+    Build the answers for one human vs computer game.
+
+    Args:
+        mode: Game mode answer
+        name: Player name answer
+        game_option: Number of rounds, or the best-of command
+        moves: Move answers, including any invalid ones and timeout tokens
+        replay: Answer to the replay prompt
+
+    Returns:
+        The answers in prompt order
+    """
+    return [mode, name, game_option, *moves, replay]
@@ -0,0 +1,77 @@
+import asyncio
+
+from src.game_utils.game_mode import GameMode
+from src.io_utils.async_input_provider import AsyncInputProvider
+from src.io_utils.output_provider_stream import OutputProviderStream
+from src.constants import GameConstants, GameMessages, ServerConstants
+
+
+class InputProviderStream(AsyncInputProvider):
+    """
+    An implementation of the AsyncInputProvider class that reads lines from
+    an asyncio stream, writing prompts through the matching output provider.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, output_provider: OutputProviderStream):
+        self._reader = reader
+        self._output_provider = output_provider
+
+    async def _prompt(self, prompt: str) -> str:
+        """Write the prompt and wait for the next line of input."""
+        self._output_provider.write_prompt(prompt)
+        await self._output_provider.drain()
+        return await self._read_line()
+
+    async def _read_line(self) -> str:
+        line = await self._reader.readline()
+        if not line:
+            raise EOFError()
+        return line.decode(ServerConstants.STREAM_ENCODING).strip()
+
+    async def game_mode_request(self) -> str:
+        return await self._prompt(GameMessages.GAME_MODE_PROMPT.format(
+            modes=', '.join(GameMode.formatted_choices())
+        ))
+
+    async def player_name_request(self, player_id: int) -> str:
+        return await self._prompt(GameMessages.PLAYER_NAME_PROMPT.format(player_id=player_id))
+
+    async def play_again_request(self) -> str:
+        return await self._prompt(GameMessages.REPLAY_PROMPT)
+
+    async def game_option_request(self, max_rounds: int) -> str:
+        return await self._prompt(GameMessages.ROUNDS_PROMPT.format(
+            min=GameConstants.MIN_ROUNDS,
+            max=max_rounds,
+            bo5=GameConstants.BEST_OF_5_COMMAND
+        ))
+
+    async def player_rps_request(self, player_id: int, choices: str, time_limit: float = None) -> str:
+        """
+        Request a player's move with an optional time limit.
+
+        Args:
+            player_id: The ID of the player making the move
+            choices: The available choices
+            time_limit: Time limit in seconds (None for no limit)
+
+        Returns:
+            The player's input, or an empty string if timed out
+        """
+        prompt = GameMessages.MOVE_PROMPT.format(
+            player_id=player_id,
+            choices=choices,
+            exit=GameConstants.EXIT_COMMAND
+        )
+        if time_limit:
+            prompt += GameMessages.MOVE_TIME_WARNING.format(time_limit=time_limit)
+        prompt += "\n"
+
+        if not time_limit:
+            return await self._prompt(prompt)
+
+        try:
+            return await asyncio.wait_for(self._prompt(prompt), time_limit)
+        except asyncio.TimeoutError:
+            self._output_provider.write_prompt(GameMessages.TIMEOUT_MESSAGE + "\n")
+            return ""
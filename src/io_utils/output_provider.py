@@ -66,4 +66,28 @@ class OutputProvider(ABC):
 
     @abstractmethod
     def output_game_mode_error(self) -> None:
+        pass
+
+    @abstractmethod
+    def output_both_timeout(self) -> None:
+        pass
+
+    @abstractmethod
+    def output_player_timeout(self, loser: str, winner: str) -> None:
+        pass
+
+    @abstractmethod
+    def output_series_winner(self, winner: str) -> None:
+        pass
+
+    @abstractmethod
+    def output_series_draw(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        """
+        Write out any output held back by the provider.
+
+        Called before the game waits for input. Unbuffered providers have nothing to do.
+        """
         pass
\ No newline at end of file
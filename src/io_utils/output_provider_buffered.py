@@ -0,0 +1,78 @@
+"""
+Buffered console output provider.
+
+The console provider writes every message as soon as it is produced, which
+means several small writes per round. This provider collects the text in
+memory and writes it to the stream in a single call according to a flush
+policy, so long games piped to a log are not bound by output I/O.
+"""
+
+import sys
+from enum import Enum
+from typing import List, Optional, TextIO
+
+from src.io_utils.output_provider_console import OutputProviderConsole
+from src.constants import GameMessages
+
+
+class FlushPolicy(Enum):
+    """When the buffered output is written to the stream."""
+    PER_ROUND = "per_round"
+    EVERY_N_ROUNDS = "every_n_rounds"
+    ON_INPUT = "on_input"
+
+
+class OutputProviderBuffered(OutputProviderConsole):
+    """
+    Console output provider that batches writes.
+
+    A round ends when its leaderboard is output. Regardless of the policy,
+    buffered output is always written when flush() is called (the input
+    provider does this before prompting) and when the game ends.
+    """
+
+    def __init__(self, flush_policy: FlushPolicy = FlushPolicy.PER_ROUND,
+                 flush_every: int = 1, stream: Optional[TextIO] = None):
+        """
+        Args:
+            flush_policy: When buffered output is written
+            flush_every: Number of rounds per write for FlushPolicy.EVERY_N_ROUNDS
+            stream: Stream to write to, defaults to sys.stdout
+        """
+        if flush_every < 1:
+            raise ValueError(GameMessages.MUST_BE_POSITIVE.format(name="flush_every"))
+        self.flush_policy = flush_policy
+        self.flush_every = flush_every if flush_policy == FlushPolicy.EVERY_N_ROUNDS else 1
+        self._stream = stream
+        self._buffer: List[str] = []
+        self._rounds_buffered = 0
+
+    def _write(self, text: str) -> None:
+        self._buffer.append(text)
+        self._buffer.append("\n")
+
+    def output_scores_table(self, _scores: dict[str, int]) -> None:
+        super().output_scores_table(_scores)
+        self._end_round()
+
+    def output_end_game(self) -> None:
+        super().output_end_game()
+        self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered output to the stream in a single write."""
+        self._rounds_buffered = 0
+        if not self._buffer:
+            return
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write("".join(self._buffer))
+        stream.flush()
+        self._buffer.clear()
+
+    def _end_round(self) -> None:
+        """Count a completed round and flush if the policy calls for it."""
+        if self.flush_policy == FlushPolicy.ON_INPUT:
+            return
+        self._rounds_buffered += 1
+        if self._rounds_buffered >= self.flush_every:
+            self.flush()
@@ -0,0 +1,28 @@
+import asyncio
+
+from src.io_utils.output_provider_console import OutputProviderConsole
+from src.constants import ServerConstants
+
+
+class OutputProviderStream(OutputProviderConsole):
+    """
+    An implementation of the OutputProvider class that writes the console
+    output to an asyncio stream (e.g. a network connection).
+
+    Writes are queued on the transport without blocking; callers await
+    drain() at convenient points to apply back-pressure.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+
+    def _write(self, text: str) -> None:
+        self.write_prompt(text + "\n")
+
+    def write_prompt(self, prompt: str) -> None:
+        """Write text exactly as given, without a trailing newline."""
+        self._writer.write(prompt.encode(ServerConstants.STREAM_ENCODING))
+
+    async def drain(self) -> None:
+        """Wait until the queued output has been handed to the transport."""
+        await self._writer.drain()
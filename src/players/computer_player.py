@@ -1,5 +1,8 @@
+import random
+
 from src.games.rps.rps_move import RPSMove
 from src.players.player import Player
+from src.players.random_move_source import RandomMoveSource
 from game import Game
 from src.constants import PlayerConstants
 
@@ -8,11 +11,18 @@ class ComputerPlayer(Player):
     """
     Represents a computer-controlled player in the game.
     The computer randomly selects a move for its turn.
+
+    Each computer player draws from its own seeded stream of moves. When no
+    seed is given, one is taken from the global random module, so seeding
+    that module before creating the players still reproduces a whole game.
     """
-    def __init__(self, game: Game, player_id: int):
+    def __init__(self, game: Game, player_id: int, seed: int = None, use_numpy: bool = False):
         name = f"{PlayerConstants.COMPUTER_NAME_PREFIX} {player_id}"
         super().__init__(name)
         self._game = game
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._move_source = RandomMoveSource(RPSMove.get_all_moves(), seed, use_numpy=use_numpy)
 
     def make_move(self) -> RPSMove:
-        return RPSMove.get_random_move()
\ No newline at end of file
+        return self._move_source.next_move()
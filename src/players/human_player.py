@@ -1,3 +1,5 @@
+from collections import deque
+
 from src.games.rps.rps_move import RPSMove
 from src.players.player import Player
 from game import Game
@@ -7,9 +9,13 @@ class HumanPlayer(Player):
     """
     Represents a human player in the game.
     The player provides their name and makes moves interactively.
+
+    Several moves can be entered on one line (e.g. "1 3 2"): the first is
+    played and the rest are queued for the following rounds, which then
+    use them without prompting.
     """
 
-    def __init__(self, game: Game, player_id: int, time_limit: int = Player.DEFAULT_TIME_LIMIT):
+    def __init__(self, game: Game, player_id: int, time_limit: float = Player.DEFAULT_TIME_LIMIT):
         input_name = ""
         while Player.name_is_invalid(input_name):
             input_name = game.input_provider.player_name_request(player_id)
@@ -19,13 +25,17 @@ class HumanPlayer(Player):
         super().__init__(input_name, time_limit)
         self._game = game
         self._id = player_id
+        self._queued_moves = deque()
 
     def make_move(self) -> RPSMove | None:
         """
-        Prompts the player to make a move in the game.
+        Prompts the player to make a move in the game, unless a move is already queued.
         Continuously requests a valid move from the player until a valid input is provided.
         If no valid move is made within the time limit, returns None to indicate forfeit.
         """
+        if self._queued_moves:
+            return self._to_move(self._queued_moves.popleft())
+
         gesture_options = ", ".join(RPSMove.get_formatted_choices())
 
         # Request input with time limit
@@ -37,8 +47,9 @@ class HumanPlayer(Player):
         if input_gesture is None or input_gesture == "":
             return None
 
-        # Continue requesting input until valid
-        while not self.is_valid_move(input_gesture):
+        # Continue requesting input until it holds at least one valid move
+        while not self._queue_moves(input_gesture):
+            self.restart_move_deadline()
             input_gesture = self._game.input_provider.player_rps_request(
                 self._id, gesture_options, self.time_limit
             )
@@ -46,6 +57,35 @@ class HumanPlayer(Player):
             if input_gesture is None or input_gesture == "":
                 return None
 
+        return self._to_move(self._queued_moves.popleft())
+
+    def input_source(self):
+        return self._game.input_provider
+
+    def begin_session(self) -> None:
+        """Discard moves queued during the previous game."""
+        self._queued_moves.clear()
+
+    def _queue_moves(self, input_line: str) -> bool:
+        """
+        Queue the moves entered on one line, separated by spaces or commas.
+
+        Parsing stops at the first invalid move (which is reported) and after
+        the exit command, since nothing after it will be played.
+
+        Returns:
+            True if at least one move was queued
+        """
+        for gesture in input_line.replace(",", " ").split() or [input_line]:
+            if not self.is_valid_move(gesture):
+                break
+            self._queued_moves.append(gesture)
+            if gesture.lower() == self._game.EXIT_COMMAND:
+                break
+        return bool(self._queued_moves)
+
+    def _to_move(self, input_gesture: str) -> RPSMove:
+        """Convert validated input into a move, exiting the game on the exit command."""
         if input_gesture.isdigit():
             gesture_number = int(input_gesture)
             return RPSMove.get_move_by_value(gesture_number)
@@ -61,4 +101,6 @@ class HumanPlayer(Player):
         elif gesture.lower() == self._game.EXIT_COMMAND:
             return True
         self._game.output_provider.output_gesture_error()
+        if self._game.metrics is not None:
+            self._game.metrics.record_invalid_move()
         return False
\ No newline at end of file
@@ -11,7 +11,10 @@ class Player(ABC):
     MAX_NAME_LENGTH = PlayerConstants.MAX_NAME_LENGTH
     DEFAULT_TIME_LIMIT = PlayerConstants.DEFAULT_TIME_LIMIT
 
-    def __init__(self, name: str, time_limit: int = DEFAULT_TIME_LIMIT):
+    # Restarts the move deadline while a move is being made; attached by the round's TimeoutHandler
+    _restart_move_deadline = None
+
+    def __init__(self, name: str, time_limit: float = DEFAULT_TIME_LIMIT):
         self.name = name
         self.time_limit = time_limit
 
@@ -22,6 +25,42 @@ class Player(ABC):
     def make_move(self):
         pass
 
+    def attach_move_deadline(self, restart) -> None:
+        """
+        Attach (or with None, detach) the function that restarts this player's move deadline.
+        Called by the TimeoutHandler around each move.
+        """
+        self._restart_move_deadline = restart
+
+    def restart_move_deadline(self) -> None:
+        """
+        Give the player their full time limit again, as each prompt for a move does.
+        Players that prompt again after invalid input call this first; it does nothing without a deadline.
+        """
+        if self._restart_move_deadline is not None:
+            self._restart_move_deadline()
+
+    def input_source(self):
+        """
+        Return the input this player blocks on while choosing a move, or None if it reads none.
+        Players with the same input source (e.g. two humans at one console) are never asked at once.
+        """
+        return None
+
+    def begin_session(self) -> None:
+        """
+        Called when a new game session starts, before its first round.
+        Players that carry state between rounds reset it here; it does nothing by default.
+        """
+        pass
+
+    def observe_round(self, own_move, opponent_move) -> None:
+        """
+        Called after every round in which both players made a valid move.
+        Adaptive players override this to learn from their opponent; it does nothing by default.
+        """
+        pass
+
     @staticmethod
     def name_is_invalid(name: str) -> bool:
         return (len(name) < PlayerConstants.MIN_NAME_LENGTH or
@@ -0,0 +1,82 @@
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.players.computer_player import ComputerPlayer
+from game import Game
+from src.constants import GameMessages, PlayerConstants, ScoringConstants
+
+
+class PredictiveComputerPlayer(ComputerPlayer):
+    """
+    A computer player that predicts the opponent's next move and plays its counter.
+
+    The opponent is modelled with an order-k Markov chain: for every context of
+    their last k moves, a count of the move they played next. The most likely
+    next move in each context is maintained as the counts change, so both
+    learning a round and choosing a move are O(1). Until the current context
+    has been seen, the opponent's overall most frequent move is countered
+    instead, and before any history exists the player moves randomly.
+
+    All tables are sized up front (move_count ** (order + 1) counts), so memory
+    stays fixed however long the match runs.
+    """
+
+    def __init__(self, game: Game, player_id: int, order: int = PlayerConstants.PREDICTOR_DEFAULT_ORDER):
+        super().__init__(game, player_id)
+        if order < 1:
+            raise ValueError(GameMessages.MUST_BE_POSITIVE.format(name="order"))
+
+        rules = RPSRules()
+        moves = rules.get_valid_moves()
+        self._ordinals = rules.outcome_table.ordinals
+        self._move_count = len(moves)
+        self._order = order
+        self._context_count = self._move_count ** order
+
+        # counter_moves[i] is a move that beats the move with ordinal i
+        self._counter_moves = [
+            next(move for move in moves
+                 if rules.determine_result(move, predicted) == ScoringConstants.PLAYER_1_WIN)
+            for predicted in moves
+        ]
+
+        self._transition_counts = [0] * (self._context_count * self._move_count)
+        self._predicted = [-1] * self._context_count  # -1 until the context has been seen
+        self._predicted_count = [0] * self._context_count
+
+        self._frequency = [0] * self._move_count
+        self._most_frequent = -1
+        self._most_frequent_count = 0
+
+        self._context = 0
+        self._observed = 0
+
+    def make_move(self) -> RPSMove:
+        if self._observed >= self._order:
+            predicted = self._predicted[self._context]
+            if predicted >= 0:
+                return self._counter_moves[predicted]
+        if self._most_frequent >= 0:
+            return self._counter_moves[self._most_frequent]
+        return super().make_move()
+
+    def observe_round(self, own_move, opponent_move) -> None:
+        ordinal = self._ordinals[opponent_move]
+
+        count = self._frequency[ordinal] + 1
+        self._frequency[ordinal] = count
+        if count > self._most_frequent_count:
+            self._most_frequent_count = count
+            self._most_frequent = ordinal
+
+        context = self._context
+        if self._observed >= self._order:
+            index = context * self._move_count + ordinal
+            count = self._transition_counts[index] + 1
+            self._transition_counts[index] = count
+            if count > self._predicted_count[context]:
+                self._predicted_count[context] = count
+                self._predicted[context] = ordinal
+
+        # Slide the window of the opponent's last k moves
+        self._context = (context * self._move_count + ordinal) % self._context_count
+        self._observed += 1
@@ -0,0 +1,65 @@
+"""
+Block-generated random moves for computer players.
+
+Drawing one move at a time from the shared global random module costs a
+Python-level call per move and ties every player to one global stream.
+A RandomMoveSource owns its own seeded generator, produces moves a block
+at a time and hands them out from the buffer.
+"""
+
+import random
+from typing import Generic, Iterator, Optional, Sequence, TypeVar
+
+from src.constants import GameMessages, PlayerConstants
+
+T = TypeVar('T')  # Generic type for moves
+
+
+class RandomMoveSource(Generic[T]):
+    """
+    An independently seeded stream of uniformly random moves.
+
+    With use_numpy=True, indices are drawn with a numpy Generator (numpy
+    must be installed); otherwise a private random.Random is used.
+    """
+
+    def __init__(self, moves: Sequence[T], seed: Optional[int] = None,
+                 block_size: int = PlayerConstants.RANDOM_MOVE_BLOCK_SIZE,
+                 use_numpy: bool = False):
+        """
+        Args:
+            moves: The moves to choose between
+            seed: Seed for this stream; None seeds from the operating system
+            block_size: Number of moves generated per refill
+            use_numpy: Generate blocks with numpy instead of random.Random
+        """
+        if block_size < 1:
+            raise ValueError(GameMessages.MUST_BE_POSITIVE.format(name="block_size"))
+        self._moves = list(moves)
+        self._block_size = block_size
+
+        if use_numpy:
+            import numpy as np
+            self._numpy_generator = np.random.default_rng(seed)
+            self._numpy_moves = np.array(self._moves, dtype=object)
+            self._generate_block = self._generate_numpy_block
+        else:
+            self._random = random.Random(seed)
+            self._generate_block = self._generate_python_block
+
+        self._buffer: Iterator[T] = iter(())
+
+    def next_move(self) -> T:
+        """Return the next move from the buffer, generating a new block when it runs out."""
+        try:
+            return next(self._buffer)
+        except StopIteration:
+            self._buffer = iter(self._generate_block())
+            return next(self._buffer)
+
+    def _generate_python_block(self) -> list:
+        return self._random.choices(self._moves, k=self._block_size)
+
+    def _generate_numpy_block(self) -> list:
+        indices = self._numpy_generator.integers(0, len(self._moves), size=self._block_size)
+        return self._numpy_moves[indices].tolist()
@@ -0,0 +1,59 @@
+from collections import deque
+
+from src.games.rps.rps_move import RPSMove
+from src.players.human_player import HumanPlayer
+from src.players.player import Player
+from game import Game
+
+
+class RemoteHumanPlayer(HumanPlayer):
+    """
+    Represents a human player whose input arrives asynchronously (e.g. over a network).
+
+    The game awaits request_move() before each round; make_move() then hands
+    the prepared move to the round executor without blocking.
+    """
+
+    def __init__(self, game: Game, player_id: int, name: str, time_limit: float = Player.DEFAULT_TIME_LIMIT):
+        Player.__init__(self, name, time_limit)
+        self._game = game
+        self._id = player_id
+        self._prepared_move = None
+        self._queued_moves = deque()
+
+    async def request_move(self) -> None:
+        """
+        Request a move through the game's async input provider and hold it for make_move.
+        Continuously requests a valid move until one is given; a timeout prepares None (forfeit).
+        A move queued by an earlier multi-move line is prepared without a request.
+        """
+        self._prepared_move = None
+        if self._queued_moves:
+            self._prepared_move = self._to_move(self._queued_moves.popleft())
+            return
+
+        gesture_options = ", ".join(RPSMove.get_formatted_choices())
+
+        input_gesture = await self._game.input_provider.player_rps_request(
+            self._id, gesture_options, self.time_limit
+        )
+        if input_gesture is None or input_gesture == "":
+            return
+
+        while not self._queue_moves(input_gesture):
+            input_gesture = await self._game.input_provider.player_rps_request(
+                self._id, gesture_options, self.time_limit
+            )
+            if input_gesture is None or input_gesture == "":
+                return
+
+        self._prepared_move = self._to_move(self._queued_moves.popleft())
+
+    def input_source(self):
+        # The move is awaited by the game before the round, so make_move never reads input
+        return None
+
+    def make_move(self) -> RPSMove | None:
+        move = self._prepared_move
+        self._prepared_move = None
+        return move
@@ -0,0 +1,297 @@
+"""
+Seekable index for binary match logs.
+
+A MatchLogIndex is a sparse sidecar to a match log. Every few rounds of each
+session it stores the record's position in the log together with a snapshot
+of the session's score manager state. Finding "session X, round k" is then a
+binary search for the nearest entry at or before it plus some arithmetic, and
+rebuilding the scores at that round restores the entry's snapshot and replays
+at most one snapshot interval of rounds, rather than the whole session.
+
+Sidecar layout: header | manager type | entry count | fixed-width entries.
+"""
+
+import bisect
+import os
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+from game import Game
+from src.game_utils.score_manager import ScoreManager
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+from src.recording.match_log import MatchLogReader, MatchRecord, HEADER_SIZE, RECORD_SIZE
+from src.constants import GameConstants, GameMessages, RecordingConstants
+
+# magic, version, snapshot interval, snapshot length, indexed record count, manager type length
+HEADER_STRUCT = struct.Struct("<4sHIHQB")
+COUNT_STRUCT = struct.Struct("<Q")
+
+# Names used for the score managers that snapshots are taken from
+_SNAPSHOT_PLAYER_NAMES = ("Player 1", "Player 2")
+
+
+class IndexEntry(NamedTuple):
+    """A point in the log where a session's score state was captured."""
+    session_id: int
+    round_number: int
+    record_index: int
+    state: Tuple[float, ...]
+
+
+class MatchLogIndex:
+    """
+    Sparse (session, round) -> record index, with score snapshots.
+
+    Entries are taken at the first and last round of every session, every
+    `interval` rounds in between, and wherever a session's rounds stop being
+    contiguous in the log. Between two entries of a session, its rounds are
+    therefore consecutive records, so any round can be located from the
+    entry before it.
+    """
+
+    def __init__(self, score_manager_type: str, interval: int, record_count: int,
+                 entries: List[IndexEntry]):
+        self.score_manager_type = score_manager_type
+        self.interval = interval
+        self.record_count = record_count
+        self._entries = sorted(entries)
+        self._keys = [(entry.session_id, entry.round_number) for entry in self._entries]
+
+    @classmethod
+    def build(cls, reader: MatchLogReader,
+              score_manager_type: str = GameConstants.SCORE_MANAGER_STANDARD,
+              interval: int = RecordingConstants.INDEX_SNAPSHOT_INTERVAL) -> "MatchLogIndex":
+        """
+        Index a match log by replaying it once.
+
+        Args:
+            reader: The match log
+            score_manager_type: Score manager whose state is snapshotted
+            interval: Rounds between snapshots within a session
+
+        Returns:
+            The index
+
+        Raises:
+            ValueError: If the score manager type does not support state snapshots
+        """
+        if interval < 1:
+            raise ValueError(GameMessages.MUST_BE_POSITIVE.format(name="interval"))
+        if not type(cls._create_score_manager(score_manager_type)).supports_snapshots():
+            raise ValueError(GameMessages.SNAPSHOTS_UNSUPPORTED.format(manager=score_manager_type))
+
+        entries = []
+        managers = {}
+        # (session id, round number) of the previous record
+        previous: Optional[Tuple[int, int]] = None
+        previous_index = -1
+
+        for record_index, record in enumerate(reader):
+            session_id, round_number = record.session_id, record.round_number
+            contiguous = previous == (session_id, round_number - 1)
+            if previous is not None and not contiguous:
+                # The previous record ended a run of its session
+                entries.append(cls._entry(managers, previous, previous_index))
+
+            manager = managers.get(session_id)
+            if manager is None:
+                manager = managers[session_id] = cls._create_score_manager(score_manager_type)
+            manager.update_scores_for_round(record.result)
+            if not contiguous or round_number % interval == 0:
+                entries.append(IndexEntry(session_id, round_number, record_index, manager.export_state()))
+
+            previous, previous_index = (session_id, round_number), record_index
+
+        if previous is not None:
+            entries.append(cls._entry(managers, previous, previous_index))
+
+        return cls(score_manager_type, interval, len(reader), list(dict.fromkeys(entries)))
+
+    @staticmethod
+    def default_path(log_path: str) -> str:
+        """Return the sidecar path used for a match log."""
+        return log_path + RecordingConstants.INDEX_FILE_SUFFIX
+
+    @classmethod
+    def load_or_build(cls, reader: MatchLogReader,
+                      score_manager_type: str = GameConstants.SCORE_MANAGER_STANDARD) -> "MatchLogIndex":
+        """
+        Load the log's sidecar index, rebuilding and saving it if it is missing or stale.
+
+        Args:
+            reader: The match log
+            score_manager_type: Score manager whose state is snapshotted
+        """
+        path = cls.default_path(reader.path)
+        if os.path.exists(path):
+            try:
+                index = cls.load(path)
+            except ValueError:
+                index = None
+            if (index is not None and index.record_count == len(reader)
+                    and index.score_manager_type == score_manager_type):
+                return index
+
+        index = cls.build(reader, score_manager_type)
+        index.save(path)
+        return index
+
+    def save(self, path: str) -> None:
+        type_name = self.score_manager_type.encode()
+        state_length = len(self._entries[0].state) if self._entries else 0
+        entry_struct = self._entry_struct(state_length)
+        with open(path, "wb") as index_file:
+            index_file.write(HEADER_STRUCT.pack(
+                RecordingConstants.INDEX_MAGIC, RecordingConstants.INDEX_VERSION,
+                self.interval, state_length, self.record_count, len(type_name)
+            ))
+            index_file.write(type_name)
+            index_file.write(COUNT_STRUCT.pack(len(self._entries)))
+            for entry in self._entries:
+                index_file.write(entry_struct.pack(entry.session_id, entry.round_number,
+                                                   entry.record_index, *entry.state))
+
+    @classmethod
+    def load(cls, path: str) -> "MatchLogIndex":
+        """
+        Read an index saved with save().
+
+        Raises:
+            ValueError: If the file is not a match log index
+        """
+        with open(path, "rb") as index_file:
+            data = index_file.read()
+        try:
+            magic, version, interval, state_length, record_count, type_length = \
+                HEADER_STRUCT.unpack_from(data)
+            if magic != RecordingConstants.INDEX_MAGIC or version != RecordingConstants.INDEX_VERSION:
+                raise ValueError(magic)
+            offset = HEADER_STRUCT.size
+            score_manager_type = data[offset:offset + type_length].decode()
+            offset += type_length
+            entry_count, = COUNT_STRUCT.unpack_from(data, offset)
+            offset += COUNT_STRUCT.size
+            entry_struct = cls._entry_struct(state_length)
+            entries = [IndexEntry(fields[0], fields[1], fields[2], fields[3:])
+                       for fields in entry_struct.iter_unpack(
+                           data[offset:offset + entry_count * entry_struct.size])]
+            if len(entries) != entry_count:
+                raise ValueError(path)
+        except (struct.error, UnicodeDecodeError, ValueError):
+            raise ValueError(GameMessages.INVALID_MATCH_INDEX.format(
+                path=path, version=RecordingConstants.INDEX_VERSION
+            )) from None
+        return cls(score_manager_type, interval, record_count, entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def locate(self, session_id: int, round_number: int) -> int:
+        """
+        Find the position of a round in the log.
+
+        Args:
+            session_id: The session
+            round_number: The round within the session
+
+        Returns:
+            The record index of the round
+
+        Raises:
+            KeyError: If the round was not recorded
+        """
+        return self._nearest_entry(session_id, round_number)[1]
+
+    def offset(self, session_id: int, round_number: int) -> int:
+        """Return the byte offset of a round's record in the log file."""
+        return HEADER_SIZE + self.locate(session_id, round_number) * RECORD_SIZE
+
+    def seek(self, reader: MatchLogReader, session_id: int, round_number: int) -> MatchRecord:
+        """Return the record of a round, read directly from its position in the log."""
+        record = reader[self.locate(session_id, round_number)]
+        self._check_record(record, session_id, round_number)
+        return record
+
+    def score_manager_at(self, reader: MatchLogReader, session_id: int, round_number: int,
+                         game: Game = None,
+                         player_1_name: str = _SNAPSHOT_PLAYER_NAMES[0],
+                         player_2_name: str = _SNAPSHOT_PLAYER_NAMES[1]) -> ScoreManager:
+        """
+        Rebuild a session's score manager as it was after a given round.
+
+        The nearest snapshot at or before the round is restored, then the
+        remaining rounds (fewer than the snapshot interval) are replayed.
+
+        Args:
+            reader: The match log the index was built from
+            session_id: The session
+            round_number: The round after which to rebuild the scores
+            game: Game to attach to the score manager, for display
+            player_1_name: Name of the first player
+            player_2_name: Name of the second player
+
+        Returns:
+            A new score manager of the index's type
+
+        Raises:
+            KeyError: If the round was not recorded
+        """
+        entry, record_index = self._nearest_entry(session_id, round_number)
+        score_manager = ScoreManagerFactory.create_score_manager(
+            self.score_manager_type, game, player_1_name, player_2_name
+        )
+        score_manager.restore_state(entry.state)
+        update_scores = score_manager.update_scores_for_round
+        record = None
+        for record in reader.records(entry.record_index + 1, record_index + 1):
+            update_scores(record.result)
+        if record is not None:
+            self._check_record(record, session_id, round_number)
+        return score_manager
+
+    @staticmethod
+    def _check_record(record: MatchRecord, session_id: int, round_number: int) -> None:
+        """Raise KeyError unless the record found is the round requested (e.g. the index is for another log)."""
+        if (record.session_id, record.round_number) != (session_id, round_number):
+            raise KeyError(GameMessages.ROUND_NOT_RECORDED.format(
+                round_number=round_number, session_id=session_id
+            ))
+
+    def _nearest_entry(self, session_id: int, round_number: int) -> Tuple[IndexEntry, int]:
+        """Return the entry at or before a round, and the round's record index."""
+        position = bisect.bisect_right(self._keys, (session_id, round_number)) - 1
+        if position >= 0 and round_number >= 1:
+            entry = self._entries[position]
+            if entry.session_id == session_id and (
+                    round_number == entry.round_number or self._run_continues(position)):
+                return entry, entry.record_index + round_number - entry.round_number
+        raise KeyError(GameMessages.ROUND_NOT_RECORDED.format(
+            round_number=round_number, session_id=session_id
+        ))
+
+    def _run_continues(self, position: int) -> bool:
+        """
+        Return True if the rounds after an entry are consecutive records up to the next entry.
+
+        A session's last entry is at its last round, and an entry ending a run
+        is followed by one after a gap in round numbers or records, so in
+        either case the rounds after the entry cannot be located from it.
+        """
+        if position + 1 >= len(self._entries):
+            return False
+        entry, next_entry = self._entries[position], self._entries[position + 1]
+        return (next_entry.session_id == entry.session_id and
+                next_entry.record_index - entry.record_index == next_entry.round_number - entry.round_number)
+
+    @staticmethod
+    def _entry(managers: dict, key: Tuple[int, int], record_index: int) -> IndexEntry:
+        """Snapshot the current state of a session's score manager."""
+        return IndexEntry(key[0], key[1], record_index, managers[key[0]].export_state())
+
+    @staticmethod
+    def _entry_struct(state_length: int) -> struct.Struct:
+        return struct.Struct(f"<QIQ{state_length}d")
+
+    @staticmethod
+    def _create_score_manager(score_manager_type: str) -> ScoreManager:
+        return ScoreManagerFactory.create_score_manager(score_manager_type, None, *_SNAPSHOT_PLAYER_NAMES)
@@ -0,0 +1,285 @@
+"""
+Append-only binary match log.
+
+Every round is written as one fixed-width little-endian record:
+
+    session id (uint64) | round number (uint32) | move 1 code (uint8) |
+    move 2 code (uint8) | round result (int8) | timeout flag (uint8)
+
+Records follow a small header identifying the format. Because every record
+has the same size and fields sit at fixed offsets, the reader can memory-map
+a log and locate any round by arithmetic, or scan a single field across all
+rounds with a strided slice, without creating a Python object per round.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from src.core.game_move import GameMove
+from src.constants import GameMessages, RecordingConstants, ScoringConstants
+
+RECORD_STRUCT = struct.Struct("<QIBBbB")
+RECORD_SIZE = RECORD_STRUCT.size
+
+HEADER_STRUCT = struct.Struct("<4sHH")
+HEADER_SIZE = HEADER_STRUCT.size
+HEADER = HEADER_STRUCT.pack(RecordingConstants.MATCH_LOG_MAGIC,
+                            RecordingConstants.MATCH_LOG_VERSION, RECORD_SIZE)
+
+# Byte offsets of the single-byte fields within a record
+RESULT_OFFSET = 14
+TIMEOUT_OFFSET = 15
+
+# Round result for each possible value of the unsigned result byte
+_RESULT_FROM_BYTE = {ScoringConstants.PLAYER_1_WIN: ScoringConstants.PLAYER_1_WIN,
+                     ScoringConstants.DRAW: ScoringConstants.DRAW,
+                     ScoringConstants.PLAYER_2_WIN & 0xFF: ScoringConstants.PLAYER_2_WIN}
+
+
+class MatchRecord(NamedTuple):
+    """
+    A single recorded round.
+
+    Move codes are the moves' values, or RecordingConstants.NO_MOVE_CODE
+    for a player who timed out; GameMove.get_move_by_value decodes them.
+    """
+    session_id: int
+    round_number: int
+    move_1: int
+    move_2: int
+    result: int
+    timed_out: int
+
+
+def encode_move(move: Optional[GameMove]) -> int:
+    """Return the move code recorded for a move (or for no move)."""
+    return RecordingConstants.NO_MOVE_CODE if move is None else move.get_value()
+
+
+class MatchRecorder:
+    """
+    Appends rounds to a match log.
+
+    Rounds belong to the current session (one game session, e.g. a series of
+    rounds between two players); round numbers restart at 1 with each new
+    session. Reopening an existing log continues after its last session.
+    Writes go through a buffered file, so call flush() or close() (or use the
+    recorder as a context manager) to be sure every round is on disk.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The log file, created if it does not exist
+
+        Raises:
+            ValueError: If the file exists but is not a match log
+        """
+        self.path = path
+        self._file = open(path, "a+b")
+        self._session_id = self._read_last_session_id()
+        self._round_number = 0
+        self._session_started = False
+        self._pack = RECORD_STRUCT.pack
+        self._write = self._file.write
+
+    def start_session(self, session_id: Optional[int] = None) -> int:
+        """
+        Begin a new session.
+
+        Args:
+            session_id: Id for the session, defaults to one more than the last
+
+        Returns:
+            The session id
+        """
+        self._session_id = self._session_id + 1 if session_id is None else session_id
+        self._round_number = 0
+        self._session_started = True
+        return self._session_id
+
+    def record_round(self, move_1: Optional[GameMove], move_2: Optional[GameMove],
+                     round_result: int) -> None:
+        """
+        Append a round to the current session, starting one if needed.
+
+        Args:
+            move_1: The first player's move (None if timed out)
+            move_2: The second player's move (None if timed out)
+            round_result: 1 if player 1 won, -1 if player 2 won, 0 if draw
+        """
+        if not self._session_started:
+            self.start_session()
+        self._round_number += 1
+        timed_out = move_1 is None or move_2 is None
+        self._write(self._pack(self._session_id, self._round_number,
+                               encode_move(move_1), encode_move(move_2),
+                               round_result, timed_out))
+
+    def flush(self) -> None:
+        """Write any buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "MatchRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_last_session_id(self) -> int:
+        """Write the header to a new log, or validate an existing one and return its last session id."""
+        size = self._file.seek(0, os.SEEK_END)
+        if size == 0:
+            self._file.write(HEADER)
+            return 0
+
+        self._file.seek(0)
+        _check_header(self.path, self._file.read(HEADER_SIZE))
+        record_count = (size - HEADER_SIZE) // RECORD_SIZE
+        if record_count == 0:
+            return 0
+        # Drop any partial record left by an interrupted write so appends stay aligned
+        self._file.truncate(HEADER_SIZE + record_count * RECORD_SIZE)
+        self._file.seek(HEADER_SIZE + (record_count - 1) * RECORD_SIZE)
+        return RECORD_STRUCT.unpack(self._file.read(RECORD_SIZE))[0]
+
+
+class MatchLogReader:
+    """
+    Read-only, memory-mapped view of a match log.
+
+    Records are decoded only when indexed or iterated; the aggregate methods
+    work on strided byte slices of the mapping, a chunk at a time, so even
+    very large logs are scanned in bounded memory.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The log file
+
+        Raises:
+            ValueError: If the file is not a match log
+        """
+        self.path = path
+        with open(path, "rb") as log_file:
+            _check_header(path, log_file.read(HEADER_SIZE))
+            self._mmap = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        # A trailing partial record (from an interrupted write) is ignored
+        self._record_count = (len(self._mmap) - HEADER_SIZE) // RECORD_SIZE
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __getitem__(self, index: int) -> MatchRecord:
+        if index < 0:
+            index += self._record_count
+        if not 0 <= index < self._record_count:
+            raise IndexError("match log index out of range")
+        return MatchRecord._make(RECORD_STRUCT.unpack_from(self._mmap, HEADER_SIZE + index * RECORD_SIZE))
+
+    def __iter__(self) -> Iterator[MatchRecord]:
+        return self.records()
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[MatchRecord]:
+        """
+        Iterate over a range of records in file order.
+
+        Args:
+            start: Index of the first record
+            stop: Index after the last record, defaults to the end of the log
+        """
+        stop = self._record_count if stop is None else min(stop, self._record_count)
+        chunk_bytes = RecordingConstants.SCAN_CHUNK_RECORDS * RECORD_SIZE
+        end = HEADER_SIZE + stop * RECORD_SIZE
+        for offset in range(HEADER_SIZE + start * RECORD_SIZE, end, chunk_bytes):
+            # Copying a chunk out keeps no buffer exported, so close() always succeeds
+            chunk = self._mmap[offset:min(offset + chunk_bytes, end)]
+            yield from map(MatchRecord._make, RECORD_STRUCT.iter_unpack(chunk))
+
+    def session(self, session_id: int) -> Iterator[MatchRecord]:
+        """Iterate over the rounds of one session."""
+        return (record for record in self if record.session_id == session_id)
+
+    def result_counts(self) -> Dict[int, int]:
+        """
+        Count round results across the whole log.
+
+        Returns:
+            Mapping of round result (1, -1, 0) to the number of rounds
+        """
+        counts = dict.fromkeys(_RESULT_FROM_BYTE.values(), 0)
+        for results in self._field_chunks(RESULT_OFFSET):
+            for byte, result in _RESULT_FROM_BYTE.items():
+                counts[result] += results.count(byte)
+        return counts
+
+    def timeout_count(self) -> int:
+        """Return the number of rounds in which at least one player timed out."""
+        return sum(flags.count(1) for flags in self._field_chunks(TIMEOUT_OFFSET))
+
+    def replay(self, score_manager, session_id: Optional[int] = None) -> int:
+        """
+        Feed recorded round results to a score manager, in order.
+
+        Args:
+            score_manager: The score manager to update
+            session_id: Replay only this session, defaults to the whole log
+
+        Returns:
+            The number of rounds replayed
+        """
+        update_scores = score_manager.update_scores_for_round
+        rounds = 0
+        if session_id is None:
+            for results in self._field_chunks(RESULT_OFFSET):
+                for byte in results:
+                    update_scores(_RESULT_FROM_BYTE[byte])
+                rounds += len(results)
+        else:
+            for record in self.session(session_id):
+                update_scores(record.result)
+                rounds += 1
+        return rounds
+
+    def to_numpy(self):
+        """
+        Return the log as a zero-copy numpy structured array (requires numpy).
+
+        The array shares memory with the mapping, so it must be released
+        before the reader is closed.
+        """
+        import numpy as np
+
+        dtype = np.dtype([("session_id", "<u8"), ("round_number", "<u4"), ("move_1", "u1"),
+                          ("move_2", "u1"), ("result", "i1"), ("timed_out", "u1")])
+        return np.frombuffer(self._mmap, dtype=dtype, count=self._record_count, offset=HEADER_SIZE)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "MatchLogReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _field_chunks(self, field_offset: int) -> Iterator[bytes]:
+        """Yield one single-byte field of every record, a chunk of records at a time."""
+        chunk_bytes = RecordingConstants.SCAN_CHUNK_RECORDS * RECORD_SIZE
+        end = HEADER_SIZE + self._record_count * RECORD_SIZE
+        for start in range(HEADER_SIZE, end, chunk_bytes):
+            yield self._mmap[start + field_offset:min(start + chunk_bytes, end):RECORD_SIZE]
+
+
+def _check_header(path: str, header: bytes) -> None:
+    """Raise ValueError unless the bytes are the header this module writes."""
+    if header != HEADER:
+        raise ValueError(GameMessages.INVALID_MATCH_LOG.format(
+            path=path, version=RecordingConstants.MATCH_LOG_VERSION
+        ))
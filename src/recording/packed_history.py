@@ -0,0 +1,298 @@
+"""
+Bit-packed, block-compressed storage for RPS round history.
+
+A round needs very little information: each move is one of three RPS moves
+or no move (a timeout), which fits in 2 bits, and the result (-1, 0 or 1)
+fits in 2 more. Each round is therefore packed into a 6-bit code,
+
+    move 1 value << 4 | move 2 value << 2 | (result + 1)
+
+with 0 standing for "no move", and four codes share 3 bytes. The packed
+rounds are split into fixed-size blocks, each compressed with zlib, and an
+index of the blocks is written at the end of the file. A reader only
+decompresses the blocks that overlap the range of rounds it is asked for.
+
+File layout: header | compressed blocks | block index | trailer.
+"""
+
+import bisect
+import struct
+import sys
+import zlib
+from array import array
+from itertools import product
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.games.rps.rps_move import RPSMove
+from src.constants import GameMessages, RecordingConstants, ScoringConstants
+
+# A round as stored: (move 1, move 2, result), with None for a timed-out move
+Round = Tuple[Optional[RPSMove], Optional[RPSMove], int]
+
+HEADER_STRUCT = struct.Struct("<4sHI")        # magic, version, rounds per block
+INDEX_ENTRY_STRUCT = struct.Struct("<QII")    # offset, compressed size, round count
+TRAILER_STRUCT = struct.Struct("<QI4s")       # index offset, block count, magic
+
+_ROUNDS_PER_WORD = 4
+_BYTES_PER_WORD = 3
+_RESULTS = (ScoringConstants.PLAYER_2_WIN, ScoringConstants.DRAW, ScoringConstants.PLAYER_1_WIN)
+
+
+def _build_tables():
+    """Map every valid round to its 6-bit code, and every code back to its round."""
+    move_codes = [(None, 0)] + [(move, move.get_value()) for move in RPSMove.get_all_moves()]
+    if max(code for _, code in move_codes) > 3:
+        raise ValueError("RPS move values must fit in 2 bits")
+
+    code_from_round = {}
+    round_from_code: List[Optional[Round]] = [None] * 64
+    for (move_1, code_1), (move_2, code_2), result in product(move_codes, move_codes, _RESULTS):
+        code = code_1 << 4 | code_2 << 2 | (result + 1)
+        code_from_round[(move_1, move_2, result)] = code
+        round_from_code[code] = (move_1, move_2, result)
+
+    # Decoded rounds for every 12-bit half word (two codes), so decoding is two lookups per word
+    round_pairs = [tuple(round_from_code[half >> shift & 0x3F] for shift in (0, 6))
+                   for half in range(1 << 12)]
+    return code_from_round, round_pairs
+
+
+_CODE_FROM_ROUND, _ROUND_PAIRS = _build_tables()
+
+
+def pack_codes(codes: bytes) -> bytes:
+    """
+    Pack 6-bit round codes (one per byte) four to every three bytes.
+
+    Args:
+        codes: Round codes; the last word is padded with zero codes
+
+    Returns:
+        The packed bytes
+    """
+    padding = -len(codes) % _ROUNDS_PER_WORD
+    codes_iter = iter(bytes(codes) + bytes(padding))
+    words = array("I", [a | b << 6 | c << 12 | d << 18
+                        for a, b, c, d in zip(codes_iter, codes_iter, codes_iter, codes_iter)])
+    if sys.byteorder == "big":
+        words.byteswap()
+    packed = bytearray(words.tobytes())
+    # Each little-endian 32-bit word holds 24 bits of codes; drop its empty top byte
+    del packed[_BYTES_PER_WORD::words.itemsize]
+    return bytes(packed)
+
+
+def unpack_rounds(packed: bytes, round_count: int) -> List[Round]:
+    """
+    Decode packed round codes back into rounds.
+
+    Args:
+        packed: Bytes produced by pack_codes
+        round_count: Number of rounds packed (excluding padding)
+
+    Returns:
+        The decoded (move 1, move 2, result) rounds
+    """
+    word_count = len(packed) // _BYTES_PER_WORD
+    words = array("I")
+    widened = bytearray(word_count * words.itemsize)
+    for byte in range(_BYTES_PER_WORD):
+        widened[byte::words.itemsize] = packed[byte::_BYTES_PER_WORD]
+    words.frombytes(widened)
+    if sys.byteorder == "big":
+        words.byteswap()
+
+    rounds: List[Round] = []
+    extend = rounds.extend
+    pairs = _ROUND_PAIRS
+    for word in words:
+        extend(pairs[word & 0xFFF])
+        extend(pairs[word >> 12])
+    del rounds[round_count:]
+    return rounds
+
+
+class PackedHistoryWriter:
+    """
+    Writes rounds to a bit-packed history file.
+
+    Rounds are buffered as codes until a block is full, then packed and
+    compressed. The block index is written by close(), so the file is only
+    readable once the writer has been closed (or used as a context manager).
+    """
+
+    def __init__(self, path: str, block_rounds: int = RecordingConstants.HISTORY_BLOCK_ROUNDS,
+                 compression_level: int = RecordingConstants.HISTORY_COMPRESSION_LEVEL):
+        """
+        Args:
+            path: The file to create (an existing file is replaced)
+            block_rounds: Rounds per compressed block; smaller blocks make range reads cheaper
+            compression_level: zlib compression level
+        """
+        if block_rounds < 1 or block_rounds % _ROUNDS_PER_WORD:
+            raise ValueError(f"block_rounds must be a positive multiple of {_ROUNDS_PER_WORD}")
+        self.path = path
+        self.block_rounds = block_rounds
+        self.compression_level = compression_level
+        self._file = open(path, "wb")
+        self._file.write(HEADER_STRUCT.pack(RecordingConstants.HISTORY_MAGIC,
+                                            RecordingConstants.HISTORY_VERSION, block_rounds))
+        self._codes = bytearray()
+        self._index: List[Tuple[int, int, int]] = []
+
+    def append(self, move_1: Optional[RPSMove], move_2: Optional[RPSMove], round_result: int) -> None:
+        """Add a single round (a None move is a timeout)."""
+        self.extend(((move_1, move_2, round_result),))
+
+    def extend(self, rounds: Iterable[Round]) -> None:
+        """
+        Add rounds, each a (move 1, move 2, result) tuple.
+
+        Raises:
+            ValueError: If a round cannot be represented
+        """
+        try:
+            self._codes.extend(map(_CODE_FROM_ROUND.__getitem__, rounds))
+        except (KeyError, TypeError) as error:
+            raise ValueError(GameMessages.INVALID_HISTORY_ROUND.format(round=error)) from None
+        while len(self._codes) >= self.block_rounds:
+            self._write_block(self._codes[:self.block_rounds])
+            del self._codes[:self.block_rounds]
+
+    def close(self) -> None:
+        """Write the last partial block and the block index, then close the file."""
+        if self._file.closed:
+            return
+        if self._codes:
+            self._write_block(self._codes)
+            self._codes.clear()
+        index_offset = self._file.tell()
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY_STRUCT.pack(*entry))
+        self._file.write(TRAILER_STRUCT.pack(index_offset, len(self._index),
+                                             RecordingConstants.HISTORY_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "PackedHistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_block(self, codes: bytes) -> None:
+        compressed = zlib.compress(pack_codes(codes), self.compression_level)
+        self._index.append((self._file.tell(), len(compressed), len(codes)))
+        self._file.write(compressed)
+
+
+class PackedHistoryReader:
+    """
+    Reads ranges of rounds from a bit-packed history file.
+
+    The block index is loaded when the file is opened; each read then
+    decompresses only the blocks it needs. The most recently decoded block
+    is kept, so sequential small reads do not decompress a block repeatedly.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The history file
+
+        Raises:
+            ValueError: If the file is not a complete history file
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._load_index()
+        except (ValueError, struct.error):
+            self._file.close()
+            raise ValueError(GameMessages.INVALID_HISTORY_FILE.format(
+                path=path, version=RecordingConstants.HISTORY_VERSION
+            )) from None
+        except BaseException:
+            self._file.close()
+            raise
+        self._cached_block: Optional[int] = None
+        self._cached_rounds: List[Round] = []
+
+    def __len__(self) -> int:
+        return self._block_starts[-1]
+
+    @property
+    def block_count(self) -> int:
+        return len(self._index)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Round]:
+        """
+        Decode a range of rounds.
+
+        Negative indices count from the end of the history, as in a slice.
+
+        Args:
+            start: Index of the first round
+            stop: Index after the last round, defaults to the end of the history
+
+        Returns:
+            The rounds in the range, as (move 1, move 2, result) tuples
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        rounds: List[Round] = []
+        if start >= stop:
+            return rounds
+        first_block = bisect.bisect_right(self._block_starts, start) - 1
+        last_block = bisect.bisect_left(self._block_starts, stop) - 1
+        for block in range(first_block, last_block + 1):
+            block_start = self._block_starts[block]
+            block_rounds = self._decode_block(block)
+            rounds.extend(block_rounds[max(start - block_start, 0):stop - block_start])
+        return rounds
+
+    def __iter__(self) -> Iterator[Round]:
+        for block in range(len(self._index)):
+            yield from self._decode_block(block)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "PackedHistoryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _load_index(self) -> None:
+        file_size = self._file.seek(0, 2)
+        if file_size < HEADER_STRUCT.size + TRAILER_STRUCT.size:
+            raise ValueError(file_size)
+
+        self._file.seek(0)
+        magic, version, _ = HEADER_STRUCT.unpack(self._file.read(HEADER_STRUCT.size))
+        if magic != RecordingConstants.HISTORY_MAGIC or version != RecordingConstants.HISTORY_VERSION:
+            raise ValueError(magic)
+
+        index_end = self._file.seek(-TRAILER_STRUCT.size, 2)
+        index_offset, block_count, magic = TRAILER_STRUCT.unpack(self._file.read(TRAILER_STRUCT.size))
+        if magic != RecordingConstants.HISTORY_MAGIC:
+            raise ValueError(magic)
+        if not HEADER_STRUCT.size <= index_offset <= index_end - block_count * INDEX_ENTRY_STRUCT.size:
+            raise ValueError(index_offset)
+
+        self._file.seek(index_offset)
+        index_bytes = self._file.read(block_count * INDEX_ENTRY_STRUCT.size)
+        self._index = list(INDEX_ENTRY_STRUCT.iter_unpack(index_bytes))
+
+        # Round number at which each block starts, plus the total at the end
+        self._block_starts = [0]
+        for _, _, round_count in self._index:
+            self._block_starts.append(self._block_starts[-1] + round_count)
+
+    def _decode_block(self, block: int) -> List[Round]:
+        if block != self._cached_block:
+            offset, size, round_count = self._index[block]
+            self._file.seek(offset)
+            packed = zlib.decompress(self._file.read(size))
+            self._cached_rounds = unpack_rounds(packed, round_count)
+            self._cached_block = block
+        return self._cached_rounds
@@ -0,0 +1,113 @@
+"""
+Asyncio TCP server hosting concurrent Rock-Paper-Scissors sessions.
+
+Each connection gets its own AsyncRPSGame with stream-backed input and
+output providers. All sessions share a single event loop, so a player who
+is thinking only holds a suspended coroutine, not a thread or a process.
+
+Run from the repository root:
+    python -m src.server.game_server [port] [metrics_port]
+
+The server listens on 127.0.0.1 unless RPS_SERVER_HOST names another
+interface (0.0.0.0 for all of them, as needed inside a container).
+
+With a metrics port, Prometheus metrics for every session are served at
+http://<host>:<metrics_port>/metrics, where the host is 127.0.0.1 unless
+RPS_METRICS_HOST is set.
+"""
+
+import asyncio
+import os
+import sys
+
+from src.games.rps.rps_game_async import AsyncRPSGame
+from src.io_utils.input_provider_stream import InputProviderStream
+from src.io_utils.output_provider_stream import OutputProviderStream
+from src.constants import MetricsConstants, ServerConstants
+
+
+class GameServer:
+    """
+    Accepts TCP connections and runs one game session per connection.
+    """
+
+    def __init__(self, host: str = ServerConstants.DEFAULT_HOST, port: int = ServerConstants.DEFAULT_PORT,
+                 metrics=None):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; with 0 the OS picks a free port
+            metrics: Optional GameMetrics shared by every session
+        """
+        self.host = host
+        self.port = port
+        self.metrics = metrics
+        self.active_sessions = 0
+        self.completed_sessions = 0
+        self._server = None
+
+    async def start(self) -> None:
+        """Start listening. With port 0 the OS picks a free port, available as self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run a game session for a single client connection."""
+        output_provider = OutputProviderStream(writer)
+        input_provider = InputProviderStream(reader, output_provider)
+        game = AsyncRPSGame(input_provider, output_provider, metrics=self.metrics)
+
+        self.active_sessions += 1
+        try:
+            await game.start_game_async()
+        except (EOFError, ConnectionError):
+            # The client disconnected; only this session ends
+            pass
+        finally:
+            self.active_sessions -= 1
+            self.completed_sessions += 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main():
+    """Run the game server until interrupted."""
+    host = os.environ.get(ServerConstants.HOST_ENV_VAR) or ServerConstants.DEFAULT_HOST
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else ServerConstants.DEFAULT_PORT
+    metrics_server = None
+    metrics = None
+    if len(sys.argv) > 2:
+        from src.core.metrics import GameMetrics
+        from src.server.metrics_server import MetricsServer
+
+        metrics = GameMetrics()
+        metrics_host = os.environ.get(MetricsConstants.HOST_ENV_VAR) or MetricsConstants.DEFAULT_HOST
+        metrics_server = MetricsServer(metrics.registry, metrics_host, int(sys.argv[2]))
+        metrics_server.start()
+    server = GameServer(host, port, metrics=metrics)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+
+
+if __name__ == "__main__":
+    main()
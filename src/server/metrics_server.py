@@ -0,0 +1,73 @@
+"""
+HTTP endpoint serving a MetricsRegistry to Prometheus.
+
+The server runs on its own daemon threads, so scrapes are handled outside
+the game loop (and, since metric updates take no locks, never make it wait).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.core.metrics import MetricsRegistry
+from src.constants import MetricsConstants
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Answers GET /metrics with the registry's text exposition."""
+
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != MetricsConstants.PATH:
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", MetricsConstants.CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would otherwise flood stderr
+        pass
+
+
+class MetricsServer:
+    """Serves a registry at http://host:port/metrics on a background thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = MetricsConstants.DEFAULT_HOST,
+                 port: int = MetricsConstants.DEFAULT_PORT):
+        """
+        Args:
+            registry: The metrics to serve
+            host: Interface to listen on (local only by default)
+            port: Port to listen on; with 0 the OS picks a free port, available as self.port after start()
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self) -> None:
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": self.registry})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
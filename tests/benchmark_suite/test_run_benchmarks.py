@@ -0,0 +1,51 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from benchmarks import run_benchmarks
+from benchmarks.run_benchmarks import compare, load_baseline, regressions, save_baseline
+
+
+class TestBaselineComparison(unittest.TestCase):
+
+    def test_compare_reports_relative_change(self):
+        changes = compare({"fast": 90.0, "slow": 150.0, "new": 10.0}, {"fast": 100.0, "slow": 100.0})
+        self.assertAlmostEqual(changes["fast"], -0.1)
+        self.assertAlmostEqual(changes["slow"], 0.5)
+        self.assertIsNone(changes["new"])
+
+    def test_compare_ignores_zero_baselines(self):
+        self.assertEqual(compare({"broken": 5.0}, {"broken": 0.0}), {"broken": None})
+
+    def test_regressions_are_changes_over_the_threshold(self):
+        changes = {"faster": -0.3, "within": 0.25, "slower": 0.26, "new": None}
+        self.assertEqual(regressions(changes, 0.25), ["slower"])
+        self.assertEqual(regressions(changes, 0.0), ["within", "slower"])
+
+    def test_saved_baseline_loads_back(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baselines", "engine.json")
+            self.assertIsNone(load_baseline(path))
+            save_baseline(path, {"rules.determine_result": 120.5})
+            self.assertEqual(load_baseline(path), {"rules.determine_result": 120.5})
+
+    def test_committed_baseline_covers_every_benchmark(self):
+        baseline = load_baseline(run_benchmarks.DEFAULT_BASELINE)
+        self.assertIsNotNone(baseline)
+        self.assertEqual(sorted(baseline), sorted(run_benchmarks.BENCHMARKS))
+
+    def test_main_fails_only_on_regressions(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "engine.json")
+            save_baseline(path, {"score.standard.update": 100.0})
+            for measured, status in ((120.0, 0), (130.0, 1)):
+                with patch.object(run_benchmarks, "run", return_value={"score.standard.update": measured}):
+                    with redirect_stdout(io.StringIO()):
+                        self.assertEqual(run_benchmarks.main(["--baseline", path]), status)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import Mock
+
+from src.constants import ScoringConstants
+from src.core.deadline_scheduler import DeadlineScheduler
+from src.core.round_executor import RoundExecutor
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.players.human_player import HumanPlayer
+from src.players.player import Player
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1_000_000_000)
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = DeadlineScheduler(self.clock)
+
+    def test_millisecond_deadlines_expire_in_order(self):
+        self.scheduler.set_deadline("b", 0.250)
+        self.scheduler.set_deadline("a", 0.100)
+        self.scheduler.set_deadline("c", 1.5)
+
+        self.clock.advance(0.099)
+        self.assertEqual(self.scheduler.pop_expired(), [])
+        self.clock.advance(0.151)
+        self.assertEqual(self.scheduler.pop_expired(), ["a", "b"])
+        self.assertFalse(self.scheduler.is_expired("c"))
+        self.assertAlmostEqual(self.scheduler.remaining("c"), 1.25)
+
+    def test_cancel_and_replace(self):
+        expired = []
+        self.scheduler.set_deadline("a", 0.1, on_expire=expired.append)
+        self.scheduler.set_deadline("b", 0.1, on_expire=expired.append)
+        self.scheduler.cancel("a")
+        self.scheduler.set_deadline("b", 5)
+
+        self.clock.advance(1)
+        self.assertEqual(self.scheduler.pop_expired(), [])
+        self.assertEqual(expired, [])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertAlmostEqual(self.scheduler.next_expiry_in(), 4)
+
+    def test_thousands_of_independent_deadlines(self):
+        for player in range(5000):
+            self.scheduler.set_deadline(player, (player % 100) / 1000)
+        for player in range(0, 5000, 2):
+            self.scheduler.cancel(player)
+
+        self.clock.advance(0.050)
+        expired = self.scheduler.pop_expired()
+        self.assertEqual(len(expired), 1250)
+        self.assertTrue(all(player % 2 == 1 and player % 100 <= 50 for player in expired))
+        self.assertLessEqual(len(self.scheduler._heap), 2 * len(self.scheduler) + 64)
+
+
+class TestRoundExecutorDeadlines(unittest.TestCase):
+
+    def test_late_move_forfeits_round(self):
+        clock = FakeClock()
+        player_1 = Mock(spec=Player)
+        player_2 = Mock(spec=Player)
+        player_1.get_name.return_value = "Slow"
+        player_2.get_name.return_value = "Fast"
+        player_1.time_limit = 0.5
+        player_2.time_limit = 0.5
+
+        def slow_move():
+            clock.advance(0.6)
+            return RPSMove.ROCK
+
+        player_1.make_move.side_effect = slow_move
+        player_2.make_move.return_value = RPSMove.SCISSORS
+
+        output_provider = Mock()
+        executor = RoundExecutor(RPSRules(), output_provider)
+        executor.timeout_handler.deadline_scheduler = DeadlineScheduler(clock)
+        score_manager = StandardScoreManager(Mock(), "Slow", "Fast")
+
+        self.assertFalse(executor.execute_round(player_1, player_2, score_manager))
+        output_provider.output_player_timeout.assert_called_once_with("Slow", "Fast")
+        self.assertEqual(score_manager.get_player_score("Fast"), ScoringConstants.STANDARD_WIN_POINTS)
+
+    def test_each_prompt_gets_the_full_time_limit(self):
+        clock = FakeClock()
+        game = Mock()
+        game.metrics = None
+        game.input_provider.player_name_request.return_value = "Human"
+
+        def answer_after(seconds, answer):
+            def respond(*args):
+                clock.advance(seconds)
+                return answer
+            return respond
+
+        answers = iter([answer_after(0.4, "9"), answer_after(0.4, "1"),  # two prompts, each in time
+                        answer_after(0.6, "1")])                          # one prompt, too late
+        game.input_provider.player_rps_request.side_effect = lambda *args: next(answers)(*args)
+        human = HumanPlayer(game, 1, time_limit=0.5)
+        computer = Mock(spec=Player)
+        computer.get_name.return_value = "Computer"
+        computer.time_limit = 0
+        computer.make_move.return_value = RPSMove.SCISSORS
+
+        executor = RoundExecutor(RPSRules(), Mock())
+        executor.timeout_handler.deadline_scheduler = DeadlineScheduler(clock)
+        score_manager = StandardScoreManager(Mock(), "Human", "Computer")
+
+        self.assertTrue(executor.execute_round(human, computer, score_manager))
+        self.assertEqual(game.input_provider.player_rps_request.call_count, 2)
+        self.assertFalse(executor.execute_round(human, computer, score_manager))
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+
+from game import GameExit
+from src.core.event_bus import EventBus
+from src.core.events import (MovesMade, RoundResolved, RoundStarted, SeriesDecided, SessionEnded,
+                             TimeoutOccurred)
+from src.core.game_flow_manager import GameFlowManager
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.io_utils.output_provider import OutputProvider
+from src.players.player import Player
+from src.constants import ScoringConstants
+
+
+class FixedPlayer(Player):
+    """Player that always makes the same move (None to time out)."""
+
+    def __init__(self, name, move):
+        super().__init__(name, time_limit=0)
+        self.move = move
+
+    def make_move(self):
+        if self.move is GameExit:
+            raise GameExit()
+        return self.move
+
+
+class TestEventBus(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus()
+
+    def tearDown(self):
+        self.bus.close()
+
+    def test_subscribers_receive_the_event_types_they_asked_for(self):
+        everything, resolved = [], []
+        self.bus.subscribe(everything.append)
+        self.bus.subscribe(resolved.append, (RoundResolved,))
+
+        started = RoundStarted(1, 3)
+        result = RoundResolved(1, ScoringConstants.DRAW, (0.5, 0.5))
+        self.bus.publish(started)
+        self.bus.publish(result)
+        self.assertTrue(self.bus.drain(timeout=5))
+
+        self.assertEqual(everything, [started, result])
+        self.assertEqual(resolved, [result])
+
+    def test_slow_subscriber_does_not_block_publishing(self):
+        release = threading.Event()
+        fast = []
+        slow = self.bus.subscribe(lambda event: release.wait(), maxsize=2)
+        self.bus.subscribe(fast.append)
+
+        for round_number in range(10):
+            self.bus.publish(RoundStarted(round_number, 10))
+        self.assertTrue(self.bus.subscriptions[1].drain(timeout=5))
+        release.set()
+        self.assertTrue(self.bus.drain(timeout=5))
+
+        self.assertEqual(len(fast), 10)
+        # One event was being handled when the rest arrived; two more fitted in its queue
+        self.assertEqual(slow.delivered + slow.dropped, 10)
+        self.assertGreaterEqual(slow.dropped, 7)
+
+    def test_failing_subscriber_keeps_receiving_events(self):
+        received = []
+
+        def handler(event):
+            received.append(event)
+            raise ValueError("subscriber bug")
+
+        subscription = self.bus.subscribe(handler)
+        with self.assertLogs("src.core.event_bus", "ERROR"):
+            self.bus.publish(RoundStarted(1, 2))
+            self.bus.publish(RoundStarted(2, 2))
+            self.assertTrue(self.bus.drain(timeout=5))
+        self.assertEqual(len(received), 2)
+        self.assertEqual(subscription.failed, 2)
+
+    def test_unsubscribed_handler_receives_no_more_events(self):
+        received = []
+        subscription = self.bus.subscribe(received.append)
+        self.bus.publish(RoundStarted(1, 2))
+        self.bus.unsubscribe(subscription)
+        self.bus.publish(RoundStarted(2, 2))
+        self.assertEqual(received, [RoundStarted(1, 2)])
+
+    def test_async_subscriber_awaits_coroutine_handler(self):
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event)
+
+        async def scenario():
+            subscription = self.bus.subscribe_async(handler)
+            self.bus.publish(RoundStarted(1, 2))
+            # Published from another thread, as a round executor on a worker would
+            thread = threading.Thread(target=self.bus.publish, args=(RoundStarted(2, 2),))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0)
+            await subscription.drain()
+            self.bus.unsubscribe(subscription)
+            await subscription.wait_closed()
+
+        asyncio.run(scenario())
+        self.assertEqual(received, [RoundStarted(1, 2), RoundStarted(2, 2)])
+
+
+class TestEnginePublishesEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.events = []
+        self.bus.subscribe(self.events.append)
+        self.flow = GameFlowManager(RPSRules(), Mock(spec=OutputProvider), event_bus=self.bus)
+        self.score_manager = StandardScoreManager(Mock(), "Alice", "Bob")
+
+    def tearDown(self):
+        self.bus.close()
+
+    def play(self, player_1, player_2, **session_options):
+        session = self.flow.create_session(player_1, player_2, self.score_manager, **session_options)
+        try:
+            session.run()
+        finally:
+            self.assertTrue(self.bus.drain(timeout=5))
+
+    def test_round_events_in_order(self):
+        self.play(FixedPlayer("Alice", RPSMove.ROCK), FixedPlayer("Bob", RPSMove.SCISSORS), rounds_to_play=1)
+        self.assertEqual(self.events, [
+            RoundStarted(1, 1),
+            MovesMade(1, "Alice", "Bob", RPSMove.ROCK, RPSMove.SCISSORS),
+            RoundResolved(1, ScoringConstants.PLAYER_1_WIN, (1, 0)),
+            SessionEnded("Alice", "Bob", (1, 0), 1, False),
+        ])
+
+    def test_timeout_and_series_events(self):
+        self.play(FixedPlayer("Alice", None), FixedPlayer("Bob", RPSMove.PAPER))
+        self.assertIn(TimeoutOccurred(1, "player_1_timeout", ScoringConstants.PLAYER_2_WIN), self.events)
+        self.assertIsInstance(self.events[-2], SeriesDecided)
+        self.assertEqual(self.events[-2].winner, "Bob")
+        self.assertFalse(self.events[-1].cancelled)
+
+    def test_exit_publishes_cancelled_session(self):
+        with self.assertRaises(GameExit):
+            self.play(FixedPlayer("Alice", GameExit), FixedPlayer("Bob", RPSMove.PAPER), rounds_to_play=3)
+        self.assertEqual(self.events[-1], SessionEnded("Alice", "Bob", (0, 0), 0, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
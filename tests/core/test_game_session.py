@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import Mock
+
+from game import GameExit
+from src.core.game_flow_manager import GameFlowManager
+from src.core.game_session import CancellationToken, SessionCancelled, SessionState
+from src.games.rps.rps_game import RPSGame
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.io_utils.input_provider_scripted import InputProviderScripted
+from src.io_utils.output_provider import OutputProvider
+from src.players.player import Player
+from src.constants import GameConstants
+
+
+class FixedPlayer(Player):
+    """Player that always makes the same move."""
+
+    def __init__(self, name, move):
+        super().__init__(name, time_limit=0)
+        self.move = move
+
+    def make_move(self):
+        return self.move
+
+
+class ExitingPlayer(FixedPlayer):
+    """Player that exits the game on its first move."""
+
+    def make_move(self):
+        raise GameExit()
+
+
+class TestGameSession(unittest.TestCase):
+
+    def setUp(self):
+        self.flow = GameFlowManager(RPSRules(), Mock(spec=OutputProvider))
+        self.player_1 = FixedPlayer("Alice", RPSMove.ROCK)
+        self.player_2 = FixedPlayer("Bob", RPSMove.SCISSORS)
+        self.score_manager = StandardScoreManager(Mock(), "Alice", "Bob")
+
+    def test_standard_session_is_stepped_a_round_at_a_time(self):
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 3)
+        self.assertIs(session.state, SessionState.CREATED)
+        session.start()
+        self.assertIs(session.state, SessionState.RUNNING)
+        self.assertEqual([session.step(), session.step(), session.step()], [True, True, False])
+        self.assertTrue(session.is_complete())
+        session.finish()
+        self.assertIs(session.state, SessionState.FINISHED)
+        self.assertEqual(self.score_manager.get_player_score("Alice"), 3)
+
+    def test_best_of_series_ends_at_the_win_threshold(self):
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager)
+        session.run()
+        self.assertEqual(session.round_number - 1, 3)
+        self.flow.output_provider.output_series_winner.assert_called_once_with("Alice")
+
+    def test_cancellation_stops_the_session_before_the_next_round(self):
+        token = CancellationToken()
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 5,
+                                           cancellation=token)
+        session.start()
+        session.step()
+        token.cancel()
+        with self.assertRaises(SessionCancelled):
+            session.step()
+        self.assertIs(session.state, SessionState.CANCELLED)
+        self.assertEqual(self.score_manager.get_player_score("Alice"), 1)
+
+    def test_exit_during_a_round_cancels_the_session(self):
+        session = self.flow.create_session(ExitingPlayer("Alice", None), self.player_2, self.score_manager, 5)
+        session.start()
+        with self.assertRaises(GameExit):
+            session.step()
+        self.assertIs(session.state, SessionState.CANCELLED)
+
+    def test_begun_round_is_announced_once(self):
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 2)
+        session.start()
+        session.begin_round()
+        self.flow.output_provider.output_round_number.assert_called_once_with(1, 2)
+        session.step()
+        session.step()
+        self.assertEqual([call.args for call in self.flow.output_provider.output_round_number.call_args_list],
+                         [(1, 2), (2, 2)])
+
+    def test_begin_round_checks_cancellation(self):
+        token = CancellationToken()
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 2,
+                                           cancellation=token)
+        session.start()
+        token.cancel()
+        with self.assertRaises(SessionCancelled):
+            session.begin_round()
+        self.assertIs(session.state, SessionState.CANCELLED)
+        self.flow.output_provider.output_round_number.assert_not_called()
+
+    def test_abort_ends_a_running_session(self):
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 2)
+        session.start()
+        session.abort()
+        self.assertIs(session.state, SessionState.CANCELLED)
+        with self.assertRaises(RuntimeError):
+            session.step()
+
+    def test_steps_are_rejected_outside_a_running_session(self):
+        session = self.flow.create_session(self.player_1, self.player_2, self.score_manager, 1)
+        with self.assertRaises(RuntimeError):
+            session.step()
+        session.run()
+        with self.assertRaises(RuntimeError):
+            session.start()
+
+
+class TestGameReuse(unittest.TestCase):
+
+    def test_one_game_runs_many_sessions_in_one_process(self):
+        game = RPSGame(InputProviderScripted([]), Mock(spec=OutputProvider))
+        for game_number in range(20):
+            game.input_provider = InputProviderScripted(["1", f"Player {game_number}", "2", "1", "3", "n"])
+            game.start_game()
+            self.assertEqual(game.input_provider.answers_used, 6)
+        self.assertEqual(game.output_provider.output_end_game.call_count, 20)
+
+    def test_exit_command_ends_the_game_without_exiting_the_process(self):
+        game = RPSGame(InputProviderScripted(["1", "Alice", "3", "1", GameConstants.EXIT_COMMAND]),
+                       Mock(spec=OutputProvider))
+        game.start_game()
+        game.output_provider.output_end_game.assert_called_once()
+
+    def test_cancelled_game_stops_before_its_next_round(self):
+        game = RPSGame(InputProviderScripted(["1", "Alice", "5", "1", "2", "3"]), Mock(spec=OutputProvider))
+        game.output_provider.output_scores_table.side_effect = lambda scores: game.cancel()
+        game.start_game()
+        self.assertEqual(game.output_provider.output_scores_table.call_count, 1)
+        self.assertEqual(game.input_provider.remaining_buffered(), ["2", "3"])
+        game.output_provider.output_end_game.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+from unittest.mock import Mock
+
+from src.core.game_flow_manager import GameFlowManager
+from src.core.headless_simulator import HeadlessSimulator
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.players.computer_player import ComputerPlayer
+from src.players.player import Player
+
+
+class TestHeadlessSimulator(unittest.TestCase):
+
+    def test_matches_interactive_standard_rounds_for_same_seed(self):
+        game = Mock()
+
+        random.seed(1234)
+        player_1 = ComputerPlayer(game, 1)
+        player_2 = ComputerPlayer(game, 2)
+        interactive_scores = StandardScoreManager(game, player_1.get_name(), player_2.get_name())
+        GameFlowManager(RPSRules(), Mock()).play_standard_rounds(
+            200, player_1, player_2, interactive_scores
+        )
+
+        random.seed(1234)
+        result = HeadlessSimulator(RPSRules()).simulate_rounds(
+            200, ComputerPlayer(game, 1), ComputerPlayer(game, 2)
+        )
+
+        self.assertEqual(result.rounds_played, 200)
+        self.assertEqual(result.player_1_wins + result.player_2_wins + result.draws, 200)
+        self.assertEqual(result.player_1_score, interactive_scores.get_player_score(player_1.get_name()))
+        self.assertEqual(result.player_2_score, interactive_scores.get_player_score(player_2.get_name()))
+
+    def test_timeouts_forfeit_the_round(self):
+        player_1 = Mock(spec=Player)
+        player_2 = Mock(spec=Player)
+        player_1.get_name.return_value = "Player1"
+        player_2.get_name.return_value = "Player2"
+        player_1.make_move.side_effect = [None, RPSMove.ROCK, None]
+        player_2.make_move.side_effect = [RPSMove.ROCK, None, None]
+
+        result = HeadlessSimulator(RPSRules()).simulate_rounds(3, player_1, player_2)
+
+        self.assertEqual(result.timeouts, 3)
+        self.assertEqual(result.player_1_wins, 1)
+        self.assertEqual(result.player_2_wins, 1)
+        self.assertEqual(result.draws, 1)
+        self.assertEqual(result.player_1_score, 1.5)
+        self.assertEqual(result.player_2_score, 1.5)
+
+    def test_series_stop_at_win_threshold(self):
+        player_1 = Mock(spec=Player)
+        player_2 = Mock(spec=Player)
+        player_1.get_name.return_value = "Player1"
+        player_2.get_name.return_value = "Player2"
+        player_1.make_move.return_value = RPSMove.ROCK
+        player_2.make_move.return_value = RPSMove.SCISSORS
+
+        result = HeadlessSimulator(RPSRules()).simulate_series(4, player_1, player_2)
+
+        self.assertEqual(result.player_1_series_wins, 4)
+        self.assertEqual(result.player_2_series_wins, 0)
+        self.assertEqual(result.rounds_played, 12)
@@ -0,0 +1,87 @@
+import itertools
+import random
+import unittest
+from unittest.mock import Mock
+
+from src.core.instrumentation import (LatencyHistogram, RoundInstrumentation, PHASE_INPUT,
+                                      PHASE_LEARNING, PHASE_OUTPUT, PHASE_RULES,
+                                      PHASE_SCORING, PHASE_TIMEOUT)
+from src.core.round_executor import RoundExecutor
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets_are_contiguous_and_bound_their_values(self):
+        previous = 0
+        for value in list(range(200)) + [1000, 12345, 10 ** 6, 10 ** 9, 2 ** 39 + 5]:
+            index = LatencyHistogram.bucket_index(value)
+            self.assertGreaterEqual(index, previous)
+            upper = LatencyHistogram.bucket_upper_bound(index)
+            self.assertGreaterEqual(upper, value)
+            self.assertLessEqual(upper - value, value * 0.035)
+            previous = index
+
+    def test_percentiles_within_bucket_precision(self):
+        rng = random.Random(3)
+        values = sorted(rng.randint(100, 5_000_000) for _ in range(10_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 95, 99):
+            exact = values[int(len(values) * percentile / 100) - 1]
+            self.assertAlmostEqual(histogram.percentile(percentile), exact, delta=exact * 0.035)
+        self.assertEqual(histogram.percentile(100), values[-1])
+        self.assertEqual((histogram.count, histogram.min, histogram.max), (10_000, values[0], values[-1]))
+
+    def test_merge_and_empty(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        self.assertEqual(first.percentile(99), 0)
+        first.record(10)
+        second.record(30)
+        first.merge(second)
+        self.assertEqual((first.count, first.min, first.max, first.mean()), (2, 10, 30, 20))
+
+
+class TestRoundInstrumentation(unittest.TestCase):
+
+    def _executor(self, instrumentation):
+        return RoundExecutor(RPSRules(), Mock(), instrumentation=instrumentation)
+
+    def _player(self, move):
+        player = Mock(time_limit=None)
+        player.make_move.return_value = move
+        player.get_name.return_value = str(move)
+        return player
+
+    def test_each_phase_is_timed(self):
+        instrumentation = RoundInstrumentation(clock=itertools.count(0, 100).__next__)
+        executor = self._executor(instrumentation)
+        scores = StandardScoreManager(Mock(), "Rock", "Paper")
+
+        executor.execute_round(self._player(RPSMove.ROCK), self._player(RPSMove.PAPER), scores, 1, 3)
+        executor.execute_round(self._player(None), self._player(RPSMove.PAPER), scores, 2, 3)
+
+        report = instrumentation.report()
+        self.assertEqual(report[PHASE_INPUT]["count"], 2)
+        self.assertEqual(report[PHASE_TIMEOUT]["count"], 2)
+        for phase in (PHASE_RULES, PHASE_SCORING, PHASE_LEARNING):
+            self.assertEqual(report[phase]["count"], 1)
+        # Round headers, moves, description and leaderboard
+        self.assertEqual(report[PHASE_OUTPUT]["count"], 5)
+        self.assertEqual(report[PHASE_RULES]["p99"], 100)
+        self.assertIn("p95 (us)", instrumentation.format_report())
+
+    def test_disabled_instrumentation_plays_rounds_normally(self):
+        executor = self._executor(None)
+        scores = StandardScoreManager(Mock(), "Rock", "Scissors")
+        self.assertTrue(executor.execute_round(self._player(RPSMove.ROCK),
+                                               self._player(RPSMove.SCISSORS), scores))
+        self.assertEqual(scores.get_player_score("Rock"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
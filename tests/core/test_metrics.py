@@ -0,0 +1,102 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+from src.core.metrics import GameMetrics, MetricsRegistry
+from src.games.rps.rps_game import RPSGame
+from src.io_utils.input_provider_scripted import InputProviderScripted
+from src.io_utils.output_provider import OutputProvider
+from src.constants import ScriptedInputConstants
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_updates_from_many_threads_are_all_counted(self):
+        counter = self.registry.counter("events_total", "Events")
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.value(), 80_000)
+
+    def test_render_text_exposition(self):
+        counter = self.registry.counter("rounds_total", "Rounds played", ("result",))
+        counter.labels("draw").inc()
+        counter.labels("player_1").inc(2)
+        gauge = self.registry.gauge("active", "Active sessions")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        histogram = self.registry.histogram("duration_seconds", "Durations", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        self.assertEqual(self.registry.render(), "\n".join([
+            "# HELP rounds_total Rounds played",
+            "# TYPE rounds_total counter",
+            'rounds_total{result="draw"} 1',
+            'rounds_total{result="player_1"} 2',
+            "# HELP active Active sessions",
+            "# TYPE active gauge",
+            "active 1",
+            "# HELP duration_seconds Durations",
+            "# TYPE duration_seconds histogram",
+            'duration_seconds_bucket{le="0.1"} 1',
+            'duration_seconds_bucket{le="1.0"} 3',
+            'duration_seconds_bucket{le="+Inf"} 4',
+            "duration_seconds_sum 6.05",
+            "duration_seconds_count 4",
+        ]) + "\n")
+
+    def test_gauge_set_and_function(self):
+        gauge = self.registry.gauge("level", "Level")
+        gauge.inc(5)
+        gauge.set(2)
+        gauge.inc()
+        self.assertEqual(gauge.value(), 3)
+        gauge.set_function(lambda: 7)
+        self.assertEqual(gauge.value(), 7)
+
+    def test_invalid_use_is_rejected(self):
+        counter = self.registry.counter("things_total", "Things", ("kind",))
+        with self.assertRaises(ValueError):
+            counter.labels("a", "b")
+        with self.assertRaises(ValueError):
+            counter.labels("a").inc(-1)
+        with self.assertRaises(ValueError):
+            self.registry.counter("things_total", "Again")
+
+
+class TestGameMetrics(unittest.TestCase):
+
+    def test_game_hooks(self):
+        metrics = GameMetrics()
+        script = ["1", "Alice", "3", "9", "1", ScriptedInputConstants.TIMEOUT_TOKEN, "2", "y", "1", "3", "n"]
+        RPSGame(InputProviderScripted(script), Mock(spec=OutputProvider), metrics=metrics).start_game()
+
+        registry = metrics.registry
+        rounds = registry.get("rps_rounds_total")
+        self.assertEqual(sum(rounds.labels(result).value() for result in ("player_1", "player_2", "draw")), 4)
+        # Alice's timed-out move forfeits that round to the computer
+        self.assertGreaterEqual(rounds.labels("player_2").value(), 1)
+        self.assertEqual(registry.get("rps_timeouts_total").labels("player_1_timeout").value(), 1)
+        self.assertEqual(metrics.invalid_moves.value(), 1)
+        self.assertEqual(metrics.sessions_started.value(), 2)
+        self.assertEqual(metrics.sessions_finished.value(), 2)
+        self.assertEqual(metrics.active_sessions.value(), 0)
+        self.assertEqual(metrics.round_duration.snapshot()[0][-1], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
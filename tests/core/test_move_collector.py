@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from src.core.game_flow_manager import GameFlowManager
+from src.core.move_collector import ConcurrentMoveCollector, SequentialMoveCollector
+from src.core.timeout_handler import TimeoutHandler
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.io_utils.output_provider import OutputProvider
+from src.players.human_player import HumanPlayer
+from src.players.player import Player
+
+# Only reached if a test fails, e.g. players that should meet never run at once
+MEETING_TIMEOUT = 5.0
+
+
+class SlowPlayer(Player):
+    """Player that takes a fixed time to choose the same move, noting the thread it ran on."""
+
+    def __init__(self, name, move, think_time, time_limit=0):
+        super().__init__(name, time_limit)
+        self.move = move
+        self.think_time = think_time
+        self.threads = []
+
+    def make_move(self):
+        self.threads.append(threading.current_thread())
+        time.sleep(self.think_time)
+        return self.move
+
+
+class MeetingPlayer(SlowPlayer):
+    """Player that waits for every player sharing its barrier before choosing a move."""
+
+    def __init__(self, name, move, barrier):
+        super().__init__(name, move, 0.0)
+        self.barrier = barrier
+
+    def make_move(self):
+        self.threads.append(threading.current_thread())
+        self.barrier.wait()
+        return self.move
+
+
+class ConsolePlayer(SlowPlayer):
+    """SlowPlayer reading its moves from a given input source."""
+
+    def __init__(self, name, move, source):
+        super().__init__(name, move, 0.0)
+        self.source = source
+
+    def input_source(self):
+        return self.source
+
+
+class TestMoveCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.timeout_handler = TimeoutHandler(Mock(spec=OutputProvider))
+
+    def test_concurrent_round_asks_both_players_at_once(self):
+        # Each player waits for the other, so the round only completes if they choose at the same time
+        barrier = threading.Barrier(2, timeout=MEETING_TIMEOUT)
+        players = (MeetingPlayer("Alice", RPSMove.ROCK, barrier), MeetingPlayer("Bob", RPSMove.PAPER, barrier))
+        with ConcurrentMoveCollector() as collector:
+            moves = collector.collect_moves(players, self.timeout_handler)
+        self.assertEqual(moves, [RPSMove.ROCK, RPSMove.PAPER])
+        self.assertIs(players[0].threads[0], threading.current_thread())
+        self.assertIsNot(players[1].threads[0], threading.current_thread())
+
+    def test_timeouts_resolve_as_they_do_sequentially(self):
+        def players():
+            return (SlowPlayer("Alice", RPSMove.ROCK, 0.1, time_limit=0.05),
+                    SlowPlayer("Bob", RPSMove.PAPER, 0.0, time_limit=1))
+
+        sequential = SequentialMoveCollector().collect_moves(players(), self.timeout_handler)
+        with ConcurrentMoveCollector() as collector:
+            concurrent = collector.collect_moves(players(), self.timeout_handler)
+        self.assertEqual(sequential, [None, RPSMove.PAPER])
+        self.assertEqual(concurrent, sequential)
+
+    def test_players_sharing_an_input_are_asked_one_at_a_time(self):
+        console = object()
+        players = (ConsolePlayer("Alice", RPSMove.ROCK, console), ConsolePlayer("Bob", RPSMove.PAPER, console))
+        with ConcurrentMoveCollector() as collector:
+            moves = collector.collect_moves(players, self.timeout_handler)
+            self.assertIsNone(collector._executor)
+        self.assertEqual(moves, [RPSMove.ROCK, RPSMove.PAPER])
+        for player in players:
+            self.assertIs(player.threads[0], threading.current_thread())
+
+    def test_two_console_humans_share_the_game_input(self):
+        game = Mock()
+        game.metrics = None
+        game.input_provider.player_name_request.side_effect = ["Alice", "Bob"]
+        prompt_threads = []
+        game.input_provider.player_rps_request.side_effect = \
+            lambda *args: prompt_threads.append(threading.current_thread()) or "1"
+        players = (HumanPlayer(game, 1, time_limit=0), HumanPlayer(game, 2, time_limit=0))
+        with ConcurrentMoveCollector() as collector:
+            moves = collector.collect_moves(players, self.timeout_handler)
+        self.assertEqual(moves, [RPSMove.ROCK, RPSMove.ROCK])
+        self.assertEqual(prompt_threads, [threading.current_thread()] * 2)
+
+    def test_players_with_their_own_inputs_are_asked_at_once(self):
+        players = (ConsolePlayer("Alice", RPSMove.ROCK, object()), ConsolePlayer("Bob", RPSMove.PAPER, object()))
+        with ConcurrentMoveCollector() as collector:
+            collector.collect_moves(players, self.timeout_handler)
+        self.assertIsNot(players[1].threads[0], threading.current_thread())
+
+    def test_worker_exceptions_reach_the_round(self):
+        failing = SlowPlayer("Bob", RPSMove.PAPER, 0.0)
+        failing.make_move = Mock(side_effect=RuntimeError("disconnected"))
+        with ConcurrentMoveCollector() as collector:
+            with self.assertRaises(RuntimeError):
+                collector.collect_moves((SlowPlayer("Alice", RPSMove.ROCK, 0.0), failing), self.timeout_handler)
+
+    def test_game_flow_manager_plays_rounds_with_a_collector(self):
+        output_provider = Mock(spec=OutputProvider)
+        with ConcurrentMoveCollector() as collector:
+            flow = GameFlowManager(RPSRules(), output_provider, move_collector=collector)
+            score_manager = StandardScoreManager(Mock(), "Alice", "Bob")
+            flow.play_standard_rounds(3, SlowPlayer("Alice", RPSMove.ROCK, 0.0),
+                                      SlowPlayer("Bob", RPSMove.SCISSORS, 0.0), score_manager)
+        self.assertEqual(score_manager.get_player_score("Alice"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core import plugin_registry
+from src.core.plugin_registry import PluginRegistry, load_object
+from src.game_utils.game_rules_factory import GameRulesFactory
+from src.game_utils.score_manager import StreakScoreManager
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+from src.games.rps.rps_rules import RPSRules
+from src.constants import PluginConstants
+
+GROUP = "rps_arcade.test_plugins"
+
+
+class TestPluginRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.directory.name, "manifest.json")
+        plugin_registry._discovered_groups = None
+
+        # A plugin module that nothing has imported yet
+        self.module_name = f"lazy_plugin_{id(self)}"
+        with open(os.path.join(self.directory.name, f"{self.module_name}.py"), "w") as module_file:
+            module_file.write("class Plugin:\n    pass\n")
+        sys.path.insert(0, self.directory.name)
+
+    def tearDown(self):
+        sys.path.remove(self.directory.name)
+        sys.modules.pop(self.module_name, None)
+        plugin_registry._discovered_groups = None
+        self.directory.cleanup()
+
+    def _write_manifest(self, groups, fingerprint=None):
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump({"version": PluginConstants.MANIFEST_VERSION,
+                       "fingerprint": fingerprint or plugin_registry._environment_fingerprint(),
+                       "groups": groups}, manifest_file)
+
+    def test_builtins_are_imported_on_first_use(self):
+        registry = PluginRegistry(GROUP, {"lazy": f"{self.module_name}:Plugin"}, self.manifest_path)
+        self.assertIn("lazy", registry)
+        self.assertNotIn(self.module_name, sys.modules)
+        self.assertFalse(registry.is_loaded("lazy"))
+
+        plugin = registry.get("lazy")
+        self.assertEqual(plugin.__name__, "Plugin")
+        self.assertIs(registry.get("lazy"), plugin)
+        self.assertTrue(registry.is_loaded("lazy"))
+
+    def test_builtins_never_trigger_discovery(self):
+        registry = PluginRegistry(GROUP, {"lazy": f"{self.module_name}:Plugin"}, self.manifest_path)
+        with patch.object(plugin_registry, "discover_entry_points") as discover:
+            registry.get("lazy")
+        discover.assert_not_called()
+
+    def test_register_class_or_path(self):
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        registry.register("rules", RPSRules)
+        registry.register("streak", "src.game_utils.score_manager.StreakScoreManager")
+        self.assertIs(registry.get("rules"), RPSRules)
+        self.assertIs(registry.get("streak"), StreakScoreManager)
+
+    def test_entry_points_come_from_a_current_manifest(self):
+        self._write_manifest({GROUP: {"variant": f"{self.module_name}:Plugin"}})
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        with patch.object(plugin_registry, "_scan_entry_points") as scan:
+            self.assertEqual(registry.get("variant").__name__, "Plugin")
+            self.assertEqual(registry.names(), ["variant"])
+        scan.assert_not_called()
+
+    def test_stale_manifest_is_rescanned_without_being_rewritten(self):
+        self._write_manifest({GROUP: {"old": "missing:Plugin"}}, fingerprint=["another interpreter"])
+        with open(self.manifest_path) as manifest_file:
+            stale_manifest = manifest_file.read()
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        with patch.object(plugin_registry, "_scan_entry_points",
+                          return_value={GROUP: {"new": f"{self.module_name}:Plugin"}}) as scan:
+            self.assertNotIn("old", registry)
+            self.assertIn("new", registry)
+        scan.assert_called_once()
+        with open(self.manifest_path) as manifest_file:
+            self.assertEqual(manifest_file.read(), stale_manifest)
+
+    def test_lookup_of_unknown_name_writes_nothing(self):
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        with patch.object(plugin_registry, "_scan_entry_points", return_value={}):
+            self.assertNotIn("missing", registry)
+            self.assertEqual(registry.names(), [])
+        self.assertFalse(os.path.exists(self.manifest_path))
+
+    def test_refresh_rescans_and_rewrites_the_manifest(self):
+        self._write_manifest({GROUP: {"old": "missing:Plugin"}})
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        with patch.object(plugin_registry, "_scan_entry_points",
+                          return_value={GROUP: {"new": f"{self.module_name}:Plugin"}}):
+            registry.refresh()
+        self.assertIn("new", registry)
+        with open(self.manifest_path) as manifest_file:
+            self.assertEqual(json.load(manifest_file)["groups"], {GROUP: {"new": f"{self.module_name}:Plugin"}})
+
+    def test_unknown_name_raises_key_error(self):
+        self._write_manifest({})
+        registry = PluginRegistry(GROUP, manifest_path=self.manifest_path)
+        with self.assertRaises(KeyError):
+            registry.get("missing")
+
+    def test_load_object_accepts_both_path_forms(self):
+        self.assertIs(load_object("src.games.rps.rps_rules:RPSRules"), RPSRules)
+        self.assertIs(load_object("src.games.rps.rps_rules.RPSRules"), RPSRules)
+
+    def test_factories_resolve_builtins_and_reject_unknown_types(self):
+        self._write_manifest({})
+        with patch.dict(os.environ, {PluginConstants.MANIFEST_ENV_VAR: self.manifest_path}):
+            self.assertIsInstance(GameRulesFactory.create_rules("rps"), RPSRules)
+            self.assertIsInstance(ScoreManagerFactory.create_score_manager("streak", None, "A", "B"),
+                                  StreakScoreManager)
+            with self.assertRaises(ValueError):
+                ScoreManagerFactory.create_score_manager("unknown", None, "A", "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
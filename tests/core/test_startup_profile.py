@@ -0,0 +1,65 @@
+import os
+import unittest
+
+from src.core.startup_profile import ModuleImport, parse_import_times, profile_startup, summarise
+from src.constants import StartupConstants
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _signal
+import time:       300 |        300 |     src.constants
+import time:       450 |        750 |   src.core
+some other warning
+import time:      1000 |       1750 | game_paper_scissors_rock
+"""
+
+# Only needed once a game is under way (or never, for console play), so they must not load before the first prompt
+DEFERRED_MODULES = (
+    "signal", "threading", "json", "asyncio", "argparse", "numpy", "importlib.metadata",
+    "src.core.deadline_scheduler", "src.players.computer_player", "src.players.human_player",
+    "src.game_utils.score_manager", "src.recording.match_log", "src.core.headless_simulator",
+)
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def test_parse_import_times(self):
+        imports = parse_import_times(IMPORT_TIME_OUTPUT)
+        self.assertEqual(imports, [
+            ModuleImport("_signal", 120, 120, 1),
+            ModuleImport("src.constants", 300, 300, 2),
+            ModuleImport("src.core", 450, 750, 1),
+            ModuleImport("game_paper_scissors_rock", 1000, 1750, 0),
+        ])
+
+    def test_summarise_keeps_fastest_run_per_module(self):
+        first = parse_import_times(IMPORT_TIME_OUTPUT)
+        second = [module._replace(self_us=module.self_us * 2) for module in first]
+        second[0] = second[0]._replace(self_us=60)
+
+        report = summarise([first, second], top=2)
+        self.assertEqual(report["total_us"], 60 + 300 + 450 + 1000)
+        self.assertEqual(report["application_us"], 300 + 450 + 1000)
+        self.assertEqual([module["name"] for module in report["modules"]],
+                         ["game_paper_scissors_rock", "src.core"])
+        self.assertEqual(report["packages"], {"game_paper_scissors_rock": 1000, "src": 750, "_signal": 60})
+
+
+class TestDeferredImports(unittest.TestCase):
+    """Which modules load before the first prompt; unlike the import time budget, this does not depend on timing."""
+
+    def test_rarely_used_modules_are_not_imported_before_the_first_prompt(self):
+        imported = set(profile_startup(runs=1)["imported"])
+        self.assertEqual([name for name in DEFERRED_MODULES if name in imported], [])
+
+
+@unittest.skipUnless(os.environ.get(StartupConstants.PERF_TESTS_ENV_VAR),
+                     f"set {StartupConstants.PERF_TESTS_ENV_VAR}=1 to check wall-clock budgets")
+class TestStartupImportBudget(unittest.TestCase):
+
+    def test_application_imports_fit_the_budget(self):
+        report = profile_startup()
+        self.assertLessEqual(report["application_us"], StartupConstants.APPLICATION_IMPORT_BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
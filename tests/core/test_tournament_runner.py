@@ -0,0 +1,59 @@
+import unittest
+
+from src.core.tournament_runner import TournamentRunner
+from src.games.rps.rps_move import RPSMove
+from src.players.computer_player import ComputerPlayer
+
+
+class AlwaysRock(ComputerPlayer):
+    def make_move(self):
+        return RPSMove.ROCK
+
+
+class AlwaysPaper(ComputerPlayer):
+    def make_move(self):
+        return RPSMove.PAPER
+
+
+class AlwaysScissors(ComputerPlayer):
+    def make_move(self):
+        return RPSMove.SCISSORS
+
+
+STRATEGIES = {
+    "rock": AlwaysRock,
+    "paper": AlwaysPaper,
+    "random": ComputerPlayer,
+}
+
+
+class TestTournamentRunner(unittest.TestCase):
+
+    def test_schedule_covers_every_pairing_and_seed(self):
+        runner = TournamentRunner(STRATEGIES, rounds_per_match=10, seeds_per_pairing=3)
+        jobs = runner.schedule()
+        self.assertEqual(len(jobs), 9)
+        self.assertEqual(len({job.seed for job in jobs}), 9)
+        self.assertEqual({(job.strategy_1, job.strategy_2) for job in jobs},
+                         {("rock", "paper"), ("rock", "random"), ("paper", "random")})
+
+    def test_run_ranks_strategies(self):
+        runner = TournamentRunner({"rock": AlwaysRock, "paper": AlwaysPaper, "scissors": AlwaysScissors},
+                                  rounds_per_match=20)
+        result = runner.run(workers=2)
+
+        self.assertEqual(result.rounds_played, 60)
+        self.assertEqual(len(result.matches), 3)
+        # Each pure strategy beats exactly one other
+        for entry in result.standings:
+            self.assertEqual((entry.matches_won, entry.matches_lost), (1, 1))
+            self.assertEqual(entry.points, 1.0)
+
+    def test_results_are_reproducible_for_same_seeds(self):
+        runner = TournamentRunner(STRATEGIES, rounds_per_match=200, seeds_per_pairing=2, base_seed=7)
+        first = runner.run(workers=2)
+        second = runner.run(workers=1)
+        self.assertEqual(first.matches, second.matches)
+        self.assertEqual(first.standings, second.standings)
+        self.assertEqual(first.standings[0].strategy, "paper")
+        self.assertIn("Rounds W-L", TournamentRunner.format_standings(first.standings))
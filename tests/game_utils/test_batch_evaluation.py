@@ -0,0 +1,83 @@
+import importlib.util
+import random
+import unittest
+from unittest.mock import Mock, patch
+
+from src.game_utils.score_manager import StandardScoreManager, StreakScoreManager
+from src.games.rps.rps_rules import RPSRules
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class BatchEvaluationChecks:
+    """Checks run with numpy and against the pure-Python fallbacks."""
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.rules = RPSRules()
+        self.moves_1 = [rng.randrange(3) for _ in range(2000)]
+        self.moves_2 = [rng.randrange(3) for _ in range(2000)]
+        moves = self.rules.get_valid_moves()
+        self.expected_results = [self.rules.determine_result(moves[a], moves[b])
+                                 for a, b in zip(self.moves_1, self.moves_2)]
+
+    def test_batch_results_match_determine_result(self):
+        results = self.rules.determine_results_batch(self.moves_1, self.moves_2)
+        self.assertEqual(results.tolist(), self.expected_results)
+
+    def test_default_batch_implementation_matches_override(self):
+        results = super(RPSRules, self.rules).determine_results_batch(self.moves_1, self.moves_2)
+        self.assertEqual(results.tolist(), self.expected_results)
+
+    def test_standard_batch_scores_match_per_round_updates(self):
+        self._assert_batch_matches_loop(StandardScoreManager)
+
+    def test_streak_batch_scores_match_per_round_updates(self):
+        self._assert_batch_matches_loop(StreakScoreManager)
+
+    def test_streak_carries_across_batches(self):
+        results = self.rules.determine_results_batch(self.moves_1, self.moves_2)
+        looped = StreakScoreManager(Mock(), "Player 1", "Player 2")
+        batched = StreakScoreManager(Mock(), "Player 1", "Player 2")
+        for round_result in self.expected_results:
+            looped.update_scores_for_round(round_result)
+        for start in range(0, len(results), 7):
+            batched.update_scores_for_rounds(results[start:start + 7])
+        self.assertEqual(batched._scores, looped._scores)
+        self.assertEqual(batched._player_1_streak, looped._player_1_streak)
+        self.assertEqual(batched._player_2_streak, looped._player_2_streak)
+
+    def test_ordinals_outside_the_moves_are_rejected(self):
+        default_batch = super(RPSRules, self.rules).determine_results_batch
+        for determine_results_batch in (self.rules.determine_results_batch, default_batch):
+            for moves_1, moves_2 in (([-1], [0]), ([0], [-3]), ([3], [0]), ([0, 1], [2, 3])):
+                with self.assertRaises(IndexError):
+                    determine_results_batch(moves_1, moves_2)
+
+    def _assert_batch_matches_loop(self, manager_class):
+        looped = manager_class(Mock(), "Player 1", "Player 2")
+        batched = manager_class(Mock(), "Player 1", "Player 2")
+        for round_result in self.expected_results:
+            looped.update_scores_for_round(round_result)
+        batched.update_scores_for_rounds(self.rules.determine_results_batch(self.moves_1, self.moves_2))
+        self.assertEqual(batched._scores, looped._scores)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestBatchEvaluation(BatchEvaluationChecks, unittest.TestCase):
+    pass
+
+
+class TestBatchEvaluationWithoutNumpy(BatchEvaluationChecks, unittest.TestCase):
+    """The same checks with numpy made unimportable."""
+
+    def setUp(self):
+        hide_numpy = patch.dict("sys.modules", {"numpy": None})
+        hide_numpy.start()
+        self.addCleanup(hide_numpy.stop)
+        super().setUp()
+
+    def test_fallback_returns_compact_arrays(self):
+        results = self.rules.determine_results_batch(self.moves_1, self.moves_2)
+        self.assertEqual(results.typecode, "b")
+        self.assertEqual(self.rules.outcome_table.result_matrix()[0], [0, -1, 1])
@@ -0,0 +1,132 @@
+import random
+import tracemalloc
+import unittest
+from unittest.mock import Mock
+
+from src.constants import GameConstants
+from src.game_utils.score_manager import (StandardScoreManager, StreakScoreManager,
+                                          CompactStandardScoreManager, CompactStreakScoreManager)
+from src.game_utils.score_manager_factory import ScoreManagerFactory
+
+
+class TestCompactScoreManager(unittest.TestCase):
+
+    def test_instances_have_no_dict(self):
+        for manager_class in (CompactStandardScoreManager, CompactStreakScoreManager):
+            score_manager = manager_class(Mock(), "Player 1", "Player 2")
+            self.assertFalse(hasattr(score_manager, "__dict__"))
+
+    def test_matches_dict_backed_managers_for_two_players(self):
+        pairs = ((StandardScoreManager, CompactStandardScoreManager),
+                 (StreakScoreManager, CompactStreakScoreManager))
+        rng = random.Random(7)
+        results = [rng.choice((-1, 0, 1)) for _ in range(500)]
+        for manager_class, compact_class in pairs:
+            expected = manager_class(Mock(), "Player 1", "Player 2")
+            compact = compact_class(Mock(), "Player 1", "Player 2")
+            for result in results:
+                expected.update_scores_for_round(result)
+                compact.update_scores_for_round(result)
+            for name in ("Player 1", "Player 2"):
+                self.assertEqual(compact.get_player_score(name), expected.get_player_score(name))
+
+    def test_pairings_between_any_players(self):
+        score_manager = CompactStandardScoreManager(Mock(), "Ann", "Bob", "Cat", "Dan")
+        cat = score_manager.get_player_slot("Cat")
+        dan = score_manager.get_player_slot("Dan")
+        score_manager.update_scores_for_pairing(cat, dan, 1)
+        score_manager.update_scores_for_pairing(0, cat, 0)
+        self.assertEqual(score_manager.get_player_count(), 4)
+        self.assertEqual(score_manager.get_player_score("Cat"), 1.5)
+        self.assertEqual(score_manager.get_player_score("Ann"), 0.5)
+        self.assertEqual(score_manager.get_player_score("Dan"), 0)
+        self.assertEqual(score_manager.get_player_score("Nobody"), 0)
+
+    def test_streak_resets_per_player(self):
+        score_manager = CompactStreakScoreManager(Mock(), "Ann", "Bob", "Cat")
+        for _ in range(3):
+            score_manager.update_scores_for_pairing(0, 2, 1)
+        score_manager.update_scores_for_pairing(1, 0, 1)
+        score_manager.update_scores_for_pairing(2, 0, -1)
+        self.assertEqual(score_manager.get_player_score("Ann"), 7)
+        self.assertEqual(score_manager.get_player_score("Bob"), 1)
+
+    def test_game_result_and_leaderboard(self):
+        game = Mock()
+        score_manager = CompactStreakScoreManager(game, "Ann", "Bob", "Cat")
+        score_manager.update_scores_for_pairing(2, 1, 1)
+        score_manager.return_game_result()
+        game.output_provider.output_game_winner.assert_called_with("Cat", 1, 0)
+        score_manager.return_leaderboard()
+        game.output_provider.output_scores_table.assert_called_with({
+            "Ann (streak: 0)": 0, "Bob (streak: 0)": 0, "Cat (streak: 1)": 1
+        })
+
+    def test_unscored_players_show_zero_like_dict_backed_manager(self):
+        expected_game, compact_game = Mock(), Mock()
+        expected = StandardScoreManager(expected_game, "Ann", "Bob")
+        compact = CompactStandardScoreManager(compact_game, "Ann", "Bob")
+        for score_manager in (expected, compact):
+            score_manager.update_scores_for_round(1)
+            score_manager.return_leaderboard()
+        expected_table = expected_game.output_provider.output_scores_table.call_args[0][0]
+        compact_table = compact_game.output_provider.output_scores_table.call_args[0][0]
+        self.assertEqual(compact_table, expected_table)
+        self.assertEqual(str(compact_table["Bob"]), "0")
+
+    def test_duplicate_names_rejected(self):
+        with self.assertRaisesRegex(ValueError, "must be unique"):
+            CompactStandardScoreManager(Mock(), "Ann", "Bob", "Ann")
+
+    def test_large_leagues_look_names_up_by_index(self):
+        names = [f"Player {number}" for number in range(CompactStandardScoreManager.INDEXED_PLAYER_COUNT + 4)]
+        score_manager = CompactStandardScoreManager(Mock(), *names)
+        score_manager.update_scores_for_pairing(score_manager.get_player_slot(names[-1]), 0, 1)
+        self.assertEqual(score_manager.get_player_score(names[-1]), 1)
+        self.assertEqual(score_manager.get_player_score("Nobody"), 0)
+        with self.assertRaises(KeyError):
+            score_manager.get_player_slot("Nobody")
+
+    def test_state_round_trips_and_rejects_other_player_counts(self):
+        score_manager = CompactStreakScoreManager(Mock(), "Ann", "Bob", "Cat")
+        score_manager.update_scores_for_pairing(0, 2, 1)
+        score_manager.update_scores_for_pairing(0, 1, 1)
+        restored = CompactStreakScoreManager(Mock(), "Ann", "Bob", "Cat")
+        restored.restore_state(tuple(float(value) for value in score_manager.export_state()))
+        self.assertEqual(restored.export_state(), score_manager.export_state())
+        self.assertEqual(restored.get_player_score("Ann"), 3)
+        with self.assertRaises(ValueError):
+            CompactStreakScoreManager(Mock(), "Ann", "Bob").restore_state(score_manager.export_state())
+
+    def test_two_player_instances_are_smaller_than_dict_backed_ones(self):
+        pairs = ((GameConstants.SCORE_MANAGER_STANDARD, GameConstants.SCORE_MANAGER_COMPACT_STANDARD),
+                 (GameConstants.SCORE_MANAGER_STREAK, GameConstants.SCORE_MANAGER_COMPACT_STREAK))
+        for manager_type, compact_type in pairs:
+            self.assertLess(self._instance_size(compact_type), self._instance_size(manager_type))
+
+    @staticmethod
+    def _instance_size(manager_type, count=1000):
+        """Average bytes allocated for each manager, with names built at run time as a game does."""
+        names = [(f"Player {number}", f"Player {number + 1}") for number in range(count)]
+        managers = [None] * count
+        ScoreManagerFactory.create_score_manager(manager_type, None, "Ann", "Bob")
+        tracemalloc.start()
+        try:
+            for number, (player_1_name, player_2_name) in enumerate(names):
+                managers[number] = ScoreManagerFactory.create_score_manager(
+                    manager_type, None, player_1_name, player_2_name
+                )
+            return tracemalloc.get_traced_memory()[0] / count
+        finally:
+            tracemalloc.stop()
+
+    def test_factory_creates_compact_managers(self):
+        score_manager = ScoreManagerFactory.create_score_manager(
+            GameConstants.SCORE_MANAGER_COMPACT_STANDARD, Mock(), "Ann", "Bob", "Cat"
+        )
+        self.assertIsInstance(score_manager, CompactStandardScoreManager)
+        self.assertEqual(score_manager.get_player_count(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from enum import Enum
+
+from src.constants import ScoringConstants
+from src.game_utils.outcome_table import OutcomeTable
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+
+
+class Lizard(Enum):
+    ROCK = "Rock"
+    PAPER = "Paper"
+    SCISSORS = "Scissors"
+    LIZARD = "Lizard"
+    SPOCK = "Spock"
+
+    def __str__(self):
+        return self.value
+
+
+RPSLS_RULES = {
+    Lizard.ROCK: {Lizard.SCISSORS: "crushes", Lizard.LIZARD: "crushes"},
+    Lizard.PAPER: {Lizard.ROCK: "covers", Lizard.SPOCK: "disproves"},
+    Lizard.SCISSORS: {Lizard.PAPER: "cuts", Lizard.LIZARD: "decapitates"},
+    Lizard.LIZARD: {Lizard.SPOCK: "poisons", Lizard.PAPER: "eats"},
+    Lizard.SPOCK: {Lizard.SCISSORS: "smashes", Lizard.ROCK: "vaporizes"},
+}
+
+
+class TestRPSRules(unittest.TestCase):
+
+    def test_determine_result(self):
+        rules = RPSRules()
+        self.assertEqual(rules.determine_result(RPSMove.ROCK, RPSMove.SCISSORS), ScoringConstants.PLAYER_1_WIN)
+        self.assertEqual(rules.determine_result(RPSMove.PAPER, RPSMove.ROCK), ScoringConstants.PLAYER_1_WIN)
+        self.assertEqual(rules.determine_result(RPSMove.PAPER, RPSMove.SCISSORS), ScoringConstants.PLAYER_2_WIN)
+        self.assertEqual(rules.determine_result(RPSMove.ROCK, RPSMove.ROCK), ScoringConstants.DRAW)
+
+    def test_get_interaction_description(self):
+        rules = RPSRules()
+        self.assertEqual(rules.get_interaction_description(RPSMove.ROCK, RPSMove.SCISSORS), "Rock blunts Scissors")
+        self.assertEqual(rules.get_interaction_description(RPSMove.ROCK, RPSMove.PAPER), "Paper wraps Rock")
+        self.assertEqual(rules.get_interaction_description(RPSMove.SCISSORS, RPSMove.PAPER), "Scissors cuts Paper")
+        self.assertEqual(rules.get_interaction_description(RPSMove.PAPER, RPSMove.PAPER), "Paper vs Paper is a draw")
+
+
+class TestOutcomeTable(unittest.TestCase):
+
+    def test_rpsls_table_is_antisymmetric(self):
+        table = OutcomeTable(list(Lizard), RPSLS_RULES)
+        for move_1 in Lizard:
+            for move_2 in Lizard:
+                self.assertEqual(table.result(move_1, move_2), -table.result(move_2, move_1))
+        self.assertEqual(table.description(Lizard.SPOCK, Lizard.LIZARD), "Lizard poisons Spock")
+
+    def test_undefined_pair_raises(self):
+        table = OutcomeTable(list(Lizard), {Lizard.ROCK: {Lizard.SCISSORS: "crushes"}})
+        self.assertEqual(table.result(Lizard.SCISSORS, Lizard.ROCK), ScoringConstants.PLAYER_2_WIN)
+        with self.assertRaises(ValueError):
+            table.result(Lizard.PAPER, Lizard.SPOCK)
+        self.assertEqual(table.description(Lizard.PAPER, Lizard.SPOCK),
+                         "No description available for Paper vs Spock")
+
+    def test_conflicting_rules_rejected(self):
+        with self.assertRaises(ValueError):
+            OutcomeTable(list(Lizard), {
+                Lizard.ROCK: {Lizard.PAPER: "crushes"},
+                Lizard.PAPER: {Lizard.ROCK: "covers"},
+            })
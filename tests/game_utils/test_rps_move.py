@@ -0,0 +1,36 @@
+import unittest
+
+from src.games.rps.rps_move import RPSMove
+
+
+class TestRPSMove(unittest.TestCase):
+
+    def test_get_move_by_value(self):
+        self.assertIs(RPSMove.get_move_by_value(1), RPSMove.ROCK)
+        self.assertIs(RPSMove.get_move_by_value(3), RPSMove.SCISSORS)
+        with self.assertRaises(ValueError):
+            RPSMove.get_move_by_value(4)
+        with self.assertRaises(ValueError):
+            RPSMove.get_move_by_value("1")
+
+    def test_get_move_by_name(self):
+        self.assertIs(RPSMove.get_move_by_name("paper"), RPSMove.PAPER)
+        self.assertIs(RPSMove.get_move_by_name("Scissors"), RPSMove.SCISSORS)
+        with self.assertRaises(ValueError):
+            RPSMove.get_move_by_name("lizard")
+
+    def test_validate_value(self):
+        self.assertTrue(RPSMove.validate_value(2))
+        self.assertFalse(RPSMove.validate_value(0))
+        self.assertFalse(RPSMove.validate_value("2"))
+        self.assertFalse(RPSMove.validate_value([2]))
+
+    def test_identity_equality(self):
+        self.assertEqual(RPSMove.ROCK, RPSMove.get_move_by_value(1))
+        self.assertNotEqual(RPSMove.ROCK, RPSMove.PAPER)
+        self.assertNotEqual(RPSMove.ROCK, 1)
+        self.assertEqual(len({RPSMove.ROCK, RPSMove.get_move_by_name("rock")}), 1)
+
+    def test_formatted_choices(self):
+        self.assertEqual(RPSMove.get_formatted_choices(), ["1 = Rock", "2 = Paper", "3 = Scissors"])
+        self.assertEqual(RPSMove.get_all_moves(), [RPSMove.ROCK, RPSMove.PAPER, RPSMove.SCISSORS])
@@ -0,0 +1,77 @@
+import os
+import signal
+import threading
+import time
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from src.io_utils.console_reader import ConsoleLineReader
+from src.io_utils.input_provider_console import InputProviderConsole
+from src.constants import GameMessages
+
+BLITZ_TIME_LIMIT = 0.25
+
+
+@unittest.skipIf(os.name == "nt", "select() only accepts sockets on Windows")
+class TestConsoleLineReader(unittest.TestCase):
+
+    def setUp(self):
+        read_fd, self.write_fd = os.pipe()
+        self.input_stream = os.fdopen(read_fd, "r")
+        self.reader = ConsoleLineReader.for_stream(self.input_stream)
+
+    def tearDown(self):
+        self.reader.close()
+        self.input_stream.close()
+        if self.write_fd is not None:
+            os.close(self.write_fd)
+
+    def _type(self, text):
+        os.write(self.write_fd, text.encode())
+
+    def test_lines_typed_ahead_are_kept(self):
+        self._type("1 3\r\n2\npartial")
+        self.assertEqual(self.reader.readline(), "1 3")
+        self.assertEqual(self.reader.readline(0), "2")
+        self.assertIsNone(self.reader.readline(0))
+        os.close(self.write_fd)
+        self.write_fd = None
+        self.assertEqual(self.reader.readline(), "partial")
+        with self.assertRaises(EOFError):
+            self.reader.readline()
+
+    def test_fractional_time_limit(self):
+        start = time.monotonic()
+        self.assertIsNone(self.reader.readline(BLITZ_TIME_LIMIT))
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, BLITZ_TIME_LIMIT)
+
+    def test_line_arriving_within_the_limit_is_returned(self):
+        threading.Timer(0.05, self._type, ("2\n",)).start()
+        self.assertEqual(self.reader.readline(BLITZ_TIME_LIMIT), "2")
+
+    def test_input_available_never_waits(self):
+        self.assertFalse(self.reader.input_available())
+        self._type("1")
+        self.assertFalse(self.reader.input_available())
+        self._type("\n")
+        self.assertTrue(self.reader.input_available())
+
+    def test_streams_without_a_descriptor_are_not_supported(self):
+        self.assertIsNone(ConsoleLineReader.for_stream(StringIO()))
+
+    def test_timed_move_request_installs_no_signal_handler(self):
+        provider = InputProviderConsole(input_stream=self.input_stream)
+        handler = signal.getsignal(signal.SIGALRM)
+        with patch("sys.stdout", new=StringIO()) as console_out:
+            self.assertEqual(provider.player_rps_request(1, "1 = Rock", BLITZ_TIME_LIMIT), "")
+            self._type(" 3 \n")
+            self.assertTrue(provider.input_available())
+            self.assertEqual(provider.player_rps_request(1, "1 = Rock", BLITZ_TIME_LIMIT), "3")
+        self.assertIs(signal.getsignal(signal.SIGALRM), handler)
+        self.assertIn(GameMessages.TIMEOUT_MESSAGE, console_out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.games.rps.rps_game import RPSGame
+from src.io_utils.input_provider_scripted import InputProviderScripted, session_script
+from src.io_utils.output_provider import OutputProvider
+from src.constants import ScriptedInputConstants
+
+
+class TestInputProviderScripted(unittest.TestCase):
+
+    def test_answers_are_used_in_prompt_order(self):
+        provider = InputProviderScripted(["1", " Alice ", "3", "5 "])
+        self.assertEqual(provider.game_mode_request(), "1")
+        self.assertEqual(provider.player_name_request(1), "Alice")
+        self.assertEqual(provider.game_option_request(99), "3")
+        self.assertEqual(provider.rounds_of_game_request(99), "5")
+        with self.assertRaises(EOFError):
+            provider.play_again_request()
+        self.assertEqual(provider.answers_used, 4)
+
+    def test_timeout_token_times_out_a_move(self):
+        provider = InputProviderScripted([ScriptedInputConstants.TIMEOUT_TOKEN, "2"])
+        self.assertEqual(provider.player_rps_request(1, "choices", 10), "")
+        self.assertEqual(provider.player_rps_request(1, "choices", 10), "2")
+
+    def test_script_is_read_ahead_in_chunks(self):
+        produced = []
+
+        def answers():
+            for number in range(10):
+                produced.append(number)
+                yield str(number)
+
+        provider = InputProviderScripted(answers(), read_ahead=4)
+        self.assertEqual(provider.game_mode_request(), "0")
+        self.assertEqual(len(produced), 4)
+        self.assertEqual(provider.remaining_buffered(), ["1", "2", "3"])
+        for _ in range(4):
+            provider.play_again_request()
+        self.assertEqual(len(produced), 8)
+
+    def test_from_file_streams_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "script.txt")
+            with open(path, "w") as script_file:
+                script_file.write("1\nAlice\n\n")
+            provider = InputProviderScripted.from_file(path)
+            self.assertEqual([provider.game_mode_request(), provider.player_name_request(1),
+                              provider.player_name_request(1)], ["1", "Alice", ""])
+            with self.assertRaises(EOFError):
+                provider.play_again_request()
+
+    def test_full_game_goes_through_validation(self):
+        script = ["0", "1", "", "Alice", "abc", "3", "9", "1", ScriptedInputConstants.TIMEOUT_TOKEN, "2", "n"]
+        input_provider = InputProviderScripted(script)
+        output_provider = Mock(spec=OutputProvider)
+        RPSGame(input_provider, output_provider).start_game()
+
+        self.assertEqual(input_provider.answers_used, len(script))
+        output_provider.output_game_mode_error.assert_called_once()
+        output_provider.output_name_error.assert_called_once()
+        output_provider.output_rounds_error.assert_called_once()
+        output_provider.output_gesture_error.assert_called_once()
+        output_provider.output_player_timeout.assert_called_once()
+        self.assertEqual(output_provider.output_scores_table.call_count, 3)
+        output_provider.output_end_game.assert_called_once()
+
+    def test_session_script(self):
+        self.assertEqual(session_script("1", "Alice", "2", ["1", "3"]), ["1", "Alice", "2", "1", "3", "n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
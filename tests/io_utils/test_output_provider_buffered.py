@@ -0,0 +1,77 @@
+import os
+import unittest
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from src.io_utils.input_provider_console import InputProviderConsole
+from src.io_utils.output_provider_buffered import FlushPolicy, OutputProviderBuffered
+from src.io_utils.output_provider_console import OutputProviderConsole
+
+
+class CountingStream(StringIO):
+    """StringIO that counts how many times it is written to."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def play_round(output_provider, round_number):
+    player_1 = Mock()
+    player_2 = Mock()
+    player_1.get_name.return_value = "Alice"
+    player_2.get_name.return_value = "Computer 2"
+    output_provider.output_round_number(round_number, 3)
+    output_provider.output_round_moves(player_1, player_2, "Rock", "Paper")
+    output_provider.output_round_description("Paper wraps Rock")
+    output_provider.output_scores_table({"Alice": 0, "Computer 2": round_number})
+
+
+class TestOutputProviderBuffered(unittest.TestCase):
+
+    def test_output_matches_console_provider(self):
+        stream = StringIO()
+        buffered = OutputProviderBuffered(stream=stream)
+        with patch('sys.stdout', new=StringIO()) as console_out:
+            for round_number in range(1, 4):
+                play_round(OutputProviderConsole(), round_number)
+        for round_number in range(1, 4):
+            play_round(buffered, round_number)
+        self.assertEqual(stream.getvalue(), console_out.getvalue())
+
+    def test_per_round_policy_writes_once_per_round(self):
+        stream = CountingStream()
+        buffered = OutputProviderBuffered(FlushPolicy.PER_ROUND, stream=stream)
+        for round_number in range(1, 4):
+            play_round(buffered, round_number)
+        self.assertEqual(stream.writes, 3)
+
+    def test_every_n_rounds_policy(self):
+        stream = CountingStream()
+        buffered = OutputProviderBuffered(FlushPolicy.EVERY_N_ROUNDS, flush_every=2, stream=stream)
+        for round_number in range(1, 4):
+            play_round(buffered, round_number)
+        self.assertEqual(stream.writes, 1)
+        buffered.output_end_game()
+        self.assertEqual(stream.writes, 2)
+        self.assertTrue(stream.getvalue().endswith("Game is ending\n"))
+
+    def test_on_input_policy_flushes_before_prompt(self):
+        stream = CountingStream()
+        buffered = OutputProviderBuffered(FlushPolicy.ON_INPUT, stream=stream)
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"n\n")
+        os.close(write_fd)
+        with os.fdopen(read_fd) as answers:
+            input_provider = InputProviderConsole(buffered, input_stream=answers)
+            for round_number in range(1, 4):
+                play_round(buffered, round_number)
+            self.assertEqual(stream.writes, 0)
+            with patch('sys.stdout', new=StringIO()):
+                self.assertEqual(input_provider.play_again_request(), "n")
+        self.assertEqual(stream.writes, 1)
+        self.assertIn("Round 3 of 3", stream.getvalue())
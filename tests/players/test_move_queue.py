@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import Mock
+
+from game import Game, GameExit
+from src.games.rps.rps_game import RPSGame
+from src.games.rps.rps_move import RPSMove
+from src.io_utils.input_provider_scripted import InputProviderScripted
+from src.io_utils.output_provider import OutputProvider
+from src.players.human_player import HumanPlayer
+from src.constants import GameConstants
+
+
+def make_player(*answers):
+    game = Mock()
+    game.EXIT_COMMAND = Game.EXIT_COMMAND
+    game.input_provider = InputProviderScripted(["Alice", *answers])
+    game.exit_game.side_effect = GameExit()
+    return HumanPlayer(game, 1), game
+
+
+class TestMoveQueue(unittest.TestCase):
+
+    def test_one_line_queues_moves_for_later_rounds(self):
+        player, game = make_player("1 3, 2")
+        self.assertEqual([player.make_move() for _ in range(3)], [RPSMove.ROCK, RPSMove.SCISSORS, RPSMove.PAPER])
+        self.assertEqual(game.input_provider.answers_used, 2)
+
+    def test_parsing_stops_at_the_first_invalid_move(self):
+        player, game = make_player("2 9 1", "3")
+        self.assertEqual([player.make_move(), player.make_move()], [RPSMove.PAPER, RPSMove.SCISSORS])
+        game.output_provider.output_gesture_error.assert_called_once()
+
+    def test_line_without_valid_moves_is_requested_again(self):
+        player, game = make_player("x 1", "1")
+        self.assertEqual(player.make_move(), RPSMove.ROCK)
+        self.assertEqual(game.input_provider.answers_used, 3)
+
+    def test_exit_command_is_played_in_turn(self):
+        player, game = make_player(f"1 {GameConstants.EXIT_COMMAND} 2")
+        self.assertEqual(player.make_move(), RPSMove.ROCK)
+        with self.assertRaises(GameExit):
+            player.make_move()
+        self.assertFalse(player._queued_moves)
+
+    def test_queue_is_cleared_when_a_session_begins(self):
+        player, game = make_player("1 2 3", "2")
+        player.make_move()
+        player.begin_session()
+        self.assertEqual(player.make_move(), RPSMove.PAPER)
+
+    def test_full_game_plays_queued_moves_without_prompting(self):
+        input_provider = InputProviderScripted(["1", "Alice", "5", "1 2 3 1 2", "n"])
+        output_provider = Mock(spec=OutputProvider)
+        RPSGame(input_provider, output_provider).start_game()
+        self.assertEqual(output_provider.output_round_moves.call_count, 5)
+        self.assertEqual(input_provider.answers_used, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
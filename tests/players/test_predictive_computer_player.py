@@ -0,0 +1,50 @@
+import itertools
+import unittest
+from unittest.mock import Mock
+
+from src.core.headless_simulator import HeadlessSimulator
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.players.computer_player import ComputerPlayer
+from src.players.predictive_computer_player import PredictiveComputerPlayer
+
+
+class CyclingPlayer(ComputerPlayer):
+    """Plays Rock, Paper, Scissors, Rock, ... in order."""
+
+    def __init__(self, game, player_id):
+        super().__init__(game, player_id)
+        self._cycle = itertools.cycle([RPSMove.ROCK, RPSMove.PAPER, RPSMove.SCISSORS])
+
+    def make_move(self):
+        return next(self._cycle)
+
+
+class TestPredictiveComputerPlayer(unittest.TestCase):
+
+    def test_counters_most_frequent_move(self):
+        player = PredictiveComputerPlayer(Mock(), 1)
+        player.observe_round(RPSMove.PAPER, RPSMove.ROCK)
+        self.assertEqual(player.make_move(), RPSMove.PAPER)
+
+    def test_learns_transitions(self):
+        player = PredictiveComputerPlayer(Mock(), 1, order=1)
+        for opponent_move in [RPSMove.ROCK, RPSMove.SCISSORS] * 3:
+            player.observe_round(RPSMove.ROCK, opponent_move)
+        # Opponent last played Scissors, which has always been followed by Rock
+        self.assertEqual(player.make_move(), RPSMove.PAPER)
+
+    def test_beats_cycling_opponent(self):
+        result = HeadlessSimulator(RPSRules()).simulate_rounds(
+            1000, PredictiveComputerPlayer(Mock(), 1), CyclingPlayer(Mock(), 2)
+        )
+        self.assertGreater(result.player_1_wins, 990)
+
+    def test_memory_is_bounded(self):
+        player = PredictiveComputerPlayer(Mock(), 1, order=3)
+        table_size = len(player._transition_counts)
+        opponent = CyclingPlayer(Mock(), 2)
+        for _ in range(5000):
+            player.observe_round(player.make_move(), opponent.make_move())
+        self.assertEqual(len(player._transition_counts), table_size)
+        self.assertEqual(table_size, 3 ** 4)
@@ -0,0 +1,37 @@
+import importlib.util
+import unittest
+from unittest.mock import Mock
+
+from src.games.rps.rps_move import RPSMove
+from src.players.computer_player import ComputerPlayer
+from src.players.random_move_source import RandomMoveSource
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class TestRandomMoveSource(unittest.TestCase):
+
+    def test_same_seed_gives_same_stream_across_blocks(self):
+        source_1 = RandomMoveSource(RPSMove.get_all_moves(), seed=99, block_size=7)
+        source_2 = RandomMoveSource(RPSMove.get_all_moves(), seed=99, block_size=7)
+        moves_1 = [source_1.next_move() for _ in range(50)]
+        moves_2 = [source_2.next_move() for _ in range(50)]
+        self.assertEqual(moves_1, moves_2)
+        self.assertEqual(set(moves_1), set(RPSMove.get_all_moves()))
+
+    def test_players_have_independent_streams(self):
+        player_1 = ComputerPlayer(Mock(), 1, seed=1)
+        player_2 = ComputerPlayer(Mock(), 2, seed=1)
+        other = ComputerPlayer(Mock(), 3, seed=2)
+        moves_1 = [player_1.make_move() for _ in range(100)]
+        # Drawing from one player does not advance another's stream
+        self.assertEqual([player_2.make_move() for _ in range(100)], moves_1)
+        self.assertNotEqual([other.make_move() for _ in range(100)], moves_1)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is required for numpy move generation")
+    def test_numpy_generator(self):
+        source_1 = RandomMoveSource(RPSMove.get_all_moves(), seed=5, block_size=16, use_numpy=True)
+        source_2 = RandomMoveSource(RPSMove.get_all_moves(), seed=5, block_size=16, use_numpy=True)
+        moves = [source_1.next_move() for _ in range(100)]
+        self.assertEqual([source_2.next_move() for _ in range(100)], moves)
+        self.assertTrue(all(isinstance(move, RPSMove) for move in moves))
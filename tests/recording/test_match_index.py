@@ -0,0 +1,149 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.constants import GameConstants
+from src.games.rps.rps_move import RPSMove
+from src.game_utils.score_manager import ScoreManager, StreakScoreManager
+from src.recording.match_index import MatchLogIndex
+from src.recording.match_log import (MatchLogReader, MatchRecorder,
+                                     HEADER_SIZE, RECORD_SIZE, RECORD_STRUCT)
+
+
+class NoSnapshotScoreManager(ScoreManager):
+    """Score manager that plays games but cannot export its state."""
+
+    def return_leaderboard(self): pass
+    def update_scores_for_round(self, round_result): pass
+    def return_game_result(self): pass
+    def get_player_score(self, player_name): return 0
+
+
+class TestMatchLogIndex(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, "matches.rpslog")
+        self.rng = random.Random(11)
+
+    def tearDown(self):
+        for path in (self.path, MatchLogIndex.default_path(self.path)):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(os.path.dirname(self.path))
+
+    def _record(self, recorder, rounds):
+        results = [self.rng.choice((-1, 0, 1)) for _ in range(rounds)]
+        for result in results:
+            recorder.record_round(RPSMove.ROCK, RPSMove.PAPER, result)
+        return results
+
+    def test_locates_rounds_across_sessions(self):
+        with MatchRecorder(self.path) as recorder:
+            self._record(recorder, 250)
+            recorder.start_session(7)
+            self._record(recorder, 100)
+
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.build(reader, interval=32)
+            self.assertLess(len(index), 20)
+            self.assertEqual(index.locate(1, 1), 0)
+            self.assertEqual(index.locate(1, 250), 249)
+            self.assertEqual(index.locate(7, 40), 289)
+            self.assertEqual(index.offset(7, 40), HEADER_SIZE + 289 * RECORD_SIZE)
+            record = index.seek(reader, 7, 100)
+            self.assertEqual((record.session_id, record.round_number), (7, 100))
+            for missing in ((1, 251), (1, 0), (2, 1), (7, 101)):
+                with self.assertRaises(KeyError):
+                    index.locate(*missing)
+
+    def test_interleaved_sessions_are_located(self):
+        # Two sessions written alternately in runs of 10 rounds, as concurrent games would be
+        with MatchRecorder(self.path):
+            pass
+        with open(self.path, "ab") as log_file:
+            for run in range(5):
+                for session_id in (1, 2):
+                    for round_number in range(run * 10 + 1, run * 10 + 11):
+                        log_file.write(RECORD_STRUCT.pack(session_id, round_number, 1, 2, -1, 0))
+
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.build(reader, interval=4)
+            for session_id in (1, 2):
+                for round_number in range(1, 51):
+                    record = index.seek(reader, session_id, round_number)
+                    self.assertEqual((record.session_id, record.round_number), (session_id, round_number))
+
+    def test_rounds_missing_from_a_session_are_not_located(self):
+        with MatchRecorder(self.path):
+            pass
+        with open(self.path, "ab") as log_file:
+            for round_number in (1, 2, 3, 5, 6, 9):
+                log_file.write(RECORD_STRUCT.pack(1, round_number, 1, 2, -1, 0))
+
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.build(reader, interval=4)
+            for round_number in (1, 2, 3, 5, 6, 9):
+                self.assertEqual(index.seek(reader, 1, round_number).round_number, round_number)
+            for round_number in (4, 7, 8, 10):
+                with self.assertRaises(KeyError):
+                    index.locate(1, round_number)
+                with self.assertRaises(KeyError):
+                    index.score_manager_at(reader, 1, round_number)
+
+    def test_score_manager_at_matches_full_replay(self):
+        with MatchRecorder(self.path) as recorder:
+            recorder.start_session(3)
+            results = self._record(recorder, 1000)
+
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.build(reader, GameConstants.SCORE_MANAGER_STREAK, interval=64)
+            for round_number in (1, 63, 64, 65, 500, 1000):
+                expected = StreakScoreManager(None, "Ann", "Bob")
+                for result in results[:round_number]:
+                    expected.update_scores_for_round(result)
+                rebuilt = index.score_manager_at(reader, 3, round_number,
+                                                 player_1_name="Ann", player_2_name="Bob")
+                self.assertIsInstance(rebuilt, StreakScoreManager)
+                self.assertEqual(rebuilt.export_state(), expected.export_state())
+
+    def test_sidecar_is_saved_and_rebuilt_when_stale(self):
+        with MatchRecorder(self.path) as recorder:
+            self._record(recorder, 100)
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.load_or_build(reader)
+        self.assertTrue(os.path.exists(MatchLogIndex.default_path(self.path)))
+
+        loaded = MatchLogIndex.load(MatchLogIndex.default_path(self.path))
+        self.assertEqual(loaded._entries, index._entries)
+        self.assertEqual(loaded.score_manager_type, GameConstants.SCORE_MANAGER_STANDARD)
+
+        with MatchRecorder(self.path) as recorder:
+            self._record(recorder, 10)
+        with MatchLogReader(self.path) as reader:
+            index = MatchLogIndex.load_or_build(reader)
+            self.assertEqual(index.record_count, 110)
+            self.assertEqual(index.locate(2, 10), 109)
+
+    def test_load_rejects_other_files(self):
+        with open(self.path, "wb") as other_file:
+            other_file.write(b"definitely not an index")
+        with self.assertRaises(ValueError):
+            MatchLogIndex.load(self.path)
+
+    def test_managers_without_snapshots_are_rejected(self):
+        with MatchRecorder(self.path) as recorder:
+            self._record(recorder, 10)
+        self.assertFalse(NoSnapshotScoreManager.supports_snapshots())
+        with self.assertRaises(NotImplementedError):
+            NoSnapshotScoreManager().export_state()
+        with MatchLogReader(self.path) as reader:
+            with patch.object(MatchLogIndex, "_create_score_manager", return_value=NoSnapshotScoreManager()):
+                with self.assertRaises(ValueError):
+                    MatchLogIndex.build(reader, "no_snapshots")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.constants import RecordingConstants
+from src.core.game_flow_manager import GameFlowManager
+from src.games.rps.rps_move import RPSMove
+from src.games.rps.rps_rules import RPSRules
+from src.game_utils.score_manager import StandardScoreManager
+from src.players.computer_player import ComputerPlayer
+from src.recording.match_log import (MatchLogReader, MatchRecord, MatchRecorder,
+                                     HEADER_SIZE, RECORD_SIZE)
+
+
+class TestMatchLog(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".rpslog")
+        os.close(handle)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_records_are_fixed_width_and_round_trip(self):
+        with MatchRecorder(self.path) as recorder:
+            recorder.record_round(RPSMove.ROCK, RPSMove.SCISSORS, 1)
+            recorder.record_round(None, RPSMove.PAPER, -1)
+
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 2 * RECORD_SIZE)
+        with MatchLogReader(self.path) as reader:
+            self.assertEqual(list(reader), [
+                MatchRecord(1, 1, RPSMove.ROCK.get_value(), RPSMove.SCISSORS.get_value(), 1, 0),
+                MatchRecord(1, 2, RecordingConstants.NO_MOVE_CODE, RPSMove.PAPER.get_value(), -1, 1),
+            ])
+            self.assertIs(RPSMove.get_move_by_value(reader[0].move_2), RPSMove.SCISSORS)
+
+    def test_reopening_continues_after_last_session(self):
+        with MatchRecorder(self.path) as recorder:
+            recorder.start_session(41)
+            recorder.record_round(RPSMove.ROCK, RPSMove.ROCK, 0)
+        with MatchRecorder(self.path) as recorder:
+            self.assertEqual(recorder.start_session(), 42)
+
+    def test_partial_trailing_record_is_ignored(self):
+        with MatchRecorder(self.path) as recorder:
+            recorder.record_round(RPSMove.ROCK, RPSMove.PAPER, -1)
+        with open(self.path, "ab") as log_file:
+            log_file.write(b"\x01\x02\x03")
+        with MatchLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 1)
+        with MatchRecorder(self.path) as recorder:
+            recorder.record_round(RPSMove.PAPER, RPSMove.ROCK, 1)
+        with MatchLogReader(self.path) as reader:
+            self.assertEqual([record.result for record in reader], [-1, 1])
+
+    def test_rejects_files_that_are_not_match_logs(self):
+        with open(self.path, "wb") as log_file:
+            log_file.write(b"not a match log")
+        with self.assertRaises(ValueError):
+            MatchLogReader(self.path)
+        with self.assertRaises(ValueError):
+            MatchRecorder(self.path)
+
+    def test_game_flow_records_each_game_as_a_session(self):
+        rules = RPSRules()
+        player_1 = ComputerPlayer(Mock(), 1, seed=3)
+        player_2 = ComputerPlayer(Mock(), 2, seed=4)
+        with MatchRecorder(self.path) as recorder:
+            flow = GameFlowManager(rules, Mock(), recorder)
+            first = StandardScoreManager(Mock(), player_1.get_name(), player_2.get_name())
+            flow.play_standard_rounds(30, player_1, player_2, first)
+            second = StandardScoreManager(Mock(), player_1.get_name(), player_2.get_name())
+            flow.play_best_of_series(player_1, player_2, second)
+
+        with MatchLogReader(self.path) as reader:
+            self.assertEqual([record.round_number for record in reader.session(1)], list(range(1, 31)))
+            for record in reader:
+                move_1 = RPSMove.get_move_by_value(record.move_1)
+                move_2 = RPSMove.get_move_by_value(record.move_2)
+                self.assertEqual(record.result, rules.determine_result(move_1, move_2))
+
+            replayed = StandardScoreManager(Mock(), player_1.get_name(), player_2.get_name())
+            self.assertEqual(reader.replay(replayed, session_id=2), len(list(reader.session(2))))
+            self.assertEqual(replayed._scores, second._scores)
+
+    def test_scans_match_decoded_records(self):
+        rng = random.Random(5)
+        moves = RPSMove.get_all_moves()
+        with MatchRecorder(self.path) as recorder:
+            for _ in range(2000):
+                move_1 = rng.choice(moves + [None])
+                move_2 = rng.choice(moves)
+                recorder.record_round(move_1, move_2, rng.choice((-1, 0, 1)))
+
+        with MatchLogReader(self.path) as reader:
+            records = list(reader)
+            expected = {result: sum(record.result == result for record in records) for result in (-1, 0, 1)}
+            self.assertEqual(reader.result_counts(), expected)
+            self.assertEqual(reader.timeout_count(), sum(record.timed_out for record in records))
+            self.assertEqual(list(reader.records(1990)), records[1990:])
+
+            scores = StandardScoreManager(Mock(), "Player 1", "Player 2")
+            self.assertEqual(reader.replay(scores), 2000)
+            self.assertEqual(scores.get_player_score("Player 1"),
+                             expected[1] + 0.5 * expected[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
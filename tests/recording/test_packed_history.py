@@ -0,0 +1,114 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.games.rps.rps_move import RPSMove
+from src.recording.packed_history import (PackedHistoryReader, PackedHistoryWriter,
+                                          pack_codes, unpack_rounds)
+
+
+def _random_rounds(count, seed=0):
+    rng = random.Random(seed)
+    moves = RPSMove.get_all_moves() + [None]
+    return [(rng.choice(moves), rng.choice(moves), rng.choice((-1, 0, 1))) for _ in range(count)]
+
+
+class TestPackedHistory(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".rpshist")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_four_rounds_pack_into_three_bytes(self):
+        codes = bytes([63, 0, 21, 42, 7])
+        packed = pack_codes(codes)
+        self.assertEqual(len(packed), 6)
+        self.assertEqual(pack_codes(codes[:4]), packed[:3])
+
+    def test_round_trip_across_blocks(self):
+        rounds = _random_rounds(1003)
+        with PackedHistoryWriter(self.path, block_rounds=100) as writer:
+            writer.extend(rounds[:500])
+            for round_ in rounds[500:]:
+                writer.append(*round_)
+
+        with PackedHistoryReader(self.path) as reader:
+            self.assertEqual(len(reader), 1003)
+            self.assertEqual(reader.block_count, 11)
+            self.assertEqual(reader.read(), rounds)
+            self.assertEqual(list(reader), rounds)
+
+    def test_range_reads_decode_only_overlapping_blocks(self):
+        rounds = _random_rounds(1000, seed=1)
+        with PackedHistoryWriter(self.path, block_rounds=100) as writer:
+            writer.extend(rounds)
+
+        with PackedHistoryReader(self.path) as reader:
+            decoded_blocks = []
+            original = reader._decode_block
+            reader._decode_block = lambda block: decoded_blocks.append(block) or original(block)
+            self.assertEqual(reader.read(250, 420), rounds[250:420])
+            self.assertEqual(decoded_blocks, [2, 3, 4])
+            self.assertEqual(reader.read(999, 5000), rounds[999:])
+            self.assertEqual(reader.read(10, 10), [])
+
+    def test_unpack_drops_padding(self):
+        rounds = _random_rounds(3, seed=2)
+        with PackedHistoryWriter(self.path) as writer:
+            writer.extend(rounds)
+        with PackedHistoryReader(self.path) as reader:
+            self.assertEqual(reader.read(), rounds)
+        self.assertEqual(unpack_rounds(pack_codes(bytes([21, 21])), 1), [
+            (RPSMove.ROCK, RPSMove.ROCK, 0)
+        ])
+
+    def test_invalid_rounds_and_files_are_rejected(self):
+        with PackedHistoryWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(RPSMove.ROCK, RPSMove.PAPER, 2)
+            with self.assertRaises(ValueError):
+                writer.append("Rock", RPSMove.PAPER, 1)
+        with open(self.path, "wb") as history_file:
+            history_file.write(b"not a history file at all")
+        with self.assertRaises(ValueError):
+            PackedHistoryReader(self.path)
+
+    def test_truncated_files_are_rejected_and_closed(self):
+        rounds = _random_rounds(300, seed=3)
+        with PackedHistoryWriter(self.path, block_rounds=100) as writer:
+            writer.extend(rounds)
+        with open(self.path, "rb") as history_file:
+            contents = history_file.read()
+
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            opened.append(real_open(*args, **kwargs))
+            return opened[-1]
+
+        for length in (0, 5, 12, 20, len(contents) - 1):
+            with open(self.path, "wb") as history_file:
+                history_file.write(contents[:length])
+            with patch("builtins.open", tracking_open):
+                with self.assertRaises(ValueError):
+                    PackedHistoryReader(self.path)
+            self.assertTrue(opened[-1].closed)
+
+    def test_negative_indices_count_from_the_end(self):
+        rounds = _random_rounds(250, seed=4)
+        with PackedHistoryWriter(self.path, block_rounds=100) as writer:
+            writer.extend(rounds)
+        with PackedHistoryReader(self.path) as reader:
+            self.assertEqual(reader.read(-10), rounds[-10:])
+            self.assertEqual(reader.read(-160, -40), rounds[-160:-40])
+            self.assertEqual(reader.read(-1000, 5), rounds[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
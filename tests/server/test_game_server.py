@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+
+from game import GameExit
+from src.games.rps.rps_game_async import AsyncRPSGame
+from src.server.game_server import GameServer
+
+
+async def play_session(port: int, lines: list[str]) -> str:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+    output = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return output.decode()
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = GameServer(port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_full_session_over_tcp(self):
+        output = await play_session(self.server.port, ["1", "Alice", "3", "1", "2", "3", "n"])
+
+        self.assertIn("We're playing Paper Scissors Rock!", output)
+        self.assertIn("Round 3 of 3", output)
+        self.assertIn("Alice", output)
+        self.assertTrue(output.rstrip().endswith("Game is ending"))
+
+    async def test_exit_command_ends_only_that_session(self):
+        output = await play_session(self.server.port, ["1", "Bob", "5", "e"])
+
+        self.assertIn("Game is ending", output)
+        self.assertNotIn("Round 2 of 5", output)
+        self.assertEqual(self.server.active_sessions, 0)
+
+    async def test_invalid_input_is_revalidated(self):
+        output = await play_session(self.server.port, ["9", "1", "Carol", "abc", "1", "7", "2", "n"])
+
+        self.assertIn("Invalid selection", output)
+        self.assertIn("Invalid input. Please enter a valid number between", output)
+        self.assertIn("Invalid input. Please enter a valid move number.", output)
+
+    async def test_many_concurrent_sessions(self):
+        sessions = [play_session(self.server.port, ["1", f"Player{i}", "bo5", "1", "2", "3", "1", "2", "n"])
+                    for i in range(200)]
+        outputs = await asyncio.gather(*sessions)
+
+        self.assertEqual(len(outputs), 200)
+        for output in outputs:
+            self.assertIn("Game is ending", output)
+        self.assertEqual(self.server.completed_sessions, 200)
+
+
+class WaitingPlayer:
+    """Remote player stand-in whose move request waits until it is cancelled."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def request_move(self):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class ExitingPlayer:
+    """Remote player stand-in that exits the game when asked for a move."""
+
+    async def request_move(self):
+        await asyncio.sleep(0)
+        raise GameExit()
+
+
+class TestRemoteMoveRequests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_exit_cancels_the_other_players_request(self):
+        waiting = WaitingPlayer()
+        with self.assertRaises(GameExit):
+            await AsyncRPSGame._request_moves_async([waiting, ExitingPlayer()])
+        self.assertTrue(waiting.cancelled)
@@ -0,0 +1,47 @@
+import unittest
+import urllib.error
+import urllib.request
+
+from src.core.metrics import GameMetrics
+from src.server.game_server import GameServer
+from src.server.metrics_server import MetricsServer
+from src.constants import MetricsConstants
+from tests.server.test_game_server import play_session
+
+
+class TestMetricsServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.metrics = GameMetrics()
+        self.metrics_server = MetricsServer(self.metrics.registry, port=0)
+        self.metrics_server.start()
+        self.server = GameServer(port=0, metrics=self.metrics)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        self.metrics_server.close()
+
+    def _scrape(self, path=MetricsConstants.PATH):
+        url = f"http://{self.metrics_server.host}:{self.metrics_server.port}{path}"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.headers["Content-Type"], response.read().decode()
+
+    async def test_sessions_are_exposed_to_prometheus(self):
+        await play_session(self.server.port, ["1", "Alice", "2", "x", "1", "2", "n"])
+
+        content_type, body = self._scrape()
+        self.assertEqual(content_type, MetricsConstants.CONTENT_TYPE)
+        self.assertIn("rps_sessions_started_total 1", body)
+        self.assertIn("rps_sessions_finished_total 1", body)
+        self.assertIn("rps_invalid_moves_total 1", body)
+        self.assertIn('rps_round_duration_seconds_bucket{le="+Inf"} 2', body)
+
+    async def test_other_paths_are_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            self._scrape("/")
+        self.assertEqual(raised.exception.code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()